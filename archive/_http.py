@@ -0,0 +1,42 @@
+"""
+Shared HTTP session for the archive test scripts
+
+One pooled session per process, so scripts that fetch several pages (or
+build several scrapers) reuse TCP/TLS connections instead of opening new
+ones. Successful GETs are cached on disk for a day, so re-running a
+script reads pages locally instead of fetching them again; delete the
+.http_cache*.sqlite files next to this module to force fresh fetches.
+"""
+
+import os
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+CACHE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_EXPIRE_AFTER = 86400  # seconds
+
+SESSION = CachedSession(
+    os.path.join(CACHE_DIR, '.http_cache'),
+    expire_after=CACHE_EXPIRE_AFTER,
+    allowable_codes=(200,),
+    allowable_methods=('GET',)
+)
+
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5)
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+})
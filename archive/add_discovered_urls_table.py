@@ -14,13 +14,14 @@ def add_discovered_urls_table():
     
     db = DatabaseConnection()
     
-    # SQL to create the discovered_urls table and indexes
-    sql_commands = [
-        """
+    # DDL for the discovered_urls table and indexes, sent as one batch
+    schema_sql = """
+        CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
         CREATE TABLE IF NOT EXISTS discovered_urls (
             id SERIAL PRIMARY KEY,
             source_id INTEGER REFERENCES sources(id),
-            url VARCHAR(500) UNIQUE NOT NULL,
+            url VARCHAR(500) NOT NULL,
             inferred_customer_name VARCHAR(255),
             inferred_title VARCHAR(500),
             publish_date DATE,
@@ -31,43 +32,39 @@ def add_discovered_urls_table():
             scrape_error TEXT,
             notes TEXT
         );
-        """,
-        """
+
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_discovered_urls_url_sha 
+        ON discovered_urls(digest(url, 'sha1'));
+
         CREATE INDEX IF NOT EXISTS idx_discovered_urls_source_status 
         ON discovered_urls(source_id, scrape_status);
-        """,
-        """
+
         CREATE INDEX IF NOT EXISTS idx_discovered_urls_status 
         ON discovered_urls(scrape_status);
-        """,
-        """
+
         CREATE INDEX IF NOT EXISTS idx_discovered_urls_publish_date 
         ON discovered_urls(publish_date);
-        """,
-        """
+
         CREATE INDEX IF NOT EXISTS idx_discovered_urls_discovered_date 
         ON discovered_urls(discovered_date);
-        """
-    ]
+    """
     
     try:
         with db.get_cursor() as cursor:
-            for sql in sql_commands:
-                cursor.execute(sql)
-                
-        print("✅ Successfully added discovered_urls table and indexes")
-        
-        # Check if table was created
-        with db.get_cursor() as cursor:
+            cursor.execute(schema_sql)
+            
+            # Check if table was created (same transaction, no extra connection)
             cursor.execute("""
                 SELECT COUNT(*) as count FROM information_schema.tables 
                 WHERE table_name = 'discovered_urls'
             """)
             result = cursor.fetchone()
-            if result['count'] > 0:
-                print("✅ Table discovered_urls exists and is ready")
-            else:
-                print("❌ Table creation may have failed")
+        
+        print("✅ Successfully added discovered_urls table and indexes")
+        if result['count'] > 0:
+            print("✅ Table discovered_urls exists and is ready")
+        else:
+            print("❌ Table creation may have failed")
                 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -2,7 +2,7 @@ import time
 import logging
 import random
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -15,7 +15,7 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
-from src.database.models import DatabaseOperations, DiscoveredUrl, generate_content_hash
+from src.database.models import DatabaseOperations, DiscoveredUrl, CustomerStory, generate_content_hash
 from src.ai_integration.claude_processor import ClaudeProcessor
 
 logger = logging.getLogger(__name__)
@@ -241,13 +241,8 @@ class OpenAIContentScraper:
         for script in soup(["script", "style", "nav", "header", "footer"]):
             script.decompose()
         
-        # Get text content
-        text = soup.get_text()
-        
-        # Clean up text
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        # Get text with every whitespace run (newlines included) collapsed to one space
+        text = ' '.join(soup.get_text().split())
         
         return text
     
@@ -503,4 +498,71 @@ class OpenAIContentScraper:
             error_msg = f"Error processing story: {e}"
             logger.error(error_msg)
             self.db_ops.update_discovered_url_status(discovered_url.id, 'failed', error_msg)
-            return {'success': False, 'error': error_msg}
\ No newline at end of file
+            return {'success': False, 'error': error_msg}
+    
+    def scrape_and_store_stories(self, discovered_urls: List[DiscoveredUrl]) -> List[Dict[str, Any]]:
+        """Scrape and Claude-process several stories, then store them together
+        
+        Stories are written with one bulk upsert and the discovered URL
+        statuses with one bulk update, instead of several statements per
+        story. Returns one result per URL, shaped like scrape_and_store_story's.
+        """
+        results = []
+        stories = []
+        status_updates = []
+        
+        for discovered_url in discovered_urls:
+            try:
+                logger.info(f"Processing discovered URL: {discovered_url.url}")
+                story_data = self.scrape_story_content(discovered_url.url)
+                
+                if not story_data:
+                    status_updates.append((discovered_url.id, 'failed', 'Failed to scrape content'))
+                    results.append({'success': False, 'error': 'Failed to scrape content'})
+                    continue
+                
+                logger.info("Processing content with Claude AI...")
+                extracted_data = self.claude_processor.process_story_content(
+                    story_data['text_content'], 
+                    story_data['customer_name']
+                )
+                
+                stories.append(CustomerStory(
+                    id=None,
+                    source_id=self.source_id,
+                    customer_name=story_data['customer_name'],
+                    title=story_data['title'],
+                    url=story_data['url'],
+                    content_hash=story_data['content_hash'],
+                    raw_content=story_data['raw_content'],
+                    extracted_data=extracted_data,
+                    publish_date=story_data['publish_date']
+                ))
+                results.append({
+                    'success': True,
+                    'customer_name': story_data['customer_name'],
+                    'title': story_data['title'],
+                    'content': story_data['text_content'],
+                    'claude_data': extracted_data
+                })
+                
+            except Exception as e:
+                error_msg = f"Error processing story: {e}"
+                logger.error(error_msg)
+                status_updates.append((discovered_url.id, 'failed', error_msg))
+                results.append({'success': False, 'error': error_msg})
+        
+        # Store everything that was scraped, then record every URL's outcome
+        story_ids = iter(self.db_ops.bulk_upsert_stories(stories))
+        for discovered_url, result in zip(discovered_urls, results):
+            if result['success']:
+                result['story_id'] = next(story_ids)
+                status_updates.append((discovered_url.id, 'scraped', f"Successfully scraped as story ID {result['story_id']}"))
+        self.db_ops.bulk_update_discovered_url_status(status_updates)
+        
+        # Rebuild analytics summaries so they include the new stories
+        if stories:
+            self.db_ops.refresh_summary_views()
+        
+        logger.info(f"Stored {len(stories)} of {len(discovered_urls)} stories")
+        return results
@@ -1,8 +1,14 @@
 import time
 import logging
 import re
-from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
+import threading
+import ahocorasick
+import orjson
+import requests
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -13,18 +19,79 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
 from .base_scraper import BaseScraper
-from src.database.models import generate_content_hash
+from src.config import Config
+from src.database.models import generate_content_hash, generate_content_fingerprint
 
 logger = logging.getLogger(__name__)
 
+# Text fallbacks for extract_publish_date, tried in order
+_DATE_PATTERNS = [
+    re.compile(r'Published on (\d{4}-\d{2}-\d{2})'),
+    re.compile(r'(\d{4}-\d{2}-\d{2})'),
+    re.compile(r'(\w+ \d{1,2}, \d{4})'),  # "January 15, 2024"
+]
+
+# Returns [href, title, innerText] for every story link on the page
+STORY_LINKS_SCRIPT = """
+return Array.from(document.querySelectorAll("a[href*='/index/']"))
+    .map(a => [a.href, a.title || '', a.innerText || '']);
+"""
+STORY_LINK_COUNT_SCRIPT = """
+return document.querySelectorAll("a[href*='/index/']").length;
+"""
+
+# Indicators used by _is_sora_story_by_content, matched in a single
+# Aho-Corasick pass over the page text
+_INDICATORS = {
+    'video': ('video generation', 'generating video', 'video model', 'text-to-video'),
+    'business': ('customer', 'company', 'business', 'use case', 'solution', 'implementation',
+                 'results', 'outcome', 'challenge', 'problem', 'efficiency', 'productivity'),
+}
+_INDICATOR_AUTOMATON = ahocorasick.Automaton()
+for _category, _indicators in _INDICATORS.items():
+    for _indicator in _indicators:
+        _INDICATOR_AUTOMATON.add_word(_indicator, (_category, _indicator))
+_INDICATOR_AUTOMATON.make_automaton()
+
+def _find_indicators(text: str) -> Dict[str, set]:
+    """Return the indicators of each category that occur in text"""
+    found = {category: set() for category in _INDICATORS}
+    for _, (category, indicator) in _INDICATOR_AUTOMATON.iter(text):
+        found[category].add(indicator)
+    return found
+
 class OpenAIScraper(BaseScraper):
+    # Story pages are scraped in parallel, one headless Chrome per worker thread
+    MAX_WORKERS = 8
+    MAX_DELAY = 60.0
+    # Plain HTTP fetch tried before Selenium for each story page
+    STATIC_TIMEOUT = 15
+    STATIC_MIN_WORDS = 100
+    # Longest waits for more story links after a scroll / "Load More" click
+    SCROLL_WAIT = 2
+    LOAD_MORE_WAIT = 3
+    
+    # Media and links kept in raw_content metadata
+    MAX_IMAGES = 10
+    MAX_EXTERNAL_LINKS = 20
+    
     def __init__(self):
         super().__init__("OpenAI", "https://openai.com/stories")
-        self.driver = None
+        self._local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
         self._setup_driver()
+    
+    @property
+    def driver(self):
+        """WebDriver for the calling thread, started on first use"""
+        driver = getattr(self._local, 'driver', None)
+        if driver is None:
+            driver = self._setup_driver()
+        return driver
         
     def _setup_driver(self):
-        """Setup Selenium WebDriver with Chrome"""
+        """Setup Selenium WebDriver with Chrome for the calling thread"""
         try:
             chrome_options = Options()
             chrome_options.add_argument("--headless")  # Run in background
@@ -36,21 +103,41 @@ class OpenAIScraper(BaseScraper):
             
             # Auto-install ChromeDriver
             service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            self._local.driver = driver
+            with self._drivers_lock:
+                self._drivers.append(driver)
             logger.info("Selenium WebDriver initialized successfully")
+            return driver
             
         except Exception as e:
             logger.error(f"Failed to initialize WebDriver: {e}")
             raise
     
     def __del__(self):
-        """Cleanup WebDriver on object destruction"""
-        if self.driver:
+        """Cleanup WebDrivers on object destruction"""
+        for driver in getattr(self, '_drivers', []):
             try:
-                self.driver.quit()
+                driver.quit()
             except:
                 pass
     
+    def _throttle(self):
+        """Sleep for the calling thread's current delay before loading a page"""
+        time.sleep(getattr(self._local, 'delay', Config.SCRAPING_DELAY))
+    
+    def _adjust_delay(self, succeeded: bool):
+        """Adaptive backoff: double the thread's delay on timeout, halve it on success
+        
+        The delay never drops below Config.SCRAPING_DELAY, so each of the
+        MAX_WORKERS threads stays at or under the configured request rate.
+        """
+        delay = getattr(self._local, 'delay', Config.SCRAPING_DELAY)
+        if succeeded:
+            self._local.delay = max(delay / 2, Config.SCRAPING_DELAY)
+        else:
+            self._local.delay = min(delay * 2, self.MAX_DELAY)
+    
     def _is_sora_story_by_url(self, url: str) -> bool:
         """Light URL-based filtering - only filter obvious Sora system pages"""
         # Only filter very obvious Sora technical pages, not customer stories
@@ -64,31 +151,26 @@ class OpenAIScraper(BaseScraper):
         
         return False
     
-    def _is_sora_story_by_content(self, soup: BeautifulSoup, url: str, text_content: str) -> bool:
-        """Content-based filtering - check if page is video-only with insufficient text"""
+    def _is_sora_story_by_content(self, url: str, word_count: int, text_lower: str, title_text: str) -> bool:
+        """Content-based filtering - check if page is video-only with insufficient text
+        
+        Takes the page's word count and lowercased text and title, all
+        computed once by scrape_story.
+        """
         # Check for minimum content length (video-only stories have very little text)
-        word_count = len(text_content.split())
         if word_count < 100:
             logger.info(f"Skipping story with insufficient text content ({word_count} words): {url}")
             return True
         
         # Check if content is heavily video-focused with minimal business content
-        text_lower = text_content.lower()
-        title = soup.find('title')
-        title_text = title.get_text().strip().lower() if title else ""
+        title_text = title_text.lower()
         
         # Look for video-heavy content with minimal business case information
-        video_heavy_indicators = [
-            'video generation', 'generating video', 'video model', 'text-to-video'
-        ]
+        text_indicators = _find_indicators(text_lower)
+        title_indicators = _find_indicators(title_text)
         
-        business_indicators = [
-            'customer', 'company', 'business', 'use case', 'solution', 'implementation',
-            'results', 'outcome', 'challenge', 'problem', 'efficiency', 'productivity'
-        ]
-        
-        video_score = sum(1 for indicator in video_heavy_indicators if indicator in text_lower or indicator in title_text)
-        business_score = sum(1 for indicator in business_indicators if indicator in text_lower)
+        video_score = len(text_indicators['video'] | title_indicators['video'])
+        business_score = len(text_indicators['business'])
         
         # If it's heavily video-focused with no business content, likely a Sora demo
         if video_score >= 2 and business_score == 0:
@@ -97,6 +179,15 @@ class OpenAIScraper(BaseScraper):
         
         return False
     
+    def _wait_for_more_links(self, link_count: int, timeout: float):
+        """Wait until the page has more than link_count story links, at most timeout seconds"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(
+                lambda driver: driver.execute_script(STORY_LINK_COUNT_SCRIPT) > link_count
+            )
+        except TimeoutException:
+            pass
+    
     def get_customer_story_urls(self) -> List[str]:
         """Get list of customer story URLs from OpenAI stories page, filtering out Sora videos"""
         try:
@@ -110,21 +201,20 @@ class OpenAIScraper(BaseScraper):
             
             # Handle infinite scroll/load more functionality
             story_data = []
+            seen_urls = set()
             previous_count = 0
             scroll_attempts = 0
             max_scroll_attempts = 10
             
             while scroll_attempts < max_scroll_attempts:
-                # Find all story links with the expected pattern
-                story_links = self.driver.find_elements(
-                    By.CSS_SELECTOR, 
-                    "a[href*='/index/']"
-                )
+                # Read every story link's href, title and text in one
+                # round-trip instead of three WebDriver calls per link
+                story_links = self.driver.execute_script(STORY_LINKS_SCRIPT) or []
                 
                 # Extract URLs with minimal filtering
-                current_stories = []
-                for link in story_links:
-                    href = link.get_attribute('href')
+                for href, link_title, preview in story_links:
+                    if href in seen_urls:
+                        continue
                     if href and '/index/' in href and len(href.split('/index/')[-1]) > 0:
                         # Ensure it's a story, not API/docs pages
                         company_part = href.split('/index/')[-1].rstrip('/')
@@ -132,17 +222,13 @@ class OpenAIScraper(BaseScraper):
                             
                             # Only filter obvious Sora system pages at URL level
                             if not self._is_sora_story_by_url(href):
-                                current_stories.append({
+                                seen_urls.add(href)
+                                story_data.append({
                                     'url': href,
-                                    'title': link.get_attribute('title') or "",
-                                    'preview': link.text or ""
+                                    'title': link_title or "",
+                                    'preview': preview or ""
                                 })
                 
-                # Update our story data
-                existing_urls = {story['url'] for story in story_data}
-                new_stories = [story for story in current_stories if story['url'] not in existing_urls]
-                story_data.extend(new_stories)
-                
                 # Check if we found new stories
                 if len(story_data) == previous_count:
                     scroll_attempts += 1
@@ -154,7 +240,7 @@ class OpenAIScraper(BaseScraper):
                 
                 # Scroll down to trigger more content loading
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+                self._wait_for_more_links(len(story_links), self.SCROLL_WAIT)
                 
                 # Try to click "Load More" button if present
                 try:
@@ -172,7 +258,7 @@ class OpenAIScraper(BaseScraper):
                                 
                                 # Try clicking the button
                                 button.click()
-                                time.sleep(3)
+                                self._wait_for_more_links(len(story_links), self.LOAD_MORE_WAIT)
                                 scroll_attempts = 0  # Reset counter since we found a button
                                 break
                         except Exception as click_error:
@@ -199,42 +285,92 @@ class OpenAIScraper(BaseScraper):
             logger.error(f"Error getting customer story URLs: {e}")
             return []
     
-    def scrape_story(self, url: str) -> Optional[Dict[str, Any]]:
-        """Scrape individual customer story using Selenium"""
+    def _fetch_static_page(self, url: str) -> Optional[Tuple[str, LexborHTMLParser]]:
+        """Fetch a story page over plain HTTP
+        
+        Story pages are server-rendered, so this avoids starting Chrome.
+        Returns None when the response does not look like a rendered story
+        (no <main> element, or under STATIC_MIN_WORDS words in it), so the
+        caller can fall back to Selenium.
+        """
+        try:
+            response = self.session.get(url, timeout=self.STATIC_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Static fetch failed for {url}: {e}")
+            return None
+        
+        if response.status_code == 429:
+            self._adjust_delay(succeeded=False)
+            return None
+        if response.status_code != 200:
+            return None
+        
+        tree = LexborHTMLParser(response.text)
+        main = tree.css_first('main')
+        if main is None or len(main.text().split()) < self.STATIC_MIN_WORDS:
+            return None
+        return response.text, tree
+    
+    def scrape_story(self, url: str,
+                     known_fingerprints: Optional[Dict[str, Tuple[int, bytes]]] = None) -> Optional[Dict[str, Any]]:
+        """Scrape individual customer story, using Selenium only when the static page is not enough
+        
+        Args:
+            url: Story URL
+            known_fingerprints: Content fingerprints from a previous crawl, keyed
+                by URL (see generate_content_fingerprint). A page whose text
+                still matches is returned as {'url', 'unchanged': True,
+                'content_fingerprint'} without further extraction or hashing.
+        """
         try:
             logger.info(f"Scraping OpenAI story: {url}")
             
-            # Load the story page
-            self.driver.get(url)
+            # Load the story page, parsed with selectolax's Lexbor backend
+            self._throttle()
+            static_page = self._fetch_static_page(url)
+            if static_page:
+                html_content, tree = static_page
+                method = "requests"
+            else:
+                self.driver.get(url)
+                
+                # Wait for content to load
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "main"))
+                )
+                html_content = self.driver.page_source
+                tree = LexborHTMLParser(html_content)
+                method = "selenium"
+            self._adjust_delay(succeeded=True)
             
-            # Wait for content to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "main"))
-            )
+            # Collect metadata and date candidates in one selector pass,
+            # before text extraction strips the JSON-LD scripts
+            page_metadata = self._collect_page_metadata(tree)
             
-            # Get page source and parse with BeautifulSoup
-            html_content = self.driver.page_source
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # Extract text content once; reused by the filter, the date
+            # fallback and the raw content
+            text_content = self.extract_text_content(tree)
             
-            # Extract text content for filtering
-            text_content = self.extract_text_content(soup)
+            content_fingerprint = generate_content_fingerprint(text_content)
+            if known_fingerprints and known_fingerprints.get(url) == content_fingerprint:
+                logger.info(f"Story unchanged since last crawl: {url}")
+                return {'url': url, 'unchanged': True, 'content_fingerprint': content_fingerprint}
+            
+            word_count = len(text_content.split())
             
             # Check if this is a Sora story based on content
-            if self._is_sora_story_by_content(soup, url, text_content):
+            if self._is_sora_story_by_content(url, word_count, text_content.lower(), page_metadata['title']):
                 return None
             
             # Extract customer name
-            customer_name = self.extract_customer_name(soup, url)
+            customer_name = self.extract_customer_name(tree, url)
             
             # Extract publish date
-            publish_date = self.extract_publish_date(soup)
-            
-            # Extract title
-            title_element = soup.find('title')
-            title_text = title_element.get_text().strip() if title_element else ""
+            publish_date = self.extract_publish_date(page_metadata, text_content)
             
             # Create raw content structure
-            raw_content = self.create_selenium_raw_content(html_content, soup, url)
+            raw_content = self.create_selenium_raw_content(html_content, url, text_content, word_count,
+                                                           page_metadata, method)
             
             # Generate content hash
             content_hash = generate_content_hash(raw_content.get('text', ''))
@@ -242,20 +378,117 @@ class OpenAIScraper(BaseScraper):
             return {
                 'url': url,
                 'customer_name': customer_name,
-                'title': title_text,
+                'title': page_metadata['title'],
                 'raw_content': raw_content,
                 'content_hash': content_hash,
+                'content_fingerprint': content_fingerprint,
                 'publish_date': publish_date
             }
             
         except TimeoutException:
             logger.error(f"Timeout loading story page: {url}")
+            self._adjust_delay(succeeded=False)
             return None
         except Exception as e:
             logger.error(f"Error scraping story {url}: {e}")
             return None
     
-    def extract_customer_name(self, soup: BeautifulSoup, url: str) -> str:
+    def scrape_all_stories(self, limit: Optional[int] = None,
+                           known_fingerprints: Optional[Dict[str, Tuple[int, bytes]]] = None) -> List[Dict[str, Any]]:
+        """Scrape all customer stories with optional limit, MAX_WORKERS pages at a time
+        
+        Stories that known_fingerprints shows as unchanged are left out.
+        """
+        story_urls = self.get_customer_story_urls()
+        
+        if limit:
+            story_urls = story_urls[:limit]
+        
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            results = list(executor.map(lambda url: self.scrape_story(url, known_fingerprints), story_urls))
+        
+        stories = []
+        for url, story_data in zip(story_urls, results):
+            if story_data and story_data.get('unchanged'):
+                continue
+            if story_data:
+                stories.append(story_data)
+            else:
+                logger.warning(f"Failed to scrape story: {url}")
+        
+        logger.info(f"Successfully scraped {len(stories)} stories from {self.source_name}")
+        return stories
+    
+    def _collect_page_metadata(self, tree: LexborHTMLParser) -> Dict[str, Any]:
+        """Collect title, description, media, links and date candidates in one pass
+        
+        Images and external links stop being collected at MAX_IMAGES and
+        MAX_EXTERNAL_LINKS; the walk itself continues for the date candidates.
+        """
+        metadata = {
+            'title': "",
+            'description': "",
+            'images': [],
+            'external_links': [],
+            'time_datetimes': [],
+            'meta_dates': [],
+            'json_ld': []
+        }
+        title_found = description_found = False
+        
+        for node in tree.css(
+            'title, meta[name="description"], img[src], a[href], time[datetime], '
+            'meta[property="article:published_time"], meta[property="article:published"], '
+            'script[type="application/ld+json"]'
+        ):
+            tag = node.tag
+            attributes = node.attributes
+            if tag == 'title':
+                if not title_found:
+                    metadata['title'] = node.text().strip()
+                    title_found = True
+            elif tag == 'meta':
+                if attributes.get('name') == 'description':
+                    if not description_found:
+                        metadata['description'] = attributes.get('content') or ''
+                        description_found = True
+                elif attributes.get('content'):
+                    metadata['meta_dates'].append(attributes['content'])
+            elif tag == 'img':
+                if attributes['src'] and len(metadata['images']) < self.MAX_IMAGES:
+                    metadata['images'].append(attributes['src'])
+            elif tag == 'a':
+                if ((attributes['href'] or '').startswith('http')
+                        and len(metadata['external_links']) < self.MAX_EXTERNAL_LINKS):
+                    metadata['external_links'].append(attributes['href'])
+            elif tag == 'time':
+                if attributes['datetime']:
+                    metadata['time_datetimes'].append(attributes['datetime'])
+            elif tag == 'script':
+                metadata['json_ld'].append(node.text())
+        
+        return metadata
+    
+    def extract_text_content(self, tree: LexborHTMLParser) -> str:
+        """Extract clean text content from a selectolax tree
+        
+        Only the <main> subtree is used when the page has one, which leaves
+        out navigation and footer boilerplate.
+        """
+        content_root = tree.css_first('main') or tree.root
+        if content_root is None:
+            return ""
+        
+        # Remove script and style elements
+        for node in content_root.css('script, style'):
+            node.decompose()
+        
+        # Get text with every whitespace run (newlines included) collapsed to one space
+        text = ' '.join(content_root.text().split())
+        
+        return text
+    
+    def extract_customer_name(self, tree: LexborHTMLParser, url: str) -> str:
         """Extract customer name from OpenAI story page"""
         # Try URL-based extraction first (most reliable)
         if '/index/' in url:
@@ -268,17 +501,17 @@ class OpenAIScraper(BaseScraper):
         
         # Try to find customer name in page content
         # Look for h1 tags that might contain the company name
-        h1_tags = soup.find_all('h1')
+        h1_tags = tree.css('h1')
         for h1 in h1_tags:
-            text = h1.get_text().strip()
+            text = h1.text().strip()
             if text and len(text) < 100:  # Reasonable company name length
                 logger.info(f"Extracted customer name from H1: {text}")
                 return text
         
         # Look for title tags
-        title = soup.find('title')
+        title = tree.css_first('title')
         if title:
-            title_text = title.get_text().strip()
+            title_text = title.text().strip()
             # Try to extract company name from title
             if ' | ' in title_text:
                 potential_name = title_text.split(' | ')[0].strip()
@@ -294,14 +527,16 @@ class OpenAIScraper(BaseScraper):
         logger.warning(f"Could not extract customer name from {url}")
         return "Unknown"
     
-    def extract_publish_date(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract publish date from OpenAI story page"""
+    def extract_publish_date(self, page_metadata: Dict[str, Any], text_content: str) -> Optional[str]:
+        """Extract publish date from OpenAI story page
+        
+        page_metadata comes from _collect_page_metadata and text_content from
+        extract_text_content, so no further tree walks are needed here.
+        """
         # Try different date extraction strategies
         
         # 1. Look for time tags with datetime attribute
-        time_tags = soup.find_all('time')
-        for time_tag in time_tags:
-            datetime_attr = time_tag.get('datetime')
+        for datetime_attr in page_metadata['time_datetimes']:
             if datetime_attr:
                 # Convert to date format (YYYY-MM-DD)
                 try:
@@ -315,54 +550,48 @@ class OpenAIScraper(BaseScraper):
                     continue
         
         # 2. Look for meta tags with publication date
-        meta_tags = soup.find_all('meta')
-        for meta in meta_tags:
-            if meta.get('property') in ['article:published_time', 'article:published']:
-                content = meta.get('content')
-                if content:
-                    try:
-                        if 'T' in content:
-                            date_part = content.split('T')[0]
-                        else:
-                            date_part = content
-                        logger.info(f"Extracted publish date from meta tag: {date_part}")
-                        return date_part
-                    except:
-                        continue
+        for content in page_metadata['meta_dates']:
+            if content:
+                try:
+                    if 'T' in content:
+                        date_part = content.split('T')[0]
+                    else:
+                        date_part = content
+                    logger.info(f"Extracted publish date from meta tag: {date_part}")
+                    return date_part
+                except:
+                    continue
         
         # 3. Look for JSON-LD structured data
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
+        for script_text in page_metadata['json_ld']:
             try:
-                import json
-                data = json.loads(script.string)
-                if isinstance(data, dict):
-                    date_published = data.get('datePublished')
-                    if date_published:
-                        if 'T' in date_published:
-                            date_part = date_published.split('T')[0]
-                        else:
-                            date_part = date_published
-                        logger.info(f"Extracted publish date from JSON-LD: {date_part}")
-                        return date_part
-            except:
+                data = orjson.loads(script_text or '{}')
+            except orjson.JSONDecodeError:
+                continue
+            
+            # A block may be a single object, a list of objects, or a
+            # schema.org @graph; stop at the first datePublished
+            if isinstance(data, dict):
+                items = data.get('@graph') if isinstance(data.get('@graph'), list) else [data]
+            elif isinstance(data, list):
+                items = data
+            else:
                 continue
+            
+            for item in items:
+                date_published = item.get('datePublished') if isinstance(item, dict) else None
+                if date_published and isinstance(date_published, str):
+                    date_part = date_published.split('T')[0]
+                    logger.info(f"Extracted publish date from JSON-LD: {date_part}")
+                    return date_part
         
         # 4. Look for date patterns in text content
-        text_content = soup.get_text()
-        date_patterns = [
-            r'Published on (\d{4}-\d{2}-\d{2})',
-            r'(\d{4}-\d{2}-\d{2})',
-            r'(\w+ \d{1,2}, \d{4})',  # "January 15, 2024"
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text_content)
-            if matches:
-                date_str = matches[0]
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text_content)
+            if match:
+                date_str = match.group(1)
                 try:
                     # Try to parse and standardize the date
-                    from datetime import datetime
                     if '-' in date_str:
                         # Already in YYYY-MM-DD format
                         logger.info(f"Extracted publish date from text: {date_str}")
@@ -379,36 +608,26 @@ class OpenAIScraper(BaseScraper):
         logger.warning("Could not extract publish date")
         return None
     
-    def create_selenium_raw_content(self, html_content: str, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
-        """Create standardized raw content structure for Selenium-scraped content"""
-        text_content = self.extract_text_content(soup)
-        
-        # Extract metadata
-        title = soup.find('title')
-        title_text = title.get_text().strip() if title else ""
-        
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        description = meta_desc.get('content', '') if meta_desc else ""
-        
-        # Count images and external links
-        images = [img.get('src', '') for img in soup.find_all('img') if img.get('src')]
-        external_links = [link.get('href', '') for link in soup.find_all('a', href=True) 
-                         if link.get('href', '').startswith('http')]
+    def create_selenium_raw_content(self, html_content: str, url: str, text_content: str, word_count: int,
+                                    page_metadata: Dict[str, Any], method: str = "selenium") -> Dict[str, Any]:
+        """Create standardized raw content structure for story pages
         
+        method records how the page was fetched: "requests" or "selenium".
+        """
         return {
             "html": html_content,
             "text": text_content,
             "metadata": {
-                "title": title_text,
-                "description": description,
-                "word_count": len(text_content.split()),
-                "images": images[:10],  # Limit to first 10 images
-                "external_links": external_links[:20]  # Limit to first 20 links
+                "title": page_metadata['title'],
+                "description": page_metadata['description'],
+                "word_count": word_count,
+                "images": page_metadata['images'],  # Capped at MAX_IMAGES
+                "external_links": page_metadata['external_links']  # Capped at MAX_EXTERNAL_LINKS
             },
             "scraping_info": {
                 "scraper_version": "1.0",
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ'),
-                "method": "selenium",
+                "method": method,
                 "final_url": url,
                 "errors": []
             }
@@ -7,9 +7,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from src.database.connection import DatabaseConnection
 from src.database.models import DatabaseOperations
 
-def show_all_stories():
+def show_all_stories(db: DatabaseConnection):
     """Display all stories from the database"""
-    db = DatabaseConnection()
     db_ops = DatabaseOperations(db)
     
     try:
@@ -19,14 +18,13 @@ def show_all_stories():
             print("No Anthropic source found in database")
             return
         
-        # Get all stories for Anthropic
-        stories = db_ops.get_stories_by_source(anthropic_source.id)
-        
+        # Stream all stories for Anthropic; the total is known once they are printed
         print(f"\n{'='*80}")
-        print(f"STORED CUSTOMER STORIES - Total: {len(stories)}")
+        print("STORED CUSTOMER STORIES")
         print(f"{'='*80}")
         
-        for i, story in enumerate(stories, 1):
+        total = 0
+        for total, story in enumerate(db_ops.iter_stories_by_source(anthropic_source.id), 1):
             print(f"\n{'='*60}")
             print(f"STORY {story.id}: {story.customer_name}")
             print(f"{'='*60}")
@@ -78,7 +76,9 @@ def show_all_stories():
             
             print(f"\n{'-'*60}")
         
-        if not stories:
+        if total:
+            print(f"\nTotal: {total} stories")
+        else:
             print("No stories found in database")
             
     except Exception as e:
@@ -86,10 +86,8 @@ def show_all_stories():
         import traceback
         traceback.print_exc()
 
-def show_database_stats():
+def show_database_stats(db: DatabaseConnection):
     """Show database statistics"""
-    db = DatabaseConnection()
-    
     try:
         with db.get_cursor() as cursor:
             # Count stories by source
@@ -130,5 +128,6 @@ def show_database_stats():
         print(f"Error getting database stats: {e}")
 
 if __name__ == "__main__":
-    show_database_stats()
-    show_all_stories()
\ No newline at end of file
+    with DatabaseConnection() as db:
+        show_database_stats(db)
+        show_all_stories(db)
\ No newline at end of file
@@ -3,21 +3,29 @@
 Test script for AWS scraper functionality
 """
 
+import functools
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, 'src')
 
 from src.scrapers.aws_scraper import AWScraper
+from _http import SESSION
 from src.config import Config
 import logging
 
+@functools.lru_cache(maxsize=1)
+def _scraper() -> AWScraper:
+    """The one AWScraper shared by every test in this module"""
+    return AWScraper(session=SESSION)
+
 def test_aws_url_discovery():
     """Test URL discovery for AWS customer stories"""
     print("=" * 60)
     print("TESTING AWS URL DISCOVERY")
     print("=" * 60)
     
-    scraper = AWScraper()
+    scraper = _scraper()
     
     print(f"Base URL: {scraper.base_url}")
     print(f"AI Keywords: {len(scraper.ai_keywords)} keywords")
@@ -41,7 +49,7 @@ def test_aws_story_scraping(urls, limit=3):
     print("TESTING AWS STORY SCRAPING")
     print("=" * 60)
     
-    scraper = AWScraper()
+    scraper = _scraper()
     test_urls = urls[:limit] if urls else []
     
     if not test_urls:
@@ -50,12 +58,14 @@ def test_aws_story_scraping(urls, limit=3):
     
     scraped_stories = []
     
-    for i, url in enumerate(test_urls, 1):
+    # Stories are fetched concurrently over the shared session's connection pool
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(scraper.scrape_story, test_urls))
+    
+    for i, (url, story_data) in enumerate(zip(test_urls, results), 1):
         print(f"\nScraping story {i}/{len(test_urls)}: {url}")
         print("-" * 40)
         
-        story_data = scraper.scrape_story(url)
-        
         if story_data:
             scraped_stories.append(story_data)
             print(f"✅ SUCCESS")
@@ -76,7 +86,7 @@ def test_ai_filtering():
     print("TESTING AI KEYWORD FILTERING")
     print("=" * 60)
     
-    scraper = AWScraper()
+    scraper = _scraper()
     
     # Test cases for AI filtering
     test_cases = [
@@ -105,22 +115,9 @@ def test_ai_filtering():
     print(f"AI Keywords ({len(scraper.ai_keywords)}): {', '.join(list(scraper.ai_keywords)[:8])}...")
     print("\nTesting AI story detection:")
     
-    from bs4 import BeautifulSoup
-    
     for i, case in enumerate(test_cases, 1):
-        # Create mock HTML content
-        html_content = f"""
-        <html>
-            <head><title>{case['title']}</title></head>
-            <body>
-                <h1>{case['title']}</h1>
-                <p>{case['content']}</p>
-            </body>
-        </html>
-        """
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
-        result = scraper._is_ai_story(soup, html_content)
+        # The filter works on page text, so no HTML needs to be built or parsed
+        result = scraper._is_ai_story_from_text(case['title'] + ' ' + case['content'], case['title'])
         
         status = "✅ PASS" if result == case['expected'] else "❌ FAIL"
         print(f"{i}. {case['title']}")
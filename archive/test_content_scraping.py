@@ -62,34 +62,29 @@ def test_content_scraping():
         print("\n5. Testing content scraping...")
         print("   This may take several minutes per story...")
         
-        for i, discovered_url in enumerate(pending_urls, 1):
+        # Scrape every story first; they are stored together at the end
+        results = content_scraper.scrape_and_store_stories(pending_urls)
+        
+        for i, (discovered_url, result) in enumerate(zip(pending_urls, results), 1):
             print(f"\n--- Testing Story {i}/{len(pending_urls)} ---")
             print(f"Customer: {discovered_url.inferred_customer_name}")
             print(f"URL: {discovered_url.url}")
             print(f"Date: {discovered_url.publish_date}")
             
-            try:
-                result = content_scraper.scrape_and_store_story(discovered_url)
+            if result['success']:
+                print("✅ Story scraped and stored successfully!")
+                print(f"   Story ID: {result['story_id']}")
+                print(f"   Customer: {result['customer_name']}")
+                print(f"   Title: {result['title'][:100]}...")
+                print(f"   Content length: {len(result['content'])} chars")
                 
-                if result['success']:
-                    print("✅ Story scraped and stored successfully!")
-                    print(f"   Story ID: {result['story_id']}")
-                    print(f"   Customer: {result['customer_name']}")
-                    print(f"   Title: {result['title'][:100]}...")
-                    print(f"   Content length: {len(result['content'])} chars")
-                    
-                    if result.get('claude_data'):
-                        claude_data = result['claude_data']
-                        print(f"   AI Quality Score: {claude_data.get('content_quality_score', 'N/A')}")
-                        print(f"   Industry: {claude_data.get('company_info', {}).get('industry_sector', 'N/A')}")
-                        print(f"   Technologies: {claude_data.get('technologies_used', [])[:3]}")
-                else:
-                    print(f"❌ Story scraping failed: {result.get('error', 'Unknown error')}")
-                    
-            except Exception as e:
-                print(f"❌ Error scraping story: {e}")
-                import traceback
-                traceback.print_exc()
+                if result.get('claude_data'):
+                    claude_data = result['claude_data']
+                    print(f"   AI Quality Score: {claude_data.get('content_quality_score', 'N/A')}")
+                    print(f"   Industry: {claude_data.get('company_info', {}).get('industry_sector', 'N/A')}")
+                    print(f"   Technologies: {claude_data.get('technologies_used', [])[:3]}")
+            else:
+                print(f"❌ Story scraping failed: {result.get('error', 'Unknown error')}")
         
         print("\n" + "="*70)
         print("CONTENT SCRAPING PHASE COMPLETED")
@@ -4,10 +4,11 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.scrapers.anthropic_scraper import AnthropicScraper
+from _http import SESSION
 
 def test_date_extraction():
     """Test the date extraction from Anthropic customer page"""
-    scraper = AnthropicScraper()
+    scraper = AnthropicScraper(session=SESSION)
     
     print("Testing date extraction...")
     stories_with_dates = scraper.get_customer_story_urls_with_dates()
@@ -3,27 +3,27 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-import psycopg2
-import psycopg2.extras
+import psycopg2.extensions
 from src.config import Config
+from src.database.connection import DatabaseConnection
 
-# Test direct connection
+# Test pooled connection (tagged so it is easy to spot in pg_stat_activity)
 try:
-    print("Testing direct psycopg2 connection...")
-    conn = psycopg2.connect(
+    print("Testing pooled psycopg2 connection...")
+    test_dsn = psycopg2.extensions.make_dsn(
         "postgresql://ai_user@localhost/ai_stories",
-        cursor_factory=psycopg2.extras.RealDictCursor
+        application_name='ai_story_tests'
     )
-    cursor = conn.cursor()
-    cursor.execute("SELECT 1 as test")
-    result = cursor.fetchone()
-    print(f"Direct connection success: {result}")
-    conn.close()
+    with DatabaseConnection(test_dsn) as db:
+        with db.get_cursor() as cursor:
+            cursor.execute("SELECT 1 as test")
+            result = cursor.fetchone()
+    print(f"Pooled connection success: {result}")
 except Exception as e:
-    print(f"Direct connection failed: {e}")
+    print(f"Pooled connection failed: {e}")
 
 # Test config loading
 try:
     print(f"Database URL from config: {Config.DATABASE_URL}")
 except Exception as e:
-    print(f"Config error: {e}")
\ No newline at end of file
+    print(f"Config error: {e}")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test script for Google Cloud scraper"""
 
+import functools
 import logging
 import sys
 import os
@@ -9,6 +10,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.scrapers.googlecloud_scraper import GoogleCloudScraper
+from _http import SESSION
 
 # Configure logging
 logging.basicConfig(
@@ -16,9 +18,14 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+@functools.lru_cache(maxsize=1)
+def _scraper() -> GoogleCloudScraper:
+    """The one GoogleCloudScraper shared by every test in this module"""
+    return GoogleCloudScraper(session=SESSION)
+
 def test_url_discovery():
     """Test URL discovery functionality"""
-    scraper = GoogleCloudScraper()
+    scraper = _scraper()
     
     print("=== Testing Google Cloud URL Discovery ===")
     urls = scraper.get_customer_story_urls()
@@ -34,7 +41,7 @@ def test_url_discovery():
 
 def test_story_scraping():
     """Test scraping specific customer stories"""
-    scraper = GoogleCloudScraper()
+    scraper = _scraper()
     
     # Test URLs we know exist
     test_urls = [
@@ -70,7 +77,7 @@ def test_story_scraping():
 
 def test_ai_filtering():
     """Test AI content filtering"""
-    scraper = GoogleCloudScraper()
+    scraper = _scraper()
     
     print("\n=== Testing AI Content Filtering ===")
     
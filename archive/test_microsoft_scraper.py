@@ -4,6 +4,7 @@ Test script for Microsoft Azure AI customer stories scraper
 Tests URL discovery and content extraction capabilities
 """
 
+import functools
 import sys
 import os
 import logging
@@ -13,6 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from scrapers.microsoft_scraper import MicrosoftScraper
+from _http import SESSION
 
 # Configure logging
 logging.basicConfig(
@@ -26,13 +28,18 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
+def _scraper() -> MicrosoftScraper:
+    """The one MicrosoftScraper shared by every test in this module"""
+    return MicrosoftScraper(session=SESSION)
+
 def test_url_discovery():
     """Test Microsoft story URL discovery"""
     print("=" * 60)
     print("TESTING: Microsoft Azure AI Customer Stories URL Discovery")
     print("=" * 60)
     
-    scraper = MicrosoftScraper()
+    scraper = _scraper()
     
     try:
         urls = scraper.get_customer_story_urls()
@@ -59,7 +66,7 @@ def test_single_story_scraping(url: str):
     print(f"URL: {url}")
     print("=" * 60)
     
-    scraper = MicrosoftScraper()
+    scraper = _scraper()
     
     try:
         story_data = scraper.scrape_story(url)
@@ -134,7 +141,7 @@ def test_ai_filtering():
     print("TESTING: AI Content Filtering")
     print("=" * 60)
     
-    scraper = MicrosoftScraper()
+    scraper = _scraper()
     
     # Test with known AI story
     test_url = "https://www.microsoft.com/en/customers/story/23953-accenture-azure-ai-foundry"
@@ -7,16 +7,32 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-import requests
-import time
-import random
-from bs4 import BeautifulSoup
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from selectolax.lexbor import LexborHTMLParser
 from src.config import Config
 from src.database.connection import DatabaseConnection
 from src.database.models import DatabaseOperations
+from _async_fetch import fetch_all
+
+def extract_page(body: bytes):
+    """Return (clean text, title) of an HTML page
+    
+    The raw bytes go straight to the selectolax (lexbor) parser, which
+    detects the encoding itself, so no decoded copy of the page is made.
+    """
+    tree = LexborHTMLParser(body)
+    title_node = tree.css_first('title')
+    title = title_node.text() if title_node else None
+    
+    # Extract text content
+    tree.strip_tags(['script', 'style', 'nav', 'header', 'footer'])
+    clean_text = ' '.join(tree.root.text(separator=' ').split()) if tree.root else ''
+    
+    return clean_text, title
 
 def test_requests_scraping():
-    """Test scraping with requests library"""
+    """Test scraping with plain HTTP requests"""
     
     print("="*70)
     print("TESTING OPENAI REQUESTS-BASED SCRAPING")
@@ -37,75 +53,54 @@ def test_requests_scraping():
         
         print(f"✅ Found {len(pending_urls)} URLs to test")
         
-        # Setup session with realistic headers
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        # Fetch all pages concurrently, then parse the successful ones across
+        # CPU cores (tree building is CPU-bound and holds the GIL)
+        print("Making requests...")
+        results = asyncio.run(fetch_all([url_obj.url for url_obj in pending_urls]))
+        bodies = [body for _, status, body in results if status == 200]
+        # Only sizes are reported, so keep no other reference to the bodies
+        # and each one can be freed as soon as it has been sent to a worker
+        results = [(url, status, len(body)) for url, status, body in results]
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            parsed = iter(executor.map(extract_page, bodies, chunksize=4))
+            del bodies
         
-        for i, url_obj in enumerate(pending_urls, 1):
-            url = url_obj.url
+        for i, (url_obj, (url, status, size)) in enumerate(zip(pending_urls, results), 1):
             print(f"\n--- Testing URL {i}/{len(pending_urls)} ---")
             print(f"Customer: {url_obj.inferred_customer_name}")
             print(f"URL: {url}")
             
-            try:
-                # Human-like delay
-                time.sleep(random.uniform(2, 5))
-                
-                # Make request
-                print("Making request...")
-                response = session.get(url, timeout=30)
+            if status == 0:
+                print("❌ Request failed or timed out")
+                continue
+            
+            print(f"Status code: {status}")
+            
+            if status == 200:
+                print(f"Content length: {size} bytes")
+                clean_text, title = next(parsed)
+                word_count = len(clean_text.split())
                 
-                print(f"Status code: {response.status_code}")
-                print(f"Content length: {len(response.content)} bytes")
+                print(f"✅ Content extracted successfully!")
+                print(f"   Word count: {word_count}")
+                print(f"   Title: {title or 'No title'}")
                 
-                if response.status_code == 200:
-                    # Parse with BeautifulSoup
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Extract text content
-                    for script in soup(["script", "style", "nav", "header", "footer"]):
-                        script.decompose()
-                    
-                    text = soup.get_text()
-                    lines = (line.strip() for line in text.splitlines())
-                    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                    clean_text = ' '.join(chunk for chunk in chunks if chunk)
-                    
-                    word_count = len(clean_text.split())
-                    
-                    print(f"✅ Content extracted successfully!")
-                    print(f"   Word count: {word_count}")
-                    print(f"   Title: {soup.title.string if soup.title else 'No title'}")
-                    
-                    # Show sample content
-                    if len(clean_text) > 200:
-                        print(f"   Content sample: {clean_text[:200]}...")
-                    else:
-                        print(f"   Full content: {clean_text}")
-                        
-                    # Check for bot detection indicators
-                    if any(indicator in clean_text.lower() for indicator in ['blocked', 'access denied', 'captcha', 'please verify']):
-                        print("⚠️  Possible bot detection detected in content")
-                    
-                elif response.status_code == 403:
-                    print("❌ 403 Forbidden - Bot detection likely")
-                elif response.status_code == 429:
-                    print("❌ 429 Rate Limited - Too many requests")
+                # Show sample content
+                if len(clean_text) > 200:
+                    print(f"   Content sample: {clean_text[:200]}...")
                 else:
-                    print(f"❌ HTTP {response.status_code} - {response.reason}")
+                    print(f"   Full content: {clean_text}")
                     
-            except requests.exceptions.Timeout:
-                print("❌ Request timeout")
-            except Exception as e:
-                print(f"❌ Request failed: {e}")
+                # Check for bot detection indicators
+                if any(indicator in clean_text.lower() for indicator in ['blocked', 'access denied', 'captcha', 'please verify']):
+                    print("⚠️  Possible bot detection detected in content")
+                
+            elif status == 403:
+                print("❌ 403 Forbidden - Bot detection likely")
+            elif status == 429:
+                print("❌ 429 Rate Limited - Too many requests")
+            else:
+                print(f"❌ HTTP {status}")
         
         print(f"\n{'-'*70}")
         print("REQUESTS-BASED SCRAPING TEST COMPLETED")
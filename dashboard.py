@@ -62,6 +62,16 @@ def main():
         st.info("Please ensure your database is running and accessible.")
         return
     
+    render_page(page, df, source_stats, aileron_data)
+
+
+@st.fragment
+def render_page(page, df, source_stats, aileron_data):
+    """Render the selected page
+    
+    As a fragment, widget changes inside a page rerun only this function;
+    the brand styling, sidebar and data loading above are left as they are.
+    """
     if page == "📊 Overview":
         show_overview(df, source_stats)
     elif page == "🔍 Story Explorer":
@@ -204,6 +204,10 @@ class EnhancedMicrosoftScraper:
                 logger.info(f"  Batch {batch_num} complete. Pausing before next batch...")
                 time.sleep(5)
         
+        # Rebuild analytics summaries so they include the new stories
+        if stats['successful']:
+            self.db_ops.refresh_summary_views()
+        
         return stats
     
     def run_enhanced_scraping(self, ai_only: bool = True, max_stories: Optional[int] = None):
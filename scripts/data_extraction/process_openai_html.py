@@ -11,13 +11,12 @@ from pathlib import Path
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 from datetime import datetime
-import hashlib
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from database.connection import DatabaseConnection
-from database.models import DatabaseOperations, CustomerStory
+from database.models import DatabaseOperations, CustomerStory, generate_content_hash
 from ai_integration.claude_processor import ClaudeProcessor
 
 class OpenAIHTMLProcessor:
@@ -289,7 +288,7 @@ Company name:"""
                 }
                 
                 # Generate content hash
-                content_hash = hashlib.sha256(story_data['content_text'].encode()).hexdigest()
+                content_hash = generate_content_hash(story_data['content_text'])
                 
                 # Create CustomerStory object
                 customer_story = CustomerStory(
@@ -326,6 +325,10 @@ Company name:"""
                 traceback.print_exc()
                 continue
         
+        # Rebuild analytics summaries so they include the new stories
+        if saved_count:
+            self.db_ops.refresh_summary_views()
+        
         return saved_count
 
 def main():
@@ -9,20 +9,108 @@ import os
 import json
 import pandas as pd
 from typing import Dict, List, Optional
-from collections import Counter
+from itertools import groupby
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from database.connection import DatabaseConnection
+from database.connection import DatabaseConnection, POOL_MAX_CONNECTIONS
 from database.models import DatabaseOperations
 
+# Live equivalent of the categorical_summary materialized view, one
+# aggregation per dimension. The dimensions are independent, so without the
+# view they are run concurrently on separate pooled connections.
+CATEGORICAL_DIMENSION_QUERIES = {
+    'industry': """
+        SELECT 'industry' AS dimension, industry AS category, COUNT(*) AS count
+        FROM customer_stories
+        WHERE industry IS NOT NULL
+        GROUP BY industry
+    """,
+    'source': """
+        SELECT 'source' AS dimension, s.name AS category, COUNT(*) AS count
+        FROM customer_stories cs
+        JOIN sources s ON cs.source_id = s.id
+        GROUP BY s.name
+    """,
+    'ai_type': """
+        SELECT 'ai_type' AS dimension, extracted_data->>'ai_type' AS category, COUNT(*) AS count
+        FROM customer_stories
+        WHERE extracted_data->>'ai_type' IS NOT NULL
+        GROUP BY extracted_data->>'ai_type'
+    """,
+    'language': """
+        SELECT 'language' AS dimension, detected_language AS category, COUNT(*) AS count
+        FROM customer_stories
+        WHERE detected_language IS NOT NULL
+        GROUP BY detected_language
+    """,
+    # Emits both the business_outcome and outcome_unit dimensions from one
+    # expansion of the outcome arrays
+    'business_outcome': """
+        SELECT
+            CASE WHEN GROUPING(outcome->>'type') = 0 THEN 'business_outcome' ELSE 'outcome_unit' END AS dimension,
+            CASE WHEN GROUPING(outcome->>'type') = 0 THEN outcome->>'type' ELSE outcome->>'unit' END AS category,
+            COUNT(*) AS count
+        FROM customer_stories
+        CROSS JOIN LATERAL jsonb_array_elements(extracted_data->'business_outcomes') AS outcome
+        WHERE jsonb_typeof(extracted_data->'business_outcomes') = 'array'
+        GROUP BY GROUPING SETS ((outcome->>'type'), (outcome->>'unit'))
+        HAVING COALESCE(outcome->>'type', outcome->>'unit') IS NOT NULL
+    """,
+    'gen_ai_superpower': """
+        SELECT 'gen_ai_superpower' AS dimension, t.tag AS category, COUNT(*) AS count
+        FROM customer_story_tags t
+        JOIN customer_stories cs ON cs.id = t.story_id
+        WHERE t.dimension = 'superpower'
+        AND cs.is_gen_ai = TRUE
+        GROUP BY t.tag
+    """,
+    'data_quality': """
+        SELECT 'data_quality' AS dimension, metric AS category, value AS count
+        FROM (
+            SELECT
+                COUNT(*) AS total_stories,
+                COUNT(*) FILTER (WHERE is_gen_ai = TRUE) AS gen_ai_stories,
+                COUNT(*) FILTER (WHERE extracted_data ? 'gen_ai_superpowers') AS with_aileron,
+                COUNT(*) FILTER (
+                    WHERE extracted_data ? 'business_outcomes'
+                    AND extracted_data->>'business_outcomes' != '[]'
+                ) AS with_outcomes
+            FROM customer_stories
+        ) totals
+        CROSS JOIN LATERAL (VALUES
+            ('total_stories', totals.total_stories),
+            ('gen_ai_stories', totals.gen_ai_stories),
+            ('with_aileron', totals.with_aileron),
+            ('with_outcomes', totals.with_outcomes)
+        ) AS quality(metric, value)
+    """,
+}
+
+# Superpower counts straight from the JSONB arrays, for databases where
+# 002_add_customer_story_tags.sql has not been run
+JSONB_SUPERPOWER_QUERY = """
+    SELECT 'gen_ai_superpower' AS dimension, superpower AS category, COUNT(*) AS count
+    FROM customer_stories
+    CROSS JOIN LATERAL jsonb_array_elements_text(extracted_data->'gen_ai_superpowers') AS superpower
+    WHERE is_gen_ai = TRUE
+    AND jsonb_typeof(extracted_data->'gen_ai_superpowers') = 'array'
+    AND superpower IS NOT NULL
+    GROUP BY superpower
+"""
+
+# Dimensions printed as a top-N list; the rest are always shown in full
+LIMITED_DIMENSIONS = ('industry', 'language', 'business_outcome', 'outcome_unit', 'gen_ai_superpower')
+
 class AnalysisTools:
     """Unified analysis tools for comprehensive data analysis"""
     
     def __init__(self):
         self.db = DatabaseConnection()
-        self.db_ops = DatabaseOperations()
+        self.db_ops = DatabaseOperations(self.db)
     
     def analyze_categorical_data(self, limit: int = 15):
         """
@@ -31,150 +119,176 @@ class AnalysisTools:
         Args:
             limit: Maximum number of categories to show per field
         """
-        print("📊 COMPREHENSIVE CATEGORICAL DATA ANALYSIS")
-        print("="*80)
+        data = self.fetch_categorical_summary(limit)
+        self.render_categorical_summary(data, limit)
+    
+    def fetch_categorical_summary(self, limit: int = 15) -> Dict:
+        """
+        Fetch per-field category counts for analyze_categorical_data
         
-        with self.db.get_cursor() as cursor:
-            # 1. Main table categorical fields
-            print("\n1️⃣ MAIN TABLE CATEGORICAL FIELDS:")
-            print("-" * 50)
-            
-            # Industry analysis
-            cursor.execute("""
-                SELECT industry, COUNT(*) as count 
-                FROM customer_stories 
-                WHERE industry IS NOT NULL 
-                GROUP BY industry 
-                ORDER BY count DESC
-            """)
-            
-            industries = cursor.fetchall()
-            print(f"🏭 INDUSTRY ({len(industries)} categories, {sum(row['count'] for row in industries)} stories):")
-            for row in industries[:limit]:
-                print(f"   • {row['industry']}: {row['count']} stories")
-            if len(industries) > limit:
-                print(f"   ... and {len(industries) - limit} more categories")
-            
-            # Source analysis
-            cursor.execute("""
-                SELECT source, COUNT(*) as count 
-                FROM customer_stories 
-                GROUP BY source 
-                ORDER BY count DESC
-            """)
-            
-            sources = cursor.fetchall()
-            print(f"\n📡 SOURCE ({len(sources)} sources):")
-            for row in sources:
-                print(f"   • {row['source']}: {row['count']} stories")
+        Reads the pre-aggregated categorical_summary materialized view
+        (see src/database/migrations/003_add_categorical_summary_view.sql) in a
+        single query. When the view has not been created, the queries in
+        CATEGORICAL_DIMENSION_QUERIES run concurrently instead, each on its
+        own pooled connection.
+        
+        Every cursor (and its transaction) is released before anything is
+        printed.
+        
+        Args:
+            limit: Maximum number of categories to return per truncated field
             
-            # AI Type analysis
+        Returns:
+            Dict with 'summary' (dimension -> [(category, count), ...]),
+            'totals' (dimension -> (n_categories, total_count)) and
+            'remainders' (dimension -> stories beyond the top limit)
+        """
+        with self.db.get_cursor() as cursor:
             cursor.execute("""
                 SELECT 
-                    extracted_data->>'ai_type' as ai_type,
-                    COUNT(*) as count 
-                FROM customer_stories 
-                WHERE extracted_data->>'ai_type' IS NOT NULL
-                GROUP BY extracted_data->>'ai_type'
-                ORDER BY count DESC
-            """)
-            
-            ai_types = cursor.fetchall()
-            print(f"\n🤖 AI TYPE ({len(ai_types)} types):")
-            for row in ai_types:
-                print(f"   • {row['ai_type']}: {row['count']} stories")
-            
-            # Language analysis
-            cursor.execute("""
-                SELECT language, COUNT(*) as count 
-                FROM customer_stories 
-                WHERE language IS NOT NULL 
-                GROUP BY language 
-                ORDER BY count DESC
-            """)
-            
-            languages = cursor.fetchall()
-            print(f"\n🌐 LANGUAGE ({len(languages)} languages):")
-            for row in languages[:limit]:
-                print(f"   • {row['language']}: {row['count']} stories")
-            
-            # 2. Extracted data analysis
-            print("\n\n2️⃣ EXTRACTED DATA CATEGORICAL FIELDS:")
-            print("-" * 50)
-            
-            # Business outcomes
-            cursor.execute("""
-                SELECT extracted_data->>'business_outcomes' as outcomes
-                FROM customer_stories 
-                WHERE extracted_data->>'business_outcomes' IS NOT NULL
-                AND extracted_data->>'business_outcomes' != '[]'
-                AND extracted_data->>'business_outcomes' != 'null'
-            """)
-            
-            outcomes_data = cursor.fetchall()
-            all_outcomes = []
-            
-            for row in outcomes_data:
-                try:
-                    outcomes = json.loads(row['outcomes'])
-                    if isinstance(outcomes, list):
-                        all_outcomes.extend(outcomes)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-            
-            outcome_counts = Counter(all_outcomes)
-            print(f"📈 BUSINESS OUTCOMES ({len(outcome_counts)} unique outcomes):")
-            for outcome, count in outcome_counts.most_common(limit):
-                print(f"   • {outcome}: {count} stories")
-            
-            # SuperPowers analysis (for Gen AI stories)
-            cursor.execute("""
-                SELECT extracted_data->'gen_ai_superpowers' as superpowers
-                FROM customer_stories 
-                WHERE extracted_data->'gen_ai_superpowers' IS NOT NULL
-                AND is_gen_ai = TRUE
+                    to_regclass('categorical_summary') IS NOT NULL AS has_view,
+                    to_regclass('customer_story_tags') IS NOT NULL AS has_tags
             """)
-            
-            superpowers_data = cursor.fetchall()
-            all_superpowers = []
-            
-            for row in superpowers_data:
-                try:
-                    superpowers = row['superpowers']
-                    if isinstance(superpowers, list):
-                        all_superpowers.extend(superpowers)
-                    elif isinstance(superpowers, str):
-                        superpowers_list = json.loads(superpowers)
-                        if isinstance(superpowers_list, list):
-                            all_superpowers.extend(superpowers_list)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-            
-            superpower_counts = Counter(all_superpowers)
-            print(f"\n⚡ GEN AI SUPERPOWERS ({len(superpower_counts)} unique powers):")
-            for power, count in superpower_counts.most_common(limit):
-                print(f"   • {power}: {count} stories")
-            
-            # 3. Data quality summary
-            print("\n\n3️⃣ DATA QUALITY SUMMARY:")
-            print("-" * 30)
-            
-            cursor.execute("SELECT COUNT(*) as total FROM customer_stories")
-            total_stories = cursor.fetchone()['total']
-            
-            cursor.execute("SELECT COUNT(*) as genai FROM customer_stories WHERE is_gen_ai = TRUE")
-            genai_stories = cursor.fetchone()['genai']
-            
-            cursor.execute("SELECT COUNT(*) as with_aileron FROM customer_stories WHERE extracted_data->'gen_ai_superpowers' IS NOT NULL")
-            aileron_stories = cursor.fetchone()['with_aileron']
-            
-            cursor.execute("SELECT COUNT(*) as with_outcomes FROM customer_stories WHERE extracted_data->>'business_outcomes' IS NOT NULL AND extracted_data->>'business_outcomes' != '[]'")
-            outcome_stories = cursor.fetchone()['with_outcomes']
-            
-            print(f"📊 Total Stories: {total_stories}")
-            print(f"🤖 Gen AI Stories: {genai_stories} ({genai_stories/total_stories*100:.1f}%)")
-            print(f"⚡ With Aileron Data: {aileron_stories} ({aileron_stories/genai_stories*100:.1f}% of GenAI)")
-            print(f"📈 With Business Outcomes: {outcome_stories} ({outcome_stories/total_stories*100:.1f}%)")
+            row = cursor.fetchone()
+            has_view, has_tags = row['has_view'], row['has_tags']
+        
+        if has_view:
+            rows = self._fetch_ranked_categories(
+                "categorical_summary_top_n", "categorical_summary", limit
+            )
+        else:
+            queries = dict(CATEGORICAL_DIMENSION_QUERIES)
+            if not has_tags:
+                # New key, so its prepared statement name differs from the tags version
+                del queries['gen_ai_superpower']
+                queries['gen_ai_superpower_jsonb'] = JSONB_SUPERPOWER_QUERY
+            max_workers = min(len(queries), POOL_MAX_CONNECTIONS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._fetch_ranked_categories,
+                        f"categorical_live_top_n_{dimension}",
+                        f"({sql}) live_summary",
+                        limit
+                    )
+                    for dimension, sql in queries.items()
+                ]
+                rows = [row for future in futures for row in future.result()]
+            rows.sort(key=itemgetter('dimension'))
+        
+        # dimension -> [(category, count), ...] plus per-dimension totals
+        summary = {}
+        totals = {}
+        remainders = {}
+        for dimension, group in groupby(rows, key=itemgetter('dimension')):
+            group = list(group)
+            summary[dimension] = [(row['category'], row['count']) for row in group if not row['is_remainder']]
+            totals[dimension] = (group[0]['n_categories'], group[0]['total_count'])
+            remainders[dimension] = sum(row['count'] for row in group if row['is_remainder'])
+        
+        return {'summary': summary, 'totals': totals, 'remainders': remainders}
+    
+    def _fetch_ranked_categories(self, statement_name: str, summary_source: str, limit: int) -> List[Dict]:
+        """Rank (dimension, category, count) rows from summary_source, ordered by dimension"""
+        with self.db.get_cursor() as cursor:
+            # Top-N rows per truncated dimension plus one remainder row,
+            # prepared once per connection so repeat runs skip planning
+            self.db.execute_prepared(cursor, statement_name, f"""
+                WITH ranked AS (
+                    SELECT 
+                        dimension, category, count,
+                        SUM(count) OVER (PARTITION BY dimension)::bigint as total_count,
+                        COUNT(*) OVER (PARTITION BY dimension) as n_categories,
+                        ROW_NUMBER() OVER (PARTITION BY dimension ORDER BY count DESC) as rn
+                    FROM {summary_source}
+                )
+                SELECT dimension, category, count, total_count, n_categories, rn, FALSE as is_remainder
+                FROM ranked
+                WHERE rn <= $1::int OR dimension <> ALL($2::text[])
+                UNION ALL
+                SELECT dimension, NULL, SUM(count)::bigint, MAX(total_count), MAX(n_categories), $1::int + 1, TRUE
+                FROM ranked
+                WHERE rn > $1::int AND dimension = ANY($2::text[])
+                GROUP BY dimension
+                ORDER BY dimension, rn
+            """, (limit, list(LIMITED_DIMENSIONS)))
+            return cursor.fetchall()
+    
+    def render_categorical_summary(self, data: Dict, limit: int = 15):
+        """Print the report for data returned by fetch_categorical_summary"""
+        summary = data['summary']
+        totals = data['totals']
+        remainders = data['remainders']
+        
+        # Collect the report and write it once instead of one print per line
+        lines = []
+        emit = lines.append
+        
+        emit("📊 COMPREHENSIVE CATEGORICAL DATA ANALYSIS")
+        emit("="*80)
+        
+        # 1. Main table categorical fields
+        emit("\n1️⃣ MAIN TABLE CATEGORICAL FIELDS:")
+        emit("-" * 50)
+        
+        industries = summary.get('industry', [])
+        industry_count, industry_stories = totals.get('industry', (0, 0))
+        emit(f"🏭 INDUSTRY ({industry_count} categories, {industry_stories} stories):")
+        for industry, count in industries:
+            emit(f"   • {industry}: {count} stories")
+        if industry_count > limit:
+            emit(f"   ... and {industry_count - limit} more categories ({remainders['industry']} stories)")
+        
+        sources = summary.get('source', [])
+        emit(f"\n📡 SOURCE ({totals.get('source', (0, 0))[0]} sources):")
+        for source, count in sources:
+            emit(f"   • {source}: {count} stories")
+        
+        ai_types = summary.get('ai_type', [])
+        emit(f"\n🤖 AI TYPE ({totals.get('ai_type', (0, 0))[0]} types):")
+        for ai_type, count in ai_types:
+            emit(f"   • {ai_type}: {count} stories")
+        
+        languages = summary.get('language', [])
+        emit(f"\n🌐 LANGUAGE ({totals.get('language', (0, 0))[0]} languages):")
+        for language, count in languages:
+            emit(f"   • {language}: {count} stories")
+        
+        # 2. Extracted data analysis
+        emit("\n\n2️⃣ EXTRACTED DATA CATEGORICAL FIELDS:")
+        emit("-" * 50)
+        
+        outcomes = summary.get('business_outcome', [])
+        emit(f"📈 BUSINESS OUTCOMES ({totals.get('business_outcome', (0, 0))[0]} unique outcomes):")
+        for outcome, count in outcomes:
+            emit(f"   • {outcome}: {count} stories")
+        
+        units = summary.get('outcome_unit', [])
+        emit(f"\n📏 OUTCOME UNITS ({totals.get('outcome_unit', (0, 0))[0]} units):")
+        for unit, count in units:
+            emit(f"   • {unit}: {count} outcomes")
+        
+        superpowers = summary.get('gen_ai_superpower', [])
+        emit(f"\n⚡ GEN AI SUPERPOWERS ({totals.get('gen_ai_superpower', (0, 0))[0]} unique powers):")
+        for power, count in superpowers:
+            emit(f"   • {power}: {count} stories")
+        
+        # 3. Data quality summary
+        emit("\n\n3️⃣ DATA QUALITY SUMMARY:")
+        emit("-" * 30)
+        
+        quality = dict(summary.get('data_quality', []))
+        total_stories = quality.get('total_stories', 0)
+        genai_stories = quality.get('gen_ai_stories', 0)
+        aileron_stories = quality.get('with_aileron', 0)
+        outcome_stories = quality.get('with_outcomes', 0)
+        
+        emit(f"📊 Total Stories: {total_stories}")
+        emit(f"🤖 Gen AI Stories: {genai_stories} ({genai_stories/total_stories*100:.1f}%)")
+        emit(f"⚡ With Aileron Data: {aileron_stories} ({aileron_stories/genai_stories*100:.1f}% of GenAI)")
+        emit(f"📈 With Business Outcomes: {outcome_stories} ({outcome_stories/total_stories*100:.1f}%)")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def check_story_classifications(self, story_ids: List[int] = None):
         """
@@ -189,18 +303,21 @@ class AnalysisTools:
         print("🔍 CHECKING STORY CLASSIFICATIONS")
         print("="*50)
         
-        with self.db_ops.db.get_cursor() as cursor:
+        with self.db.get_cursor() as cursor:
+            # One round trip for all requested IDs; printed in the order given
+            cursor.execute("""
+                SELECT cs.id, cs.customer_name, s.name as source, cs.is_gen_ai, 
+                       cs.extracted_data->>'ai_type' as ai_type,
+                       CASE WHEN cs.extracted_data ? 'gen_ai_superpowers' THEN 'HAS' ELSE 'MISSING' END as aileron_status,
+                       cs.scraped_date, cs.title
+                FROM customer_stories cs
+                JOIN sources s ON cs.source_id = s.id
+                WHERE cs.id = ANY(%s)
+            """, [list(story_ids)])
+            stories_by_id = {row['id']: row for row in cursor.fetchall()}
+            
             for story_id in story_ids:
-                cursor.execute("""
-                    SELECT id, customer_name, source, is_gen_ai, 
-                           extracted_data->>'ai_type' as ai_type,
-                           CASE WHEN extracted_data->'gen_ai_superpowers' IS NOT NULL THEN 'HAS' ELSE 'MISSING' END as aileron_status,
-                           scraped_date, title
-                    FROM customer_stories
-                    WHERE id = %s
-                """, [story_id])
-                
-                story = cursor.fetchone()
+                story = stories_by_id.get(story_id)
                 if story:
                     print(f"📝 ID {story['id']}: {story['customer_name']}")
                     print(f"   Source: {story['source']}")
@@ -225,15 +342,16 @@ class AnalysisTools:
         print("="*40)
         
         with self.db.get_cursor() as cursor:
-            # Overall language distribution
+            # Overall language distribution, from the detected_language column
+            # written at scrape time (indexed), so nothing is derived from URLs here
             cursor.execute("""
                 SELECT 
-                    language,
+                    detected_language AS language,
                     COUNT(*) as count,
                     ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM customer_stories), 2) as percentage
                 FROM customer_stories 
-                WHERE language IS NOT NULL
-                GROUP BY language 
+                WHERE detected_language IS NOT NULL
+                GROUP BY detected_language 
                 ORDER BY count DESC
             """)
             
@@ -249,10 +367,11 @@ class AnalysisTools:
                 print("-" * 35)
                 
                 cursor.execute("""
-                    SELECT id, customer_name, source, language, title
-                    FROM customer_stories 
-                    WHERE language != 'en' AND language IS NOT NULL
-                    ORDER BY language, source
+                    SELECT cs.id, cs.customer_name, s.name AS source, cs.detected_language AS language, cs.title
+                    FROM customer_stories cs
+                    JOIN sources s ON cs.source_id = s.id
+                    WHERE cs.detected_language != 'English'
+                    ORDER BY cs.detected_language, s.name
                     LIMIT 20
                 """)
                 
@@ -361,57 +480,67 @@ class AnalysisTools:
     
     def analyze_fullstory_issue(self):
         """Analyze potential issues with story processing"""
-        print("🔍 FULL STORY PROCESSING ANALYSIS")
-        print("="*40)
+        # Collect the report and write it once instead of one print per line
+        lines = []
+        emit = lines.append
+        
+        emit("🔍 FULL STORY PROCESSING ANALYSIS")
+        emit("="*40)
         
         with self.db.get_cursor() as cursor:
             # Check for stories with processing issues
             cursor.execute("""
                 SELECT 
-                    source,
+                    s.name as source,
                     COUNT(*) as total_stories,
-                    COUNT(CASE WHEN content IS NULL OR content = '' THEN 1 END) as missing_content,
-                    COUNT(CASE WHEN extracted_data IS NULL THEN 1 END) as missing_extracted_data,
-                    COUNT(CASE WHEN customer_name IS NULL OR customer_name = '' THEN 1 END) as missing_customer,
-                    AVG(LENGTH(content)) as avg_content_length
-                FROM customer_stories
-                GROUP BY source
+                    COUNT(*) FILTER (WHERE cs.is_gen_ai) as gen_ai_stories,
+                    COUNT(*) FILTER (WHERE cs.raw_content->>'text' IS NULL OR cs.raw_content->>'text' = '') as missing_content,
+                    COUNT(*) FILTER (WHERE cs.extracted_data IS NULL) as missing_extracted_data,
+                    COUNT(*) FILTER (WHERE cs.customer_name IS NULL OR cs.customer_name = '') as missing_customer,
+                    AVG(LENGTH(cs.raw_content->>'text')) as avg_content_length
+                FROM customer_stories cs
+                JOIN sources s ON cs.source_id = s.id
+                GROUP BY s.id, s.name
                 ORDER BY total_stories DESC
             """)
             
             source_analysis = cursor.fetchall()
             
-            print("📊 PROCESSING QUALITY BY SOURCE:")
-            print("-" * 35)
+            emit("📊 PROCESSING QUALITY BY SOURCE:")
+            emit("-" * 35)
             
             for row in source_analysis:
                 source = row['source']
                 total = row['total_stories']
+                gen_ai = row['gen_ai_stories'] or 0
                 missing_content = row['missing_content'] or 0
                 missing_data = row['missing_extracted_data'] or 0
                 missing_customer = row['missing_customer'] or 0
                 avg_length = int(row['avg_content_length']) if row['avg_content_length'] else 0
                 
-                print(f"\n{source}: {total} stories")
-                print(f"  Missing content: {missing_content} ({missing_content/total*100:.1f}%)")
-                print(f"  Missing extracted data: {missing_data} ({missing_data/total*100:.1f}%)")
-                print(f"  Missing customer names: {missing_customer} ({missing_customer/total*100:.1f}%)")
-                print(f"  Avg content length: {avg_length:,} chars")
+                emit(f"\n{source}: {total} stories ({gen_ai} Gen AI)")
+                emit(f"  Missing content: {missing_content} ({missing_content/total*100:.1f}%)")
+                emit(f"  Missing extracted data: {missing_data} ({missing_data/total*100:.1f}%)")
+                emit(f"  Missing customer names: {missing_customer} ({missing_customer/total*100:.1f}%)")
+                emit(f"  Avg content length: {avg_length:,} chars")
             
             # Check for very short or very long content
-            print("\n📏 CONTENT LENGTH ANALYSIS:")
-            print("-" * 25)
+            emit("\n📏 CONTENT LENGTH ANALYSIS:")
+            emit("-" * 25)
             
             cursor.execute("""
                 SELECT 
-                    COUNT(CASE WHEN LENGTH(content) < 100 THEN 1 END) as very_short,
-                    COUNT(CASE WHEN LENGTH(content) BETWEEN 100 AND 1000 THEN 1 END) as short,
-                    COUNT(CASE WHEN LENGTH(content) BETWEEN 1000 AND 5000 THEN 1 END) as medium,
-                    COUNT(CASE WHEN LENGTH(content) BETWEEN 5000 AND 20000 THEN 1 END) as long,
-                    COUNT(CASE WHEN LENGTH(content) > 20000 THEN 1 END) as very_long,
+                    COUNT(*) FILTER (WHERE content_length < 100) as very_short,
+                    COUNT(*) FILTER (WHERE content_length BETWEEN 100 AND 1000) as short,
+                    COUNT(*) FILTER (WHERE content_length BETWEEN 1000 AND 5000) as medium,
+                    COUNT(*) FILTER (WHERE content_length BETWEEN 5000 AND 20000) as long,
+                    COUNT(*) FILTER (WHERE content_length > 20000) as very_long,
                     COUNT(*) as total
-                FROM customer_stories
-                WHERE content IS NOT NULL
+                FROM (
+                    SELECT LENGTH(cs.raw_content->>'text') as content_length
+                    FROM customer_stories cs
+                    WHERE cs.raw_content->>'text' IS NOT NULL
+                ) lengths
             """)
             
             length_analysis = cursor.fetchone()
@@ -427,7 +556,9 @@ class AnalysisTools:
             total = length_analysis['total']
             for category, count in categories:
                 pct = (count / total * 100) if total > 0 else 0
-                print(f"  {category}: {count} ({pct:.1f}%)")
+                emit(f"  {category}: {count} ({pct:.1f}%)")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main CLI interface"""
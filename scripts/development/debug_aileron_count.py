@@ -23,7 +23,7 @@ def debug_aileron_counts():
             SELECT COUNT(*) as gen_ai_with_aileron
             FROM customer_stories
             WHERE is_gen_ai = TRUE 
-            AND extracted_data->'gen_ai_superpowers' IS NOT NULL
+            AND extracted_data ? 'gen_ai_superpowers'
         """)
         result1 = cursor.fetchone()
         
@@ -39,7 +39,7 @@ def debug_aileron_counts():
         cursor.execute("""
             SELECT COUNT(*) as total_with_aileron
             FROM customer_stories
-            WHERE extracted_data->'gen_ai_superpowers' IS NOT NULL
+            WHERE extracted_data ? 'gen_ai_superpowers'
         """)
         result3 = cursor.fetchone()
         
@@ -48,7 +48,7 @@ def debug_aileron_counts():
             SELECT id, customer_name, is_gen_ai
             FROM customer_stories
             WHERE is_gen_ai = FALSE 
-            AND extracted_data->'gen_ai_superpowers' IS NOT NULL
+            AND extracted_data ? 'gen_ai_superpowers'
             LIMIT 10
         """)
         non_gen_ai_with_aileron = cursor.fetchall()
@@ -74,7 +74,7 @@ def debug_aileron_counts():
                 COUNT(*) as count
             FROM customer_stories
             WHERE is_gen_ai = TRUE 
-            AND extracted_data->'gen_ai_superpowers' IS NOT NULL
+            AND extracted_data ? 'gen_ai_superpowers'
             GROUP BY superpower
             ORDER BY count DESC
             LIMIT 1
@@ -131,9 +131,8 @@ class InvestigationTools:
                     source,
                     title,
                     scraped_date,
-                    extracted_data,
                     CASE 
-                        WHEN extracted_data->'gen_ai_superpowers' IS NOT NULL THEN 'HAS_SUPERPOWERS'
+                        WHEN extracted_data ? 'gen_ai_superpowers' THEN 'HAS_SUPERPOWERS'
                         ELSE 'MISSING_SUPERPOWERS'
                     END as aileron_status
                 FROM customer_stories 
@@ -289,67 +288,83 @@ class InvestigationTools:
                 for story_id, name in unusual_names[:10]:
                     print(f"ID {story_id}: '{name}'")
     
-    def investigate_high_value_outcomes(self, min_stories: int = 5):
+    def investigate_high_value_outcomes(self, min_stories: int = 5, units: List[str] = None):
         """
         Investigate high-value business outcomes and their patterns
         
         Args:
             min_stories: Minimum number of stories to consider outcome significant
+            units: Only include outcomes measured in these units (e.g. ['percent', 'dollars'])
         """
         print("🔍 INVESTIGATING HIGH-VALUE BUSINESS OUTCOMES")
         print("="*50)
         
-        with self.db_ops.db.get_cursor() as cursor:
-            # Get all business outcomes
+        unit_filter = ""
+        params = []
+        if units:
+            # Containment checks let the GIN index on business_outcomes prune
+            # stories before their arrays are expanded
+            unit_filter = "AND (" + " OR ".join(
+                ["cs.extracted_data->'business_outcomes' @> %s::jsonb"] * len(units)
+            ) + ") AND outcome->>'unit' = ANY(%s)"
+            params = [json.dumps([{'unit': unit}]) for unit in units] + [list(units)]
+        
+        # Stream rows through a server-side cursor so memory stays bounded by
+        # itersize rather than the number of stories with outcomes
+        with self.db_ops.db.get_cursor(name='high_value_outcomes', itersize=5000) as cursor:
+            # One row per outcome, expanded and typed in SQL: the outcome
+            # label (object 'type' or plain string) and its value when numeric
             cursor.execute("""
                 SELECT 
-                    id,
-                    customer_name,
-                    source,
-                    extracted_data->>'business_outcomes' as outcomes,
-                    extracted_data->>'ai_type' as ai_type,
-                    is_gen_ai
-                FROM customer_stories 
-                WHERE extracted_data->>'business_outcomes' IS NOT NULL
-                AND extracted_data->>'business_outcomes' != '[]'
-                AND extracted_data->>'business_outcomes' != 'null'
-                ORDER BY source, customer_name
-            """)
-            
-            stories = cursor.fetchall()
-            
-            print(f"Found {len(stories)} stories with business outcomes data")
-            
-            # Parse and count outcomes
+                    cs.id,
+                    s.name as source,
+                    cs.extracted_data->>'ai_type' as ai_type,
+                    cs.is_gen_ai,
+                    CASE WHEN jsonb_typeof(outcome) = 'string'
+                         THEN outcome #>> '{}'
+                         ELSE outcome->>'type' END as outcome,
+                    CASE WHEN outcome->>'value' ~ '^[0-9]+[.]?[0-9]*$'
+                         THEN (outcome->>'value')::numeric END as numeric_value
+                FROM customer_stories cs
+                JOIN sources s ON cs.source_id = s.id
+                CROSS JOIN LATERAL jsonb_array_elements(cs.extracted_data->'business_outcomes') AS outcome
+                WHERE jsonb_typeof(cs.extracted_data->'business_outcomes') = 'array'
+                """ + unit_filter + """
+                ORDER BY s.name, cs.customer_name
+            """, params)
+            
+            # Count outcomes as rows stream in
+            story_ids = set()
             outcome_counts = {}
+            quantified_counts = {}
             outcome_by_source = {}
             outcome_by_ai_type = {}
             
-            for story in stories:
-                try:
-                    outcomes_str = story['outcomes']
-                    if outcomes_str:
-                        outcomes = json.loads(outcomes_str)
-                        if isinstance(outcomes, list):
-                            for outcome in outcomes:
-                                if outcome and isinstance(outcome, str):
-                                    # Overall counts
-                                    outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
-                                    
-                                    # By source
-                                    source = story['source']
-                                    if source not in outcome_by_source:
-                                        outcome_by_source[source] = {}
-                                    outcome_by_source[source][outcome] = outcome_by_source[source].get(outcome, 0) + 1
-                                    
-                                    # By AI type
-                                    ai_type = story['ai_type'] or ('Gen AI' if story['is_gen_ai'] else 'Traditional')
-                                    if ai_type not in outcome_by_ai_type:
-                                        outcome_by_ai_type[ai_type] = {}
-                                    outcome_by_ai_type[ai_type][outcome] = outcome_by_ai_type[ai_type].get(outcome, 0) + 1
-                
-                except (json.JSONDecodeError, TypeError) as e:
+            for row in cursor:
+                story_ids.add(row['id'])
+                outcome = row['outcome']
+                if not outcome:
                     continue
+                
+                # Overall counts
+                outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
+                if row['numeric_value'] is not None:
+                    quantified_counts[outcome] = quantified_counts.get(outcome, 0) + 1
+                
+                # By source
+                source = row['source']
+                if source not in outcome_by_source:
+                    outcome_by_source[source] = {}
+                outcome_by_source[source][outcome] = outcome_by_source[source].get(outcome, 0) + 1
+                
+                # By AI type
+                ai_type = row['ai_type'] or ('Gen AI' if row['is_gen_ai'] else 'Traditional')
+                if ai_type not in outcome_by_ai_type:
+                    outcome_by_ai_type[ai_type] = {}
+                outcome_by_ai_type[ai_type][outcome] = outcome_by_ai_type[ai_type].get(outcome, 0) + 1
+            
+            story_count = len(story_ids)
+            print(f"Found {story_count} stories with business outcomes data")
             
             # Show high-value outcomes
             print("\n📊 TOP BUSINESS OUTCOMES")
@@ -358,8 +373,9 @@ class InvestigationTools:
             
             for outcome, count in sorted_outcomes:
                 if count >= min_stories:
-                    pct = (count / len(stories) * 100) if stories else 0
-                    print(f"{outcome}: {count} stories ({pct:.1f}%)")
+                    pct = (count / story_count * 100) if story_count else 0
+                    quantified = quantified_counts.get(outcome, 0)
+                    print(f"{outcome}: {count} stories ({pct:.1f}%), {quantified} with numeric values")
             
             # Show breakdown by source for top outcomes
             print("\n📊 TOP OUTCOMES BY SOURCE")
@@ -414,7 +430,9 @@ def main():
     elif choice == '4':
         min_stories = input("Minimum stories for significant outcome (default: 5): ").strip()
         min_stories = int(min_stories) if min_stories.isdigit() else 5
-        tools.investigate_high_value_outcomes(min_stories=min_stories)
+        units_input = input("Units to include (comma-separated, press Enter for all): ").strip()
+        units = [u.strip() for u in units_input.split(',') if u.strip()] or None
+        tools.investigate_high_value_outcomes(min_stories=min_stories, units=units)
     else:
         print("Invalid choice")
 
@@ -6,7 +6,6 @@ Unified interface for all classification fixes and maintenance operations
 
 import sys
 import os
-import json
 import re
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
@@ -103,6 +102,11 @@ class MaintenanceTools:
                 print(f"✅ Fixed {changes_made} inconsistencies")
             elif dry_run:
                 print("🔍 Dry run complete. Use dry_run=False to apply changes.")
+        
+        # Keep the dashboard summaries (source_summary, aileron_summary)
+        # in line with the rewritten stories
+        if not dry_run and changes_made > 0:
+            self.db_ops.refresh_summary_views()
                 
     def fix_google_cloud_classifications(self, dry_run=True):
         """Fix Google Cloud story classifications using enhanced logic"""
@@ -113,12 +117,13 @@ class MaintenanceTools:
             
             # Get Google Cloud stories that need classification
             cursor.execute("""
-                SELECT id, customer_name, content, extracted_data 
-                FROM customer_stories 
-                WHERE source = 'Google Cloud' 
-                AND (extracted_data->>'ai_type' IS NULL 
-                     OR extracted_data->>'ai_type' = '')
-                ORDER BY id
+                SELECT cs.id, cs.customer_name, cs.raw_content->>'text' as content
+                FROM customer_stories cs
+                JOIN sources s ON s.id = cs.source_id
+                WHERE s.name = 'Google Cloud' 
+                AND (cs.extracted_data->>'ai_type' IS NULL 
+                     OR cs.extracted_data->>'ai_type' = '')
+                ORDER BY cs.id
             """)
             
             stories = cursor.fetchall()
@@ -140,15 +145,14 @@ class MaintenanceTools:
                 print(f"   Classification: {ai_type.upper()}")
                 
                 if not dry_run:
-                    # Update the story
-                    extracted_data = story['extracted_data'] or {}
-                    extracted_data['ai_type'] = ai_type
-                    
+                    # Update the story, setting ai_type in place rather than
+                    # round-tripping the whole extracted_data document
                     cursor.execute("""
                         UPDATE customer_stories 
-                        SET is_gen_ai = %s, extracted_data = %s
+                        SET is_gen_ai = %s,
+                            extracted_data = jsonb_set(COALESCE(extracted_data, '{}'::jsonb), '{ai_type}', to_jsonb(%s::text))
                         WHERE id = %s
-                    """, [is_genai, json.dumps(extracted_data), story_id])
+                    """, [is_genai, ai_type, story_id])
                     
                     changes_made += 1
                     print(f"   ✅ Updated")
@@ -159,6 +163,9 @@ class MaintenanceTools:
                 print(f"\n✅ Updated {changes_made} Google Cloud stories")
             elif dry_run:
                 print("\n🔍 Dry run complete. Use dry_run=False to apply changes.")
+        
+        if not dry_run and changes_made > 0:
+            self.db_ops.refresh_summary_views()
     
     def fix_customer_names(self, source="Google Cloud", dry_run=True):
         """Fix customer names with special characters or formatting issues"""
@@ -212,6 +219,9 @@ class MaintenanceTools:
                 print(f"\n✅ Updated {changes_made} customer names")
             elif dry_run:
                 print("\n🔍 Dry run complete. Use dry_run=False to apply changes.")
+        
+        if not dry_run and changes_made > 0:
+            self.db_ops.refresh_summary_views()
     
     def fix_business_outcomes_filtering(self, dry_run=True):
         """Fix business outcomes that may have filtering issues"""
@@ -266,6 +276,9 @@ class MaintenanceTools:
                 print(f"\n✅ Updated {changes_made} business outcomes")
             elif dry_run:
                 print("\n🔍 Dry run complete. Use dry_run=False to apply changes.")
+        
+        if not dry_run and changes_made > 0:
+            self.db_ops.refresh_summary_views()
     
     def _contains_genai_indicators(self, content: str) -> bool:
         """Check if content contains definitive GenAI indicators"""
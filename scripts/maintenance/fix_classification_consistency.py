@@ -75,13 +75,16 @@ def fix_classification_consistency():
             SELECT COUNT(*) as count  
             FROM customer_stories
             WHERE is_gen_ai = TRUE 
-            AND extracted_data->'gen_ai_superpowers' IS NOT NULL
+            AND extracted_data ? 'gen_ai_superpowers'
         """)
         gen_ai_with_aileron = cursor.fetchone()['count']
         
         print(f"Gen AI stories: {gen_ai_count}")
         print(f"Gen AI with Aileron: {gen_ai_with_aileron}")
         print(f"Missing Aileron: {gen_ai_count - gen_ai_with_aileron}")
+    
+    # Keep the dashboard summaries in line with the new classifications
+    db_ops.refresh_summary_views()
 
 if __name__ == "__main__":
     fix_classification_consistency()
\ No newline at end of file
@@ -242,6 +242,10 @@ class IndustryMigrator:
                     logger.error(error_msg)
                     results['errors'].append(error_msg)
             
+            # Keep the dashboard summaries in line with the new industries
+            if not self.dry_run and results['successful_updates']:
+                self.db_ops.refresh_summary_views()
+            
             results['completed_at'] = datetime.now().isoformat()
             logger.info(f"Migration completed: {results['successful_updates']} updates, "
                        f"{results['skipped_low_confidence']} skipped, {len(results['errors'])} errors")
@@ -314,8 +318,12 @@ class IndustryMigrator:
                 
                 rollback_results['completed_at'] = datetime.now().isoformat()
                 logger.info(f"Rollback completed: {rollback_results['successful_rollbacks']} records restored")
-                
-                return rollback_results
+            
+            # Refresh once the restored industries are committed
+            if rollback_results['successful_rollbacks']:
+                self.db_ops.refresh_summary_views()
+            
+            return rollback_results
                 
         except Exception as e:
             logger.error(f"Rollback failed: {e}")
@@ -172,6 +172,10 @@ class SimpleIndustryMigrator:
             logger.error(f"Migration failed: {e}")
             results['errors'].append(str(e))
         
+        # Keep the dashboard summaries in line with the new industries
+        if not dry_run and results['updated']:
+            self.db_ops.refresh_summary_views()
+        
         return results
 
 
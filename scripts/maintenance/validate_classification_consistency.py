@@ -114,7 +114,7 @@ def validate_all_classifications():
         
         cursor.execute("""
             SELECT COUNT(*) as count FROM customer_stories 
-            WHERE is_gen_ai = TRUE AND extracted_data->'gen_ai_superpowers' IS NOT NULL
+            WHERE is_gen_ai = TRUE AND extracted_data ? 'gen_ai_superpowers'
         """)
         gen_ai_with_aileron = cursor.fetchone()['count']
         
@@ -122,6 +122,10 @@ def validate_all_classifications():
         print(f"  Gen AI stories: {gen_ai_count}")
         print(f"  Gen AI with Aileron data: {gen_ai_with_aileron}")
         print(f"  Missing Aileron data: {gen_ai_count - gen_ai_with_aileron}")
+    
+    # Keep the dashboard summaries in line with the new classifications
+    if fixes_applied > 0:
+        db_ops.refresh_summary_views()
 
 if __name__ == "__main__":
     validate_all_classifications()
\ No newline at end of file
@@ -18,13 +18,16 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'core'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
-from src.dashboard.core.data_processor import apply_chart_formatting, get_svg_export_config
+from src.dashboard.core.data_processor import (
+    apply_chart_formatting, get_svg_export_config, explode_extracted_list, category_counts,
+    extracted_field, extracted_records, extracted_pairs
+)
 from src.dashboard.core.brand_styles import PLOTLY_COLOR_SCHEMES, get_plotly_theme
 
 
 def create_industry_pie_chart(df: pd.DataFrame, title: str = "Industry Distribution", top_n: int = 10) -> go.Figure:
     """Create industry distribution pie chart with customizable display options"""
-    industry_counts = df['industry'].value_counts().head(top_n)
+    industry_counts = category_counts(df['industry']).head(top_n)
     
     fig = px.pie(
         values=industry_counts.values,
@@ -50,24 +53,8 @@ def create_source_bar_chart(source_stats: Dict, title: str = "Stories by AI Prov
 
 def create_technology_usage_chart(df: pd.DataFrame, title: str = "Technology Usage", top_n: int = 15) -> go.Figure:
     """Create technology usage analysis chart"""
-    # Extract technologies from stories
-    all_technologies = []
-    tech_by_source = {}
-    
-    for _, row in df.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            techs = row['extracted_data'].get('technologies_used', [])
-            if isinstance(techs, list):
-                source = row['source_name']
-                if source not in tech_by_source:
-                    tech_by_source[source] = {}
-                
-                for tech in techs:
-                    all_technologies.append(tech)
-                    tech_by_source[source][tech] = tech_by_source[source].get(tech, 0) + 1
-    
     # Get top technologies
-    tech_counts = pd.Series(all_technologies).value_counts().head(top_n)
+    tech_counts = explode_extracted_list(df, 'technologies_used').value_counts().head(top_n)
     
     fig = px.bar(x=tech_counts.values, y=tech_counts.index, orientation='h')
     apply_chart_formatting(fig, title)
@@ -78,19 +65,10 @@ def create_technology_usage_chart(df: pd.DataFrame, title: str = "Technology Usa
 
 def create_business_outcomes_chart(df: pd.DataFrame, title: str = "Business Outcomes Analysis") -> go.Figure:
     """Create business outcomes visualization"""
-    outcomes = []
-    
-    for _, row in df.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            business_outcomes = row['extracted_data'].get('quantified_business_outcomes', [])
-            if isinstance(business_outcomes, list):
-                for outcome in business_outcomes:
-                    if isinstance(outcome, dict):
-                        outcomes.append({
-                            **outcome,
-                            'customer': row['customer_name'],
-                            'source': row['source_name']
-                        })
+    outcomes = extracted_records(df, 'quantified_business_outcomes', {
+        'customer_name': 'customer',
+        'source_name': 'source'
+    })
     
     if not outcomes:
         # Create empty chart with message
@@ -116,26 +94,9 @@ def create_business_outcomes_chart(df: pd.DataFrame, title: str = "Business Outc
 
 def create_cross_analysis_heatmap(df: pd.DataFrame, dim1: str, dim2: str, title: str) -> go.Figure:
     """Create cross-analysis heatmap between two dimensions"""
-    cross_data = []
-    
-    for _, row in df.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            dim1_values = row['extracted_data'].get(dim1, [])
-            dim2_values = row['extracted_data'].get(dim2, [])
-            
-            # Handle single values vs lists
-            if not isinstance(dim1_values, list):
-                dim1_values = [dim1_values] if dim1_values else []
-            if not isinstance(dim2_values, list):
-                dim2_values = [dim2_values] if dim2_values else []
-            
-            # Create cross-combinations
-            for val1 in dim1_values:
-                for val2 in dim2_values:
-                    if val1 and val2:
-                        cross_data.append({dim1: val1, dim2: val2})
+    cross_df = extracted_pairs(df, dim1, dim2)
     
-    if not cross_data:
+    if cross_df.empty:
         fig = go.Figure()
         fig.add_annotation(
             text="No cross-analysis data available",
@@ -145,7 +106,6 @@ def create_cross_analysis_heatmap(df: pd.DataFrame, dim1: str, dim2: str, title:
         apply_chart_formatting(fig, title)
         return fig
     
-    cross_df = pd.DataFrame(cross_data)
     cross_matrix = cross_df.groupby([dim1, dim2]).size().unstack(fill_value=0)
     
     fig = px.imshow(
@@ -160,25 +120,19 @@ def create_cross_analysis_heatmap(df: pd.DataFrame, dim1: str, dim2: str, title:
     return fig
 
 
+def _path_level(value: Any) -> str:
+    """Sunburst label for a field: the first item of a list, else the value"""
+    if isinstance(value, list) and value:
+        return value[0]
+    return str(value) if value else "Unknown"
+
+
 def create_sunburst_chart(df: pd.DataFrame, dimensions: List[str], title: str) -> go.Figure:
     """Create sunburst chart for hierarchical data analysis"""
-    # Prepare hierarchical data
-    paths = []
-    
-    for _, row in df.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            path_values = []
-            for dim in dimensions:
-                value = row['extracted_data'].get(dim)
-                if isinstance(value, list) and value:
-                    path_values.append(value[0])  # Take first value if list
-                elif value:
-                    path_values.append(str(value))
-                else:
-                    path_values.append("Unknown")
-            
-            if len(path_values) == len(dimensions):
-                paths.append(" / ".join(path_values))
+    # Prepare hierarchical data: one path per story with extracted data
+    stories = df.loc[df['extracted_data'].map(lambda data: isinstance(data, dict))]
+    levels = [extracted_field(stories, dim).map(_path_level) for dim in dimensions]
+    paths = [" / ".join(path_values) for path_values in zip(*levels)]
     
     if not paths:
         fig = go.Figure()
@@ -252,17 +206,15 @@ def create_metric_cards(stats: Dict[str, Any], columns: int = 4) -> None:
 
 def create_timeline_chart(df: pd.DataFrame, title: str = "Story Timeline") -> go.Figure:
     """Create timeline chart showing story publication over time"""
-    # Filter valid dates
-    df_dates = df.dropna(subset=['publish_date']).copy()
-    df_dates['publish_date'] = pd.to_datetime(df_dates['publish_date'])
-    df_dates['year_month'] = df_dates['publish_date'].dt.to_period('M')
-    
-    timeline_counts = df_dates.groupby('year_month').size()
+    # Filter valid dates (publish_date is converted to datetime at load time)
+    publish_dates = df['publish_date'].dropna()
+    timeline_counts = publish_dates.dt.to_period('M').value_counts().sort_index()
     
     fig = px.line(
         x=timeline_counts.index.astype(str),
         y=timeline_counts.values,
-        title=title
+        title=title,
+        render_mode='webgl'
     )
     
     apply_chart_formatting(fig, title)
@@ -4,6 +4,8 @@ Brand Styling Configuration for AI Customer Stories Dashboard
 Integrates company brand colors and Montserrat font
 """
 
+import functools
+import re
 import streamlit as st
 
 # Brand Color Palette
@@ -36,12 +38,18 @@ PLOTLY_COLOR_SCHEMES = {
     'brand_continuous': [[0, BRAND_COLORS['light_gray']], [0.5, BRAND_COLORS['light_blue']], [1, BRAND_COLORS['primary_blue']]]
 }
 
-def apply_brand_styling():
-    """Apply custom brand styling to Streamlit dashboard"""
-    st.markdown(f"""
+# Montserrat is loaded with <link> tags rather than a CSS @import, so the
+# browser can open the font connections early and fetch the font stylesheet
+# in parallel instead of only after parsing the brand stylesheet
+_FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;500;600;700&display=swap">'
+)
+
+# Brand stylesheet, formatted once at import instead of on every Streamlit rerun
+_BRAND_CSS = f"""
     <style>
-        @import url('https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;500;600;700&display=swap');
-        
         /* Global Font */
         html, body, [class*="css"] {{
             font-family: 'Montserrat', sans-serif;
@@ -53,32 +61,56 @@ def apply_brand_styling():
             padding-bottom: 2rem;
         }}
         
-        /* Sidebar Styling */
-        .css-1d391kg {{
-            background-color: {BRAND_COLORS['primary_dark']};
+        /* Main Title */
+        h1 {{
+            color: {BRAND_COLORS['primary_dark']} !important;
+            font-weight: 600;
+            border-bottom: 3px solid {BRAND_COLORS['primary_blue']};
+            padding-bottom: 10px;
         }}
         
-        .css-1d391kg .css-17eq0hr {{
-            color: {BRAND_COLORS['text_light']};
+        /* Branded header (branded_header level 1) */
+        .brand-h1 {{
+            margin-bottom: 20px;
+            font-family: 'Montserrat', sans-serif;
         }}
         
-        /* Sidebar Title */
-        .css-1d391kg h1 {{
-            color: {BRAND_COLORS['text_light']} !important;
-            font-weight: 600;
+        /* Branded subheaders (branded_header level 2+) */
+        .brand-hN {{
+            color: {BRAND_COLORS['primary_dark']};
+            font-weight: 500;
+            margin-top: 1.5rem;
+            margin-bottom: 1rem;
+            font-family: 'Montserrat', sans-serif;
         }}
         
-        /* Sidebar Selectbox */
-        .css-1d391kg .stSelectbox > label {{
-            color: {BRAND_COLORS['text_light']} !important;
+        /* Branded metric (branded_metric) */
+        .brand-metric {{
+            background-color: {BRAND_COLORS['light_gray']};
+            border: 1px solid {BRAND_COLORS['light_blue']};
+            padding: 1rem;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(45, 32, 66, 0.1);
+            text-align: center;
         }}
         
-        /* Main Title */
-        h1 {{
-            color: {BRAND_COLORS['primary_dark']} !important;
+        .brand-metric__label {{
+            color: {BRAND_COLORS['primary_dark']};
+            font-size: 0.9rem;
+            font-weight: 500;
+            margin-bottom: 4px;
+        }}
+        
+        .brand-metric__value {{
+            color: {BRAND_COLORS['primary_blue']};
+            font-size: 2rem;
             font-weight: 600;
-            border-bottom: 3px solid {BRAND_COLORS['primary_blue']};
-            padding-bottom: 10px;
+        }}
+        
+        .brand-metric__delta {{
+            color: {BRAND_COLORS['primary_blue']};
+            font-size: 0.8rem;
+            margin-top: 4px;
         }}
         
         /* Subheaders */
@@ -106,7 +138,7 @@ def apply_brand_styling():
         }}
         
         /* Buttons */
-        .stButton > button {{
+        .stButton > button, .stDownloadButton > button {{
             background-color: {BRAND_COLORS['primary_blue']};
             color: {BRAND_COLORS['text_light']};
             border: none;
@@ -115,44 +147,13 @@ def apply_brand_styling():
             font-family: 'Montserrat', sans-serif;
         }}
         
-        .stButton > button:hover {{
+        .stButton > button:hover, .stDownloadButton > button:hover {{
             background-color: {BRAND_COLORS['primary_dark']};
             color: {BRAND_COLORS['text_light']};
         }}
         
-        /* Download Button */
-        .stDownloadButton > button {{
-            background-color: {BRAND_COLORS['primary_blue']};
-            color: {BRAND_COLORS['text_light']};
-            border: none;
-            border-radius: 6px;
-            font-weight: 500;
-        }}
-        
-        .stDownloadButton > button:hover {{
-            background-color: {BRAND_COLORS['primary_dark']};
-        }}
-        
-        /* Radio Buttons */
-        .stRadio > label {{
-            color: {BRAND_COLORS['primary_dark']} !important;
-            font-weight: 500;
-        }}
-        
-        /* Selectbox */
-        .stSelectbox > label {{
-            color: {BRAND_COLORS['primary_dark']} !important;
-            font-weight: 500;
-        }}
-        
-        /* Text Input */
-        .stTextInput > label {{
-            color: {BRAND_COLORS['primary_dark']} !important;
-            font-weight: 500;
-        }}
-        
-        /* Multiselect */
-        .stMultiSelect > label {{
+        /* Widget Labels */
+        .stRadio > label, .stSelectbox > label, .stTextInput > label, .stMultiSelect > label {{
             color: {BRAND_COLORS['primary_dark']} !important;
             font-weight: 500;
         }}
@@ -209,73 +210,65 @@ def apply_brand_styling():
         }}
         
     </style>
-    """, unsafe_allow_html=True)
+    """
 
-def get_brand_color_discrete_map(categories):
-    """Generate brand-consistent discrete color mapping for categories"""
-    colors = [BRAND_COLORS['primary_blue'], BRAND_COLORS['primary_dark'], 
-              BRAND_COLORS['light_blue'], '#8E8E93', '#FF9500', '#FF3B30']
-    
-    return {cat: colors[i % len(colors)] for i, cat in enumerate(categories)}
+def _minify_css(css):
+    """Strip comments and whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
 
-def get_plotly_theme():
-    """Return Plotly theme configuration matching brand"""
-    return {
-        'layout': {
-            'font': {'family': 'Montserrat, sans-serif', 'color': BRAND_COLORS['primary_dark']},
-            'colorway': PLOTLY_COLOR_SCHEMES['primary_discrete'],
-            'paper_bgcolor': BRAND_COLORS['white'],
-            'plot_bgcolor': BRAND_COLORS['light_gray'],
-            'title': {
-                'font': {'size': 18, 'color': BRAND_COLORS['primary_dark'], 'family': 'Montserrat'}
-            }
+_BRAND_CSS_MIN = _minify_css(_BRAND_CSS)
+_BRAND_HEAD = _FONT_LINKS + _BRAND_CSS_MIN
+
+def apply_brand_styling():
+    """Apply custom brand styling to Streamlit dashboard"""
+    st.markdown(_BRAND_HEAD, unsafe_allow_html=True)
+
+# Discrete category colors and Plotly theme, resolved from BRAND_COLORS once
+# at import instead of on every chart render
+_DISCRETE_COLORS = (BRAND_COLORS['primary_blue'], BRAND_COLORS['primary_dark'],
+                    BRAND_COLORS['light_blue'], '#8E8E93', '#FF9500', '#FF3B30')
+
+_PLOTLY_THEME = {
+    'layout': {
+        'font': {'family': 'Montserrat, sans-serif', 'color': BRAND_COLORS['primary_dark']},
+        'colorway': PLOTLY_COLOR_SCHEMES['primary_discrete'],
+        'paper_bgcolor': BRAND_COLORS['white'],
+        'plot_bgcolor': BRAND_COLORS['light_gray'],
+        'title': {
+            'font': {'size': 18, 'color': BRAND_COLORS['primary_dark'], 'family': 'Montserrat'}
         }
     }
+}
+
+@functools.lru_cache(maxsize=128)
+def _discrete_color_map(categories):
+    return {cat: _DISCRETE_COLORS[i % len(_DISCRETE_COLORS)] for i, cat in enumerate(categories)}
+
+def get_brand_color_discrete_map(categories):
+    """Generate brand-consistent discrete color mapping for categories (shared, do not modify)"""
+    return _discrete_color_map(tuple(categories))
+
+def get_plotly_theme():
+    """Return Plotly theme configuration matching brand (shared, do not modify)"""
+    return _PLOTLY_THEME
 
 # Custom branded components
 def branded_metric(label, value, delta=None, help=None):
     """Create a branded metric display"""
-    delta_html = f'<div style="color: {BRAND_COLORS["primary_blue"]}; font-size: 0.8rem; margin-top: 4px;">{delta}</div>' if delta else ''
+    delta_html = f'<div class="brand-metric__delta">{delta}</div>' if delta else ''
     
-    return st.markdown(f"""
-    <div style="
-        background-color: {BRAND_COLORS['light_gray']};
-        border: 1px solid {BRAND_COLORS['light_blue']};
-        padding: 1rem;
-        border-radius: 8px;
-        box-shadow: 0 2px 4px rgba(45, 32, 66, 0.1);
-        text-align: center;
-    ">
-        <div style="color: {BRAND_COLORS['primary_dark']}; font-size: 0.9rem; font-weight: 500; margin-bottom: 4px;">
-            {label}
-        </div>
-        <div style="color: {BRAND_COLORS['primary_blue']}; font-size: 2rem; font-weight: 600;">
-            {value}
-        </div>
-        {delta_html}
-    </div>
-    """, unsafe_allow_html=True)
+    return st.markdown(
+        f'<div class="brand-metric"><div class="brand-metric__label">{label}</div>'
+        f'<div class="brand-metric__value">{value}</div>{delta_html}</div>',
+        unsafe_allow_html=True
+    )
 
 def branded_header(text, level=1):
     """Create a branded header with consistent styling"""
     if level == 1:
-        return st.markdown(f"""
-        <h1 style="
-            color: {BRAND_COLORS['primary_dark']};
-            font-weight: 600;
-            border-bottom: 3px solid {BRAND_COLORS['primary_blue']};
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-            font-family: 'Montserrat', sans-serif;
-        ">{text}</h1>
-        """, unsafe_allow_html=True)
+        return st.markdown(f'<h1 class="brand-h1">{text}</h1>', unsafe_allow_html=True)
     else:
-        return st.markdown(f"""
-        <h{level} style="
-            color: {BRAND_COLORS['primary_dark']};
-            font-weight: 500;
-            margin-top: 1.5rem;
-            margin-bottom: 1rem;
-            font-family: 'Montserrat', sans-serif;
-        ">{text}</h{level}>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+        return st.markdown(f'<h{level} class="brand-hN">{text}</h{level}>', unsafe_allow_html=True)
\ No newline at end of file
@@ -29,6 +29,9 @@ DASHBOARD_PAGES = [
     "💾 Data Export"
 ]
 
+# Story Explorer results per page
+EXPLORER_PAGE_SIZE = 25
+
 # Filter options
 COMPANY_SIZES = ['startup', 'mid-market', 'enterprise', 'government']
 
@@ -6,13 +6,14 @@ Handles all database operations with caching for optimal performance
 
 import streamlit as st
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 import sys
 import os
 
 # Add src directory to path for database imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from database.models import DatabaseOperations
+from src.dashboard.core.data_processor import extracted_field, explode_extracted_list, extracted_records, technology_pair_counts
 
 
 @st.cache_resource
@@ -21,165 +22,379 @@ def get_database_connection():
     return DatabaseOperations()
 
 
+# Columns the dashboard reads. raw_content holds the full scraped page and
+# is never read by the dashboard, so it is kept out of the transfer
+STORY_COLUMNS = """
+    cs.id,
+    cs.source_id,
+    cs.customer_name,
+    cs.title,
+    cs.url,
+    cs.industry,
+    cs.company_size,
+    cs.use_case_category,
+    cs.extracted_data,
+    cs.scraped_date,
+    cs.publish_date,
+    cs.publish_date_estimated,
+    cs.is_gen_ai,
+    cs.detected_language,
+    CASE WHEN jsonb_typeof(cs.extracted_data->'content_quality_score') = 'number'
+        THEN (cs.extracted_data->>'content_quality_score')::float
+    END as quality_score,
+    s.name as source_name,
+    EXTRACT(YEAR FROM cs.publish_date) as publish_year,
+    EXTRACT(MONTH FROM cs.publish_date) as publish_month
+"""
+
+# Story columns stored as pandas categoricals by load_all_stories()
+CATEGORY_COLUMNS = ('source_name', 'industry', 'company_size')
+
+
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def load_all_stories() -> pd.DataFrame:
     """Load all stories into a pandas DataFrame"""
     db_ops = get_database_connection()
     
-    with db_ops.db.get_cursor() as cursor:
-        cursor.execute("""
-            SELECT 
-                cs.*,
-                s.name as source_name,
-                EXTRACT(YEAR FROM cs.publish_date) as publish_year,
-                EXTRACT(MONTH FROM cs.publish_date) as publish_month
+    # Server-side cursor: rows arrive in batches of itersize as the frame
+    # is built, instead of the whole result set being fetched up front
+    with db_ops.db.get_cursor(name='dashboard_stories', itersize=10000) as cursor:
+        cursor.execute(f"""
+            SELECT {STORY_COLUMNS}
             FROM customer_stories cs
             JOIN sources s ON cs.source_id = s.id
             ORDER BY cs.scraped_date DESC
         """)
         
+        df = pd.DataFrame.from_records(cursor)
+    
+    # Convert once here, inside the cache, rather than on every page render
+    if 'publish_date' in df.columns:
+        df['publish_date'] = pd.to_datetime(df['publish_date'], errors='coerce')
+    # Low-cardinality labels repeat on every row, so store them as categoricals
+    # (count them with category_counts() to skip unused categories)
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    return df
+
+
+def _story_filter_sql(source_name: Optional[str], industry: Optional[str], company_size: Optional[str],
+                      is_gen_ai: Optional[bool], search: Optional[str]) -> Tuple[str, List]:
+    """Build the WHERE clause and parameters for the Story Explorer filters"""
+    conditions = []
+    params = []
+    
+    if source_name:
+        conditions.append("s.name = %s")
+        params.append(source_name)
+    if industry:
+        conditions.append("cs.industry = %s")
+        params.append(industry)
+    if company_size:
+        conditions.append("cs.company_size = %s")
+        params.append(company_size)
+    if is_gen_ai is not None:
+        conditions.append("cs.is_gen_ai = %s")
+        params.append(is_gen_ai)
+    if search:
+        # Full-text match (GIN index on search_vector), plus a literal
+        # case-insensitive substring match on customer name, title and
+        # industry (trigram GIN index idx_customer_stories_trgm)
+        pattern = '%' + search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        conditions.append(
+            "(cs.search_vector @@ plainto_tsquery('english', %s)"
+            " OR cs.customer_name ILIKE %s OR cs.title ILIKE %s OR cs.industry ILIKE %s)"
+        )
+        params.extend([search, pattern, pattern, pattern])
+    
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where, params
+
+
+@st.cache_data(ttl=300)
+def count_stories(source_name: Optional[str] = None, industry: Optional[str] = None,
+                  company_size: Optional[str] = None, is_gen_ai: Optional[bool] = None,
+                  search: Optional[str] = None) -> int:
+    """Count the stories matching the Story Explorer filters (None means no filter)"""
+    db_ops = get_database_connection()
+    where, params = _story_filter_sql(source_name, industry, company_size, is_gen_ai, search)
+    
+    with db_ops.db.get_cursor() as cursor:
+        cursor.execute(f"""
+            SELECT COUNT(*) as count
+            FROM customer_stories cs
+            JOIN sources s ON cs.source_id = s.id
+            {where}
+        """, params)
+        return cursor.fetchone()['count']
+
+
+@st.cache_data(ttl=300)
+def query_stories(source_name: Optional[str] = None, industry: Optional[str] = None,
+                  company_size: Optional[str] = None, is_gen_ai: Optional[bool] = None,
+                  search: Optional[str] = None, offset: int = 0, limit: int = 25) -> pd.DataFrame:
+    """Load one page of the stories matching the Story Explorer filters
+    
+    Filters left as None are not applied; search matches full-text or as
+    a substring of the customer name, title or industry.
+    Stories come newest-scraped first, like load_all_stories().
+    """
+    db_ops = get_database_connection()
+    where, params = _story_filter_sql(source_name, industry, company_size, is_gen_ai, search)
+    
+    with db_ops.db.get_cursor() as cursor:
+        cursor.execute(f"""
+            SELECT {STORY_COLUMNS}
+            FROM customer_stories cs
+            JOIN sources s ON cs.source_id = s.id
+            {where}
+            ORDER BY cs.scraped_date DESC, cs.id
+            LIMIT %s OFFSET %s
+        """, params + [limit, offset])
+        
         rows = cursor.fetchall()
         return pd.DataFrame(rows)
 
 
+# Live equivalent of the source_summary materialized view, used when the
+# view has not been created (see 008_add_source_summary_view.sql)
+SOURCE_STATS_QUERY = """
+    SELECT 
+        s.name,
+        COUNT(cs.id) as story_count,
+        MIN(cs.publish_date) as earliest_story,
+        MAX(cs.publish_date) as latest_story,
+        COUNT(CASE WHEN cs.publish_date_estimated = TRUE THEN 1 END) as estimated_dates,
+        AVG(CASE 
+            WHEN cs.extracted_data ? 'content_quality_score' 
+            THEN (cs.extracted_data->>'content_quality_score')::float 
+            ELSE NULL 
+        END) as avg_quality_score
+    FROM sources s 
+    LEFT JOIN customer_stories cs ON s.id = cs.source_id 
+    GROUP BY s.name, s.id
+"""
+
+
 @st.cache_data(ttl=300)
 def get_source_stats() -> Dict:
     """Get summary statistics by source"""
     db_ops = get_database_connection()
     
     with db_ops.db.get_cursor() as cursor:
-        cursor.execute("""
-            SELECT 
-                s.name,
-                COUNT(cs.id) as story_count,
-                MIN(cs.publish_date) as earliest_story,
-                MAX(cs.publish_date) as latest_story,
-                COUNT(CASE WHEN cs.publish_date_estimated = TRUE THEN 1 END) as estimated_dates,
-                AVG(CASE 
-                    WHEN cs.extracted_data->'content_quality_score' IS NOT NULL 
-                    THEN (cs.extracted_data->>'content_quality_score')::float 
-                    ELSE NULL 
-                END) as avg_quality_score
-            FROM sources s 
-            LEFT JOIN customer_stories cs ON s.id = cs.source_id 
-            GROUP BY s.name, s.id
-            ORDER BY story_count DESC
-        """)
+        # Read the pre-aggregated view when it exists rather than scanning
+        # every story on each dashboard load
+        cursor.execute("SELECT to_regclass('source_summary') IS NOT NULL AS has_view")
+        source = 'source_summary' if cursor.fetchone()['has_view'] else f"({SOURCE_STATS_QUERY}) live_summary"
+        cursor.execute(f"SELECT * FROM {source} ORDER BY story_count DESC")
         
         return {row['name']: dict(row) for row in cursor.fetchall()}
 
 
+# Derived-table equivalent of customer_story_tags, expanded from the JSONB
+# arrays, for databases where 002_add_customer_story_tags.sql has not been run
+JSONB_STORY_TAGS = """(
+    SELECT DISTINCT cs.id as story_id, dims.dimension, tags.tag
+    FROM customer_stories cs
+    CROSS JOIN (VALUES
+        ('superpower', 'gen_ai_superpowers'),
+        ('business_impact', 'business_impacts'),
+        ('adoption_enabler', 'adoption_enablers')
+    ) AS dims(dimension, field)
+    CROSS JOIN LATERAL jsonb_array_elements_text(
+        CASE WHEN jsonb_typeof(cs.extracted_data->dims.field) = 'array'
+             THEN cs.extracted_data->dims.field
+             ELSE '[]'::jsonb END
+    ) AS tags(tag)
+)"""
+
+# Live equivalent of the aileron_summary materialized view, used when the
+# view has not been created (see 009_add_aileron_summary_view.sql); {tags} is
+# customer_story_tags or JSONB_STORY_TAGS
+AILERON_SUMMARY_QUERY = """
+    SELECT 
+        s.name as source_name,
+        t.dimension,
+        t.tag as category,
+        ''::text as impact,
+        COUNT(*) as count
+    FROM {tags} t
+    JOIN customer_stories cs ON cs.id = t.story_id
+    JOIN sources s ON cs.source_id = s.id
+    WHERE t.dimension IN ('superpower', 'business_impact', 'adoption_enabler')
+    AND cs.is_gen_ai = TRUE
+    GROUP BY s.name, t.dimension, t.tag
+    UNION ALL
+    SELECT 
+        s.name,
+        'business_function',
+        cs.extracted_data->>'business_function',
+        '',
+        COUNT(*)
+    FROM customer_stories cs
+    JOIN sources s ON cs.source_id = s.id
+    WHERE cs.is_gen_ai = TRUE
+    AND cs.extracted_data->>'business_function' <> ''
+    GROUP BY s.name, cs.extracted_data->>'business_function'
+    UNION ALL
+    SELECT 
+        s.name,
+        'superpower_impact',
+        sp.tag,
+        imp.tag,
+        COUNT(*)
+    FROM {tags} sp
+    JOIN {tags} imp 
+        ON imp.story_id = sp.story_id AND imp.dimension = 'business_impact'
+    JOIN customer_stories cs ON cs.id = sp.story_id
+    JOIN sources s ON cs.source_id = s.id
+    WHERE sp.dimension = 'superpower'
+    AND cs.is_gen_ai = TRUE
+    AND sp.tag <> '' AND imp.tag <> ''
+    GROUP BY s.name, sp.tag, imp.tag
+"""
+
+
+def _aileron_summary_source(cursor) -> str:
+    """FROM source for Aileron counts: the view when it exists, else the live query"""
+    cursor.execute("""
+        SELECT 
+            to_regclass('aileron_summary') IS NOT NULL AS has_view,
+            to_regclass('customer_story_tags') IS NOT NULL AS has_tags
+    """)
+    row = cursor.fetchone()
+    if row['has_view']:
+        return 'aileron_summary'
+    tags = 'customer_story_tags' if row['has_tags'] else JSONB_STORY_TAGS
+    return f"({AILERON_SUMMARY_QUERY.format(tags=tags)}) live_summary"
+
+
 @st.cache_data(ttl=300)
 def get_aileron_analytics() -> Dict:
     """Get Aileron framework analytics - only for Gen AI stories with complete Aileron data"""
     db_ops = get_database_connection()
     
+    # All four distributions in one round trip from the per-source
+    # aileron_summary counts; rows are dispatched by their dimension.
+    results = {'superpowers': {}, 'impacts': {}, 'enablers': {}, 'functions': {}}
+    dimension_keys = {
+        'superpower': 'superpowers',
+        'business_impact': 'impacts',
+        'adoption_enabler': 'enablers',
+        'business_function': 'functions'
+    }
+    
     with db_ops.db.get_cursor() as cursor:
-        # SuperPowers distribution
-        cursor.execute("""
-            SELECT 
-                jsonb_array_elements_text(extracted_data->'gen_ai_superpowers') as superpower,
-                COUNT(*) as count
-            FROM customer_stories
-            WHERE is_gen_ai = TRUE 
-            AND extracted_data->'gen_ai_superpowers' IS NOT NULL
-            GROUP BY superpower
-            ORDER BY count DESC
-        """)
-        superpowers = {row['superpower']: row['count'] for row in cursor.fetchall()}
-        
-        # Business Impacts distribution
-        cursor.execute("""
+        source = _aileron_summary_source(cursor)
+        cursor.execute(f"""
             SELECT 
-                jsonb_array_elements_text(extracted_data->'business_impacts') as impact,
-                COUNT(*) as count
-            FROM customer_stories
-            WHERE is_gen_ai = TRUE 
-            AND extracted_data->'business_impacts' IS NOT NULL
-            GROUP BY impact
+                dimension,
+                category,
+                SUM(count)::bigint as count
+            FROM {source}
+            WHERE dimension IN ('superpower', 'business_impact', 'adoption_enabler', 'business_function')
+            GROUP BY dimension, category
             ORDER BY count DESC
         """)
-        impacts = {row['impact']: row['count'] for row in cursor.fetchall()}
         
-        # Adoption Enablers distribution
-        cursor.execute("""
-            SELECT 
-                jsonb_array_elements_text(extracted_data->'adoption_enablers') as enabler,
-                COUNT(*) as count
-            FROM customer_stories
-            WHERE is_gen_ai = TRUE 
-            AND extracted_data->'adoption_enablers' IS NOT NULL
-            GROUP BY enabler
-            ORDER BY count DESC
-        """)
-        enablers = {row['enabler']: row['count'] for row in cursor.fetchall()}
-        
-        # Business Function distribution
-        cursor.execute("""
+        for row in cursor.fetchall():
+            results[dimension_keys[row['dimension']]][row['category']] = row['count']
+    
+    return results
+
+
+@st.cache_data(ttl=300)
+def get_superpower_impact_matrix(source_name: Optional[str] = None, exclude_source: bool = False) -> pd.DataFrame:
+    """Count Gen AI stories for each SuperPower -> Business Impact pair
+    
+    Pairs are read from the per-source counts in aileron_summary, so only
+    the counts leave the database. Pass source_name to restrict to one
+    source, or with exclude_source=True to leave that source out.
+    
+    Returns:
+        DataFrame with SuperPower, Impact and Count columns
+    """
+    db_ops = get_database_connection()
+    
+    source_condition = ""
+    params = []
+    if source_name:
+        source_condition = f"AND source_name {'!=' if exclude_source else '='} %s"
+        params.append(source_name)
+    
+    with db_ops.db.get_cursor() as cursor:
+        source = _aileron_summary_source(cursor)
+        cursor.execute(f"""
             SELECT 
-                extracted_data->>'business_function' as function,
-                COUNT(*) as count
-            FROM customer_stories
-            WHERE is_gen_ai = TRUE 
-            AND extracted_data->'business_function' IS NOT NULL
-            GROUP BY function
-            ORDER BY count DESC
-        """)
-        functions = {row['function']: row['count'] for row in cursor.fetchall() if row['function']}
-        
-        return {
-            'superpowers': superpowers,
-            'impacts': impacts,
-            'enablers': enablers,
-            'functions': functions
-        }
+                category as superpower,
+                impact,
+                SUM(count)::bigint as count
+            FROM {source}
+            WHERE dimension = 'superpower_impact'
+            {source_condition}
+            GROUP BY category, impact
+        """, params)
+        rows = cursor.fetchall()
+    
+    return pd.DataFrame(
+        [(row['superpower'], row['impact'], row['count']) for row in rows],
+        columns=['SuperPower', 'Impact', 'Count']
+    )
+
+
+def _story_ids_key(df: pd.DataFrame) -> bytes:
+    """Cache key for story DataFrames: the ids of the rows they hold
+    
+    Every story frame is a slice of load_all_stories(), which is cached
+    for the same ttl, so its ids identify it without hashing the JSON
+    in extracted_data.
+    """
+    return df['id'].to_numpy().tobytes()
 
 
+@st.cache_data(ttl=300, hash_funcs={pd.DataFrame: _story_ids_key})
 def get_filtered_aileron_data(df_filtered: pd.DataFrame) -> Dict:
     """Get Aileron framework analytics from filtered DataFrame"""
-    # SuperPowers analysis
-    all_superpowers = []
-    for idx, row in df_filtered.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            superpowers = row['extracted_data'].get('gen_ai_superpowers', [])
-            if isinstance(superpowers, list):
-                all_superpowers.extend(superpowers)
-    
-    superpower_counts = pd.Series(all_superpowers).value_counts().to_dict()
-    
-    # Business Impacts analysis
-    all_impacts = []
-    for idx, row in df_filtered.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            impacts = row['extracted_data'].get('business_impacts', [])
-            if isinstance(impacts, list):
-                all_impacts.extend(impacts)
-    
-    impact_counts = pd.Series(all_impacts).value_counts().to_dict()
-    
-    # Adoption Enablers analysis
-    all_enablers = []
-    for idx, row in df_filtered.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            enablers = row['extracted_data'].get('adoption_enablers', [])
-            if isinstance(enablers, list):
-                all_enablers.extend(enablers)
-    
-    enabler_counts = pd.Series(all_enablers).value_counts().to_dict()
-    
-    # Business Function analysis
-    all_functions = []
-    for idx, row in df_filtered.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            function = row['extracted_data'].get('business_function')
-            if function:
-                all_functions.append(function)
-    
-    function_counts = pd.Series(all_functions).value_counts().to_dict()
+    functions = extracted_field(df_filtered, 'business_function')
     
     return {
-        'superpowers': superpower_counts,
-        'impacts': impact_counts,
-        'enablers': enabler_counts,
-        'functions': function_counts
-    }
\ No newline at end of file
+        'superpowers': explode_extracted_list(df_filtered, 'gen_ai_superpowers').value_counts().to_dict(),
+        'impacts': explode_extracted_list(df_filtered, 'business_impacts').value_counts().to_dict(),
+        'enablers': explode_extracted_list(df_filtered, 'adoption_enablers').value_counts().to_dict(),
+        'functions': functions[functions.astype(bool)].value_counts().to_dict()
+    }
+
+
+@st.cache_data(ttl=300, hash_funcs={pd.DataFrame: _story_ids_key})
+def get_technology_pair_counts(df_filtered: pd.DataFrame) -> pd.Series:
+    """Count technology mentions per source, indexed by (Source, Technology)"""
+    return technology_pair_counts(df_filtered)
+
+
+@st.cache_data(ttl=300, hash_funcs={pd.DataFrame: _story_ids_key})
+def get_business_outcomes(df_filtered: pd.DataFrame) -> Tuple[List[Dict], List[Dict]]:
+    """Split quantified business outcomes into financial and operational ones
+    
+    Returns:
+        (financial_outcomes, operational_outcomes), each outcome tagged with
+        its customer, source and industry
+    """
+    financial_outcomes = []
+    operational_outcomes = []
+    
+    outcomes = extracted_records(df_filtered, 'quantified_business_outcomes', {
+        'customer_name': 'customer',
+        'source_name': 'source',
+        'industry': 'industry'
+    })
+    
+    for outcome_data in outcomes:
+        # Categorize by outcome type
+        outcome_type = outcome_data.get('type', '').lower()
+        if any(keyword in outcome_type for keyword in ['cost', 'saving', 'revenue', 'profit', 'financial']):
+            financial_outcomes.append(outcome_data)
+        elif any(keyword in outcome_type for keyword in ['time', 'efficiency', 'productivity', 'operational']):
+            operational_outcomes.append(outcome_data)
+    
+    return financial_outcomes, operational_outcomes
@@ -6,21 +6,40 @@ Handles data filtering, transformation, and export functionality
 
 import pandas as pd
 import io
+import orjson
+from decimal import Decimal
 from typing import Dict, Any, List, Optional
 from .config import MAX_CHART_TITLE_LENGTH, SVG_EXPORT_CONFIG
 
 
+def _json_default(value: Any) -> Any:
+    """Encode the values orjson does not handle natively for JSON export"""
+    if value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
 def create_download_data(df: pd.DataFrame, format_type: str) -> bytes:
     """Create downloadable data in specified format"""
     if format_type == 'csv':
-        return df.to_csv(index=False).encode('utf-8')
+        output = io.BytesIO()
+        df.to_csv(output, index=False, encoding='utf-8', chunksize=50_000)
+        return output.getvalue()
     elif format_type == 'excel':
         output = io.BytesIO()
         with pd.ExcelWriter(output, engine='openpyxl') as writer:
             df.to_excel(writer, index=False, sheet_name='Stories')
         return output.getvalue()
     elif format_type == 'json':
-        return df.to_json(orient='records', indent=2).encode('utf-8')
+        return orjson.dumps(
+            df.to_dict(orient='records'),
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
 
 
 def format_chart_title(title: str, max_length: int = None) -> str:
@@ -124,80 +143,88 @@ def filter_stories_by_company_size(df: pd.DataFrame, selected_sizes: List[str])
     return df[df['company_size'].isin(selected_sizes)]
 
 
-def search_stories(df: pd.DataFrame, search_term: str) -> pd.DataFrame:
-    """Search stories by customer name, title, or content"""
-    if not search_term.strip():
-        return df
+def category_counts(values: pd.Series) -> pd.Series:
+    """value_counts() without the zero counts a categorical reports for its unused categories"""
+    counts = values.value_counts()
+    return counts[counts > 0]
+
+
+def extracted_field(df: pd.DataFrame, field: str) -> pd.Series:
+    """Value of an extracted_data field for every story (None where missing)"""
+    return df['extracted_data'].map(lambda data: data.get(field) if isinstance(data, dict) else None)
+
+
+def explode_extracted_list(df: pd.DataFrame, field: str) -> pd.Series:
+    """One entry per item of a list field in extracted_data, indexed by story row
+    
+    Stories without the field, or where it is not a list, contribute nothing.
+    """
+    values = extracted_field(df, field)
+    return values[values.map(lambda value: isinstance(value, list))].explode().dropna()
+
+
+def extracted_records(df: pd.DataFrame, field: str, columns: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Dict items of a list field in extracted_data, each tagged with story columns
+    
+    columns maps a df column to the key it is stored under in every record;
+    those keys take precedence over keys of the same name in the item.
+    """
+    items = explode_extracted_list(df, field)
+    items = items[items.map(lambda item: isinstance(item, dict))]
+    tags = df.loc[items.index, list(columns)].rename(columns=columns)
+    return [{**item, **tag} for item, tag in zip(items, tags.to_dict('records'))]
+
+
+def _as_list(value: Any) -> List:
+    """A list field as-is, a scalar as a one-item list, and nothing as []"""
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
+def extracted_pairs(df: pd.DataFrame, field1: str, field2: str) -> pd.DataFrame:
+    """Every (field1, field2) value combination within each story, indexed by story row
     
-    search_term = search_term.lower()
-    mask = (
-        df['customer_name'].str.lower().str.contains(search_term, na=False) |
-        df['title'].str.lower().str.contains(search_term, na=False) |
-        df['content'].str.lower().str.contains(search_term, na=False)
+    Scalar fields count as one-item lists; empty values are skipped.
+    """
+    first = extracted_field(df, field1).map(_as_list).explode().dropna()
+    second = extracted_field(df, field2).map(_as_list).explode().dropna()
+    return first[first.map(bool)].to_frame(field1).join(
+        second[second.map(bool)].to_frame(field2), how='inner'
     )
-    return df[mask]
+
+
+def technology_pair_counts(df: pd.DataFrame) -> pd.Series:
+    """Count technology mentions per source, indexed by (Source, Technology)
+    
+    source_name is a categorical, so only observed pairs are kept; sources
+    filtered out of df must not come back as zero-count groups.
+    """
+    techs = explode_extracted_list(df, 'technologies_used')
+    return pd.DataFrame({
+        'Source': df.loc[techs.index, 'source_name'].values,
+        'Technology': techs.values
+    }).groupby(['Source', 'Technology'], sort=False, observed=True).size()
 
 
 def extract_technologies(df: pd.DataFrame) -> Dict[str, int]:
     """Extract and count all technologies mentioned in stories"""
-    all_technologies = []
-    
-    for _, row in df.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            techs = row['extracted_data'].get('technologies_used', [])
-            if isinstance(techs, list):
-                all_technologies.extend(techs)
-    
-    return pd.Series(all_technologies).value_counts().to_dict()
+    return explode_extracted_list(df, 'technologies_used').value_counts().to_dict()
 
 
 def extract_business_outcomes(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Extract quantified business outcomes from stories"""
-    outcomes = []
-    
-    for _, row in df.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            outcome_data = row['extracted_data'].get('quantified_business_outcomes', [])
-            if isinstance(outcome_data, list):
-                for outcome in outcome_data:
-                    if isinstance(outcome, dict):
-                        outcomes.append({
-                            **outcome,
-                            'customer_name': row['customer_name'],
-                            'source_name': row['source_name'],
-                            'industry': row['industry']
-                        })
-    
-    return outcomes
+    return extracted_records(df, 'quantified_business_outcomes', {
+        'customer_name': 'customer_name',
+        'source_name': 'source_name',
+        'industry': 'industry'
+    })
 
 
 def get_cross_analysis_data(df: pd.DataFrame, dimension1: str, dimension2: str) -> pd.DataFrame:
     """Create cross-analysis matrix data between two dimensions"""
-    cross_data = []
-    
-    for _, row in df.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            dim1_values = row['extracted_data'].get(dimension1, [])
-            dim2_values = row['extracted_data'].get(dimension2, [])
-            
-            # Handle single values vs lists
-            if not isinstance(dim1_values, list):
-                dim1_values = [dim1_values] if dim1_values else []
-            if not isinstance(dim2_values, list):
-                dim2_values = [dim2_values] if dim2_values else []
-            
-            # Create cross-combinations
-            for val1 in dim1_values:
-                for val2 in dim2_values:
-                    if val1 and val2:
-                        cross_data.append({
-                            dimension1: val1,
-                            dimension2: val2,
-                            'customer_name': row['customer_name'],
-                            'source_name': row['source_name']
-                        })
-    
-    return pd.DataFrame(cross_data)
+    pairs = extracted_pairs(df, dimension1, dimension2)
+    return pairs.join(df[['customer_name', 'source_name']]).reset_index(drop=True)
 
 
 def calculate_summary_stats(df: pd.DataFrame) -> Dict[str, Any]:
@@ -206,14 +233,8 @@ def calculate_summary_stats(df: pd.DataFrame) -> Dict[str, Any]:
     genai_stories = len(df[df['is_gen_ai'] == True]) if 'is_gen_ai' in df.columns else 0
     
     # Quality score statistics
-    quality_scores = []
-    for _, row in df.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            score = row['extracted_data'].get('content_quality_score')
-            if isinstance(score, (int, float)):
-                quality_scores.append(score)
-    
-    avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
+    quality_scores = df['quality_score'].dropna() if 'quality_score' in df.columns else pd.Series(dtype=float)
+    avg_quality = quality_scores.mean() if not quality_scores.empty else 0
     
     # Date range
     date_range = {
@@ -15,7 +15,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'core'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
-from src.dashboard.core.data_loader import get_filtered_aileron_data
+from src.dashboard.core.data_loader import get_filtered_aileron_data, get_superpower_impact_matrix
 from src.dashboard.core.data_processor import apply_chart_formatting, get_svg_export_config, get_cross_analysis_data
 from src.dashboard.core.config import AILERON_LABELS
 from src.dashboard.core.brand_styles import PLOTLY_COLOR_SCHEMES, get_plotly_theme
@@ -39,12 +39,15 @@ def show_aileron_insights(df: pd.DataFrame, aileron_data: Dict):
     if microsoft_filter == "Microsoft Only":
         df_filtered = df[(df['is_gen_ai'] == True) & (df['source_name'] == 'Microsoft')].copy()
         filter_suffix = " (Microsoft Only)"
+        matrix_filter = {'source_name': 'Microsoft'}
     elif microsoft_filter == "Non-Microsoft Only":
         df_filtered = df[(df['is_gen_ai'] == True) & (df['source_name'] != 'Microsoft')].copy()
         filter_suffix = " (Non-Microsoft Only)"
+        matrix_filter = {'source_name': 'Microsoft', 'exclude_source': True}
     else:
         df_filtered = df[df['is_gen_ai'] == True].copy()
         filter_suffix = ""
+        matrix_filter = {}
     
     # Show current filter stats
     _display_filter_metrics(df, df_filtered)
@@ -73,7 +76,7 @@ def show_aileron_insights(df: pd.DataFrame, aileron_data: Dict):
     _display_adoption_enablers(filtered_aileron_data, filter_suffix)
     
     # Cross-analysis matrix
-    _display_cross_analysis(df_filtered, filter_suffix)
+    _display_cross_analysis(get_superpower_impact_matrix(**matrix_filter), filter_suffix)
 
 
 def _display_filter_metrics(df: pd.DataFrame, df_filtered: pd.DataFrame):
@@ -252,38 +255,18 @@ def _display_adoption_enablers(filtered_aileron_data: Dict, filter_suffix: str):
         st.info("No Adoption Enablers data available")
 
 
-def _display_cross_analysis(df_filtered: pd.DataFrame, filter_suffix: str):
-    """Display cross-analysis matrix"""
+def _display_cross_analysis(cross_df: pd.DataFrame, filter_suffix: str):
+    """Display cross-analysis matrix from SuperPower/Impact/Count rows"""
     st.subheader(f"🔄 Cross-Analysis: SuperPowers → Business Impacts{filter_suffix}")
     st.markdown("*Which AI capabilities deliver which business outcomes*")
     
-    # Create cross-analysis data
-    cross_data = []
-    for _, row in df_filtered.iterrows():
-        if isinstance(row.get('extracted_data'), dict):
-            superpowers = row['extracted_data'].get('gen_ai_superpowers', [])
-            impacts = row['extracted_data'].get('business_impacts', [])
-            
-            for power in superpowers:
-                for impact in impacts:
-                    if power and impact:
-                        cross_data.append({
-                            'SuperPower': power,
-                            'Impact': impact,
-                            'Customer': row['customer_name'],
-                            'Source': row['source_name']
-                        })
-    
-    if cross_data:
-        cross_df = pd.DataFrame(cross_data)
-        
+    if not cross_df.empty:
         # Create pivot table for heatmap
-        pivot_df = cross_df.pivot_table(
+        pivot_df = cross_df.pivot(
             index='SuperPower', 
             columns='Impact', 
-            aggfunc='size', 
-            fill_value=0
-        )
+            values='Count'
+        ).fillna(0).astype(int)
         
         # Apply icon mapping for better readability
         superpower_labels = {
@@ -327,8 +310,7 @@ def _display_cross_analysis(df_filtered: pd.DataFrame, filter_suffix: str):
         
         # Show top combinations
         st.markdown("**🏆 Top SuperPower → Impact Combinations:**")
-        combination_counts = cross_df.groupby(['SuperPower', 'Impact']).size().reset_index(name='Count')
-        top_combinations = combination_counts.nlargest(5, 'Count')
+        top_combinations = cross_df.nlargest(5, 'Count')
         
         for _, row in top_combinations.iterrows():
             superpower = superpower_labels.get(row['SuperPower'], row['SuperPower'].replace('_', ' ').title())
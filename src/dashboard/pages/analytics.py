@@ -16,7 +16,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'core'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'components'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
-from src.dashboard.core.data_processor import filter_stories_by_genai, get_svg_export_config, apply_chart_formatting
+from src.dashboard.core.data_processor import filter_stories_by_genai, get_svg_export_config, apply_chart_formatting, category_counts
+from src.dashboard.core.data_loader import get_technology_pair_counts, get_business_outcomes
 from src.dashboard.components.charts import (
     create_industry_pie_chart, 
     create_technology_usage_chart,
@@ -98,7 +99,7 @@ def _display_filter_metrics(df: pd.DataFrame, df_filtered: pd.DataFrame):
 def _display_industry_analysis(df_filtered: pd.DataFrame, filter_suffix: str):
     """Display industry distribution analysis"""
     st.subheader(f"Industry Distribution{filter_suffix}")
-    industry_counts = df_filtered['industry'].value_counts().head(10)
+    industry_counts = category_counts(df_filtered['industry']).head(10)
     
     # Add chart options for better space utilization
     col1, col2 = st.columns([3, 1])
@@ -135,7 +136,7 @@ def _display_company_and_usecase_analysis(df_filtered: pd.DataFrame, filter_suff
     
     with col1:
         st.subheader(f"Company Size Distribution{filter_suffix}")
-        size_counts = df_filtered['company_size'].value_counts()
+        size_counts = category_counts(df_filtered['company_size'])
         
         fig = px.bar(
             x=size_counts.index, 
@@ -181,23 +182,15 @@ def _display_technology_analysis(df_filtered: pd.DataFrame, filter_suffix: str):
     """Display technology usage analysis"""
     st.subheader(f"Technology Usage Analysis{filter_suffix}")
     
-    # Extract technologies with source attribution
-    tech_source_data = []
-    source_tech_counts = {}
+    # Technologies with source attribution
+    pair_counts = get_technology_pair_counts(df_filtered)
     
-    for idx, row in df_filtered.iterrows():
-        if isinstance(row['extracted_data'], dict):
-            techs = row['extracted_data'].get('technologies_used', [])
-            source = row['source_name']
-            
-            if source not in source_tech_counts:
-                source_tech_counts[source] = {}
-            
-            for tech in techs:
-                tech_source_data.append({'Technology': tech, 'Source': source})
-                source_tech_counts[source][tech] = source_tech_counts[source].get(tech, 0) + 1
+    has_data = df_filtered['extracted_data'].map(lambda data: isinstance(data, dict))
+    source_tech_counts = {source: {} for source in df_filtered.loc[has_data, 'source_name'].unique()}
+    for (source, tech), count in pair_counts.items():
+        source_tech_counts[source][tech] = count
     
-    if tech_source_data:
+    if not pair_counts.empty:
         # Top Technologies by Each Source (Side-by-side)
         st.markdown("**Top Technologies by AI Provider**")
         
@@ -235,29 +228,7 @@ def _display_business_outcomes_analysis(df_filtered: pd.DataFrame, filter_suffix
     """Display business outcomes analysis"""
     st.subheader(f"Business Outcomes Analysis{filter_suffix}")
     
-    # Extract financial outcomes
-    financial_outcomes = []
-    operational_outcomes = []
-    
-    for _, row in df_filtered.iterrows():
-        if isinstance(row['extracted_data'], dict):
-            outcomes = row['extracted_data'].get('quantified_business_outcomes', [])
-            
-            for outcome in outcomes:
-                if isinstance(outcome, dict):
-                    outcome_data = {
-                        **outcome,
-                        'customer': row['customer_name'],
-                        'source': row['source_name'],
-                        'industry': row['industry']
-                    }
-                    
-                    # Categorize by outcome type
-                    outcome_type = outcome.get('type', '').lower()
-                    if any(keyword in outcome_type for keyword in ['cost', 'saving', 'revenue', 'profit', 'financial']):
-                        financial_outcomes.append(outcome_data)
-                    elif any(keyword in outcome_type for keyword in ['time', 'efficiency', 'productivity', 'operational']):
-                        operational_outcomes.append(outcome_data)
+    financial_outcomes, operational_outcomes = get_business_outcomes(df_filtered)
     
     if financial_outcomes or operational_outcomes:
         col1, col2 = st.columns(2)
@@ -300,17 +271,15 @@ def _display_advanced_analytics(df_filtered: pd.DataFrame, filter_suffix: str):
     if 'publish_date' in df_filtered.columns:
         st.markdown("**📅 Publication Timeline**")
         
-        df_dates = df_filtered.dropna(subset=['publish_date']).copy()
-        if not df_dates.empty:
-            df_dates['publish_date'] = pd.to_datetime(df_dates['publish_date'])
-            df_dates['year_month'] = df_dates['publish_date'].dt.to_period('M')
-            
-            timeline_counts = df_dates.groupby('year_month').size()
+        publish_dates = df_filtered['publish_date'].dropna()
+        if not publish_dates.empty:
+            timeline_counts = publish_dates.dt.to_period('M').value_counts().sort_index()
             
             fig = px.line(
                 x=timeline_counts.index.astype(str),
                 y=timeline_counts.values,
-                title="Stories Published Over Time"
+                title="Stories Published Over Time",
+                render_mode='webgl'
             )
             
             apply_chart_formatting(fig, "Stories Published Over Time")
@@ -323,13 +292,7 @@ def _display_advanced_analytics(df_filtered: pd.DataFrame, filter_suffix: str):
     
     # Quality score distribution
     st.markdown("**⭐ Content Quality Distribution**")
-    quality_scores = []
-    
-    for _, row in df_filtered.iterrows():
-        if isinstance(row['extracted_data'], dict):
-            score = row['extracted_data'].get('content_quality_score')
-            if isinstance(score, (int, float)):
-                quality_scores.append(score)
+    quality_scores = df_filtered['quality_score'].dropna().tolist()
     
     if quality_scores:
         fig = px.histogram(
@@ -13,13 +13,9 @@ import os
 # Add dashboard core to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'core'))
 
-from src.dashboard.core.data_processor import (
-    filter_stories_by_genai, 
-    filter_stories_by_source, 
-    filter_stories_by_industry,
-    filter_stories_by_company_size,
-    search_stories
-)
+from src.dashboard.core.data_loader import count_stories, query_stories
+from src.dashboard.core.data_processor import extracted_field
+from src.dashboard.core.config import EXPLORER_PAGE_SIZE
 
 
 def show_story_explorer(df: pd.DataFrame):
@@ -48,87 +44,123 @@ def show_story_explorer(df: pd.DataFrame):
     with col5:
         ai_type_filter = st.selectbox("AI Type", ["All", "Gen AI", "Non Gen AI"])
     
-    # Apply filters
-    filtered_df = df.copy()
-    
-    # Source filter
-    if source_filter != "All":
-        filtered_df = filter_stories_by_source(filtered_df, [source_filter])
-    
-    # Industry filter
-    if industry_filter != "All":
-        filtered_df = filter_stories_by_industry(filtered_df, [industry_filter])
-    
-    # Company size filter
-    if size_filter != "All":
-        filtered_df = filter_stories_by_company_size(filtered_df, [size_filter])
-    
-    # AI type filter
-    if ai_type_filter == "Gen AI":
-        filtered_df = filter_stories_by_genai(filtered_df, 'genai_only')
-    elif ai_type_filter == "Non Gen AI":
-        filtered_df = filter_stories_by_genai(filtered_df, 'non_genai_only')
-    
-    # Search functionality
-    if search_term:
-        filtered_df = search_stories(filtered_df, search_term)
-    
-    st.info(f"Found {len(filtered_df)} stories matching your criteria")
+    # Filter, count and page in the database; only the visible page is loaded
+    filters = {
+        'source_name': None if source_filter == "All" else source_filter,
+        'industry': None if industry_filter == "All" else industry_filter,
+        'company_size': None if size_filter == "All" else size_filter,
+        'is_gen_ai': {"Gen AI": True, "Non Gen AI": False}.get(ai_type_filter),
+        'search': search_term.strip() or None
+    }
+    total_stories = count_stories(**filters)
+    
+    st.info(f"Found {total_stories} stories matching your criteria")
+    
+    total_pages = max(1, -(-total_stories // EXPLORER_PAGE_SIZE))
+    page = 1
+    if total_pages > 1:
+        page = st.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages, value=1, step=1)
+    
+    filtered_df = query_stories(**filters, offset=(page - 1) * EXPLORER_PAGE_SIZE, limit=EXPLORER_PAGE_SIZE)
+    
+    if filtered_df.empty:
+        return
+    
+    # One grid for the page; details render only for the selected story
+    table_df = pd.DataFrame({
+        'Customer': filtered_df['customer_name'],
+        'AI Provider': filtered_df['source_name'],
+        'Industry': filtered_df['industry'],
+        'Company Size': filtered_df['company_size'],
+        'Published': filtered_df['publish_date'],
+        'AI Type': filtered_df['is_gen_ai'].map(lambda is_gen_ai: "✅ Gen AI" if is_gen_ai else "⚪ Non Gen AI"),
+        'Quality': filtered_df['quality_score'],
+        'Summary': extracted_field(filtered_df, 'summary'),
+        'Link': filtered_df['url']
+    })
+    
+    selection = st.dataframe(
+        table_df,
+        use_container_width=True,
+        column_config={
+            "Quality": st.column_config.ProgressColumn(
+                "Quality",
+                min_value=0,
+                max_value=1,
+                format="%.2f"
+            ),
+            "Link": st.column_config.LinkColumn(
+                "Link",
+                help="Click to view the story",
+                display_text="🔗 View Story"
+            )
+        },
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row"
+    )
+    
+    if selection.selection.rows:
+        row = filtered_df.iloc[selection.selection.rows[0]]
+        st.subheader(f"🏢 {row['customer_name']} ({row['source_name']})")
+        _display_story(row)
+    else:
+        st.caption("Select a story in the table to see its details")
+
+
+def _display_story(row: pd.Series):
+    """Display the details of one story from the explorer results"""
+    col1, col2 = st.columns([2, 1])
     
-    # Display results
-    for idx, row in filtered_df.iterrows():
-        with st.expander(f"🏢 {row['customer_name']} ({row['source_name']})"):
-            col1, col2 = st.columns([2, 1])
+    with col1:
+        st.write(f"**Industry:** {row['industry'] or 'Unknown'}")
+        st.write(f"**Company Size:** {row['company_size'] or 'Unknown'}")
+        st.write(f"**Published:** {row['publish_date'] or 'Unknown'}")
+        
+        if isinstance(row['extracted_data'], dict):
+            summary = row['extracted_data'].get('summary', 'No summary available')
+            st.write(f"**Summary:** {summary}")
+            
+            technologies = row['extracted_data'].get('technologies_used', [])
+            if technologies:
+                st.write(f"**Technologies:** {', '.join(technologies)}")
             
-            with col1:
-                st.write(f"**Industry:** {row['industry'] or 'Unknown'}")
-                st.write(f"**Company Size:** {row['company_size'] or 'Unknown'}")
-                st.write(f"**Published:** {row['publish_date'] or 'Unknown'}")
-                
-                if isinstance(row['extracted_data'], dict):
-                    summary = row['extracted_data'].get('summary', 'No summary available')
-                    st.write(f"**Summary:** {summary}")
-                    
-                    technologies = row['extracted_data'].get('technologies_used', [])
-                    if technologies:
-                        st.write(f"**Technologies:** {', '.join(technologies)}")
-                    
-                    # Display business outcomes
-                    business_outcomes = row['extracted_data'].get('business_outcomes', [])
-                    if business_outcomes:
-                        st.write("**Business Outcomes:**")
-                        for outcome in business_outcomes:
-                            if isinstance(outcome, dict):
-                                outcome_type = outcome.get('type', 'Unknown')
-                                value = outcome.get('value')
-                                unit = outcome.get('unit', '')
-                                description = outcome.get('description', '')
-                                
-                                if value and unit:
-                                    outcome_text = f"• **{outcome_type.replace('_', ' ').title()}**: {value} {unit}"
-                                else:
-                                    outcome_text = f"• **{outcome_type.replace('_', ' ').title()}**"
-                                
-                                if description:
-                                    outcome_text += f" - {description}"
-                                
-                                st.write(outcome_text)
-                    
-                    # Display Aileron framework data if available (Gen AI stories)
-                    if row.get('is_gen_ai', False):
-                        _display_aileron_data(row['extracted_data'])
+            # Display business outcomes
+            business_outcomes = row['extracted_data'].get('business_outcomes', [])
+            if business_outcomes:
+                st.write("**Business Outcomes:**")
+                for outcome in business_outcomes:
+                    if isinstance(outcome, dict):
+                        outcome_type = outcome.get('type', 'Unknown')
+                        value = outcome.get('value')
+                        unit = outcome.get('unit', '')
+                        description = outcome.get('description', '')
+                        
+                        if value and unit:
+                            outcome_text = f"• **{outcome_type.replace('_', ' ').title()}**: {value} {unit}"
+                        else:
+                            outcome_text = f"• **{outcome_type.replace('_', ' ').title()}**"
+                        
+                        if description:
+                            outcome_text += f" - {description}"
+                        
+                        st.write(outcome_text)
+            
+            # Display Aileron framework data if available (Gen AI stories)
+            if row.get('is_gen_ai', False):
+                _display_aileron_data(row['extracted_data'])
+    
+    with col2:
+        st.write(f"**URL:** [Link]({row['url']})")
+        
+        if isinstance(row['extracted_data'], dict):
+            quality_score = row['extracted_data'].get('content_quality_score', 0)
+            st.metric("Quality Score", f"{quality_score:.2f}")
             
-            with col2:
-                st.write(f"**URL:** [Link]({row['url']})")
-                
-                if isinstance(row['extracted_data'], dict):
-                    quality_score = row['extracted_data'].get('content_quality_score', 0)
-                    st.metric("Quality Score", f"{quality_score:.2f}")
-                    
-                    # Show Gen AI classification
-                    ai_type = row['extracted_data'].get('ai_type', 'Unknown')
-                    is_gen_ai = "✅ Gen AI" if row.get('is_gen_ai', False) else "⚪ Non Gen AI"
-                    st.write(f"**AI Type:** {is_gen_ai}")
+            # Show Gen AI classification
+            ai_type = row['extracted_data'].get('ai_type', 'Unknown')
+            is_gen_ai = "✅ Gen AI" if row.get('is_gen_ai', False) else "⚪ Non Gen AI"
+            st.write(f"**AI Type:** {is_gen_ai}")
 
 
 def _display_aileron_data(extracted_data: dict):
@@ -117,13 +117,7 @@ def _handle_filtered_export(df: pd.DataFrame) -> pd.DataFrame:
     
     # Quality threshold filter
     if quality_threshold > 0:
-        def meets_quality_threshold(row):
-            if isinstance(row['extracted_data'], dict):
-                score = row['extracted_data'].get('content_quality_score', 0)
-                return score >= quality_threshold
-            return False
-        
-        export_df = export_df[export_df.apply(meets_quality_threshold, axis=1)]
+        export_df = export_df[export_df['quality_score'] >= quality_threshold]
     
     st.info(f"Filtered dataset contains {len(export_df)} stories")
     
@@ -178,9 +172,7 @@ def _display_filter_summary(filtered_df: pd.DataFrame, original_df: pd.DataFrame
         
         with col4:
             if len(filtered_df) > 0:
-                avg_quality = filtered_df['extracted_data'].apply(
-                    lambda x: x.get('content_quality_score', 0) if isinstance(x, dict) else 0
-                ).mean()
+                avg_quality = filtered_df['quality_score'].fillna(0).mean()
                 st.metric("Avg Quality", f"{avg_quality:.3f}")
 
 
@@ -44,19 +44,20 @@ def show_overview(df: pd.DataFrame, source_stats: Dict):
         st.metric("Industries", industries)
     
     with col5:
-        avg_quality = df['extracted_data'].apply(
-            lambda x: x.get('content_quality_score', 0) if isinstance(x, dict) else 0
-        ).mean()
+        # Stories without a score count as 0
+        avg_quality = df['quality_score'].fillna(0).mean()
         st.metric("Avg Quality Score", f"{avg_quality:.2f}")
     
     # Source distribution chart with Gen AI breakdown
     st.subheader("Stories by AI Provider")
     
     # Calculate Gen AI vs Non Gen AI breakdown by source
+    # One pass over the stories, instead of filtering the frame per source
+    gen_ai_by_source = df.loc[df['is_gen_ai'] == True, 'source_name'].value_counts()
+    
     source_breakdown = []
     for name, stats in source_stats.items():
-        source_df_filtered = df[df['source_name'] == name]
-        gen_ai_stories = len(source_df_filtered[source_df_filtered['is_gen_ai'] == True])
+        gen_ai_stories = int(gen_ai_by_source.get(name, 0))
         non_gen_ai_stories = stats['story_count'] - gen_ai_stories
         
         # Add Gen AI stories
@@ -98,12 +99,10 @@ def show_overview(df: pd.DataFrame, source_stats: Dict):
     st.subheader("Recent Stories")
     
     # Sort by publish_date (latest first), handle nulls
-    df_sorted = df.copy()
-    df_sorted['publish_date_sort'] = pd.to_datetime(df_sorted['publish_date'])
-    df_sorted = df_sorted.sort_values('publish_date_sort', ascending=False, na_position='last')
+    df_sorted = df.sort_values('publish_date', ascending=False, na_position='last')
     
     recent_df = df_sorted.head(10)[['customer_name', 'source_name', 'industry', 'publish_date', 'url']].copy()
-    recent_df['publish_date'] = pd.to_datetime(recent_df['publish_date']).dt.strftime('%Y-%m-%d')
+    recent_df['publish_date'] = recent_df['publish_date'].dt.strftime('%Y-%m-%d')
     
     # Add numbering starting from 1
     recent_df.reset_index(drop=True, inplace=True)
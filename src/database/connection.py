@@ -1,5 +1,9 @@
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
+import atexit
+import orjson
+import threading
 from contextlib import contextmanager
 import logging
 from typing import Dict, Any, List, Optional
@@ -7,16 +11,86 @@ from src.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Decode JSONB columns (raw_content, extracted_data) with orjson rather than
+# the stdlib json module; psycopg2 already hands them back as dicts
+psycopg2.extras.register_default_jsonb(globally=True, loads=orjson.loads)
+
+class PreparingConnection(psycopg2.extensions.connection):
+    """psycopg2 connection that remembers which statements it has prepared"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
+class BlockingConnectionPool(psycopg2.pool.ThreadedConnectionPool):
+    """ThreadedConnectionPool whose getconn() waits for a free connection
+    instead of raising PoolError once maxconn are in use"""
+    
+    def __init__(self, minconn, maxconn, *args, **kwargs):
+        self._slots = threading.BoundedSemaphore(maxconn)
+        super().__init__(minconn, maxconn, *args, **kwargs)
+    
+    def getconn(self, key=None):
+        self._slots.acquire()
+        try:
+            return super().getconn(key)
+        except Exception:
+            self._slots.release()
+            raise
+    
+    def putconn(self, conn, key=None, close=False):
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
+
+# Connection pools shared by every DatabaseConnection in the process, keyed
+# by database URL, so repeated get_cursor() calls reuse open connections
+# instead of reconnecting each time
+POOL_MIN_CONNECTIONS = 1
+POOL_MAX_CONNECTIONS = Config.DB_POOL_MAX_CONNECTIONS
+_pools: Dict[str, BlockingConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(database_url: str) -> BlockingConnectionPool:
+    """Return the connection pool for database_url, creating it on first use"""
+    with _pools_lock:
+        pool = _pools.get(database_url)
+        if pool is None or pool.closed:
+            pool = BlockingConnectionPool(
+                POOL_MIN_CONNECTIONS,
+                POOL_MAX_CONNECTIONS,
+                database_url,
+                connection_factory=PreparingConnection,
+                cursor_factory=psycopg2.extras.RealDictCursor
+            )
+            _pools[database_url] = pool
+            logger.info("Database connection pool created")
+        return pool
+
+def close_pools():
+    """Close every pooled connection"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeall()
+        _pools.clear()
+
+atexit.register(close_pools)
+
 class DatabaseConnection:
     def __init__(self, database_url: str = None):
         self.database_url = database_url or Config.DATABASE_URL
         self._connection = None
+        # Pooled connection held for the duration of a 'with' block
+        self._pinned_pool = None
+        self._pinned_connection = None
     
     def connect(self):
         """Establish database connection"""
         try:
             self._connection = psycopg2.connect(
                 self.database_url,
+                connection_factory=PreparingConnection,
                 cursor_factory=psycopg2.extras.RealDictCursor
             )
             logger.info("Database connection established")
@@ -32,39 +106,93 @@ class DatabaseConnection:
             self._connection = None
             logger.info("Database connection closed")
     
+    def __enter__(self):
+        """Pin one pooled connection that get_cursor() reuses until exit
+        
+        Meant for a single thread running several queries in a row; other
+        threads should use their own DatabaseConnection.
+        """
+        self._pinned_pool = get_pool(self.database_url)
+        self._pinned_connection = self._pinned_pool.getconn()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        pool, conn = self._pinned_pool, self._pinned_connection
+        self._pinned_pool = self._pinned_connection = None
+        if conn is not None:
+            pool.putconn(conn)
+        self.disconnect()
+    
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = None
+        """Context manager for pooled database connections
+        
+        The connection is returned to the pool on exit; the pool rolls back
+        anything left uncommitted and discards connections that are broken.
+        Inside a 'with DatabaseConnection()' block the pinned connection is
+        used instead, and stays out of the pool until the block ends.
+        """
+        pool = None
+        conn = self._pinned_connection
         try:
-            conn = psycopg2.connect(
-                self.database_url,
-                cursor_factory=psycopg2.extras.RealDictCursor
-            )
+            if conn is None:
+                pool = get_pool(self.database_url)
+                conn = pool.getconn()
             yield conn
         except psycopg2.Error as e:
-            if conn:
+            if conn and not conn.closed:
                 conn.rollback()
             logger.error(f"Database error: {e}")
             raise
         finally:
-            if conn:
-                conn.close()
+            if pool and conn:
+                pool.putconn(conn)
     
     @contextmanager
-    def get_cursor(self):
-        """Context manager for database cursors with transaction handling"""
+    def get_cursor(self, name: str = None, itersize: int = 2000):
+        """Context manager for database cursors with transaction handling
+        
+        Passing a name opens a server-side cursor, which streams rows in
+        batches of itersize when iterated instead of loading the whole
+        result set into memory. A named cursor can execute only one query.
+        """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
+            cursor = conn.cursor(name=name)
+            if name:
+                cursor.itersize = itersize
             try:
                 yield cursor
+                # Server-side cursors must be closed before the transaction
+                # that owns them ends
+                cursor.close()
                 conn.commit()
             except Exception as e:
                 conn.rollback()
                 logger.error(f"Transaction rolled back: {e}")
                 raise
             finally:
-                cursor.close()
+                # A server-side cursor is already gone with its transaction
+                if not name:
+                    cursor.close()
+    
+    def execute_prepared(self, cursor, name: str, sql: str, params: tuple = None):
+        """Execute sql as a named prepared statement on the cursor's connection
+        
+        The statement is prepared the first time it runs on a connection and
+        reused afterwards, so repeated calls skip parsing and planning. sql
+        uses $1, $2, ... placeholders; params are bound to them in order.
+        """
+        params = tuple(params or ())
+        execute_sql = f"EXECUTE {name}"
+        if params:
+            execute_sql += f"({', '.join(['%s'] * len(params))})"
+        
+        prepared = cursor.connection.prepared_statements
+        if name not in prepared:
+            # No params here, so a literal % in sql is sent as-is
+            cursor.execute(f"PREPARE {name} AS {sql}")
+            prepared.add(name)
+        cursor.execute(execute_sql, params)
     
     def execute_schema(self, schema_file_path: str):
         """Execute schema SQL file"""
@@ -0,0 +1,16 @@
+-- GIN indexes on the extracted_data arrays scanned by the categorical analytics
+-- jsonb_path_ops keeps each index a fraction of the size of a default jsonb_ops
+-- index and serves @> containment lookups on the individual arrays.
+-- Run outside a transaction (psql -f) because of CONCURRENTLY.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cs_tech_gin
+    ON customer_stories USING GIN ((extracted_data->'technologies_used') jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cs_use_cases_gin
+    ON customer_stories USING GIN ((extracted_data->'use_cases') jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cs_superpowers_gin
+    ON customer_stories USING GIN ((extracted_data->'gen_ai_superpowers') jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cs_impacts_gin
+    ON customer_stories USING GIN ((extracted_data->'business_impacts') jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cs_enablers_gin
+    ON customer_stories USING GIN ((extracted_data->'adoption_enablers') jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cs_outcomes_gin
+    ON customer_stories USING GIN ((extracted_data->'business_outcomes') jsonb_path_ops);
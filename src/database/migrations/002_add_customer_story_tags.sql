@@ -0,0 +1,54 @@
+-- Normalize Aileron framework arrays into customer_story_tags
+-- gen_ai_superpowers, business_impacts and adoption_enablers are copied into
+-- a (story_id, dimension, tag) table with a btree index, so tag counts are a
+-- plain GROUP BY instead of a JSONB expansion of every story.
+CREATE TABLE IF NOT EXISTS customer_story_tags (
+    story_id INTEGER REFERENCES customer_stories(id) ON DELETE CASCADE,
+    dimension VARCHAR(50) NOT NULL, -- 'superpower', 'business_impact', 'adoption_enabler'
+    tag TEXT NOT NULL,
+    PRIMARY KEY (story_id, dimension, tag)
+);
+
+CREATE INDEX IF NOT EXISTS idx_customer_story_tags_dimension_tag
+    ON customer_story_tags(dimension, tag);
+
+CREATE OR REPLACE FUNCTION sync_customer_story_tags() RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM customer_story_tags WHERE story_id = NEW.id;
+    INSERT INTO customer_story_tags (story_id, dimension, tag)
+    SELECT NEW.id, dims.dimension, tags.tag
+    FROM (VALUES
+        ('superpower', 'gen_ai_superpowers'),
+        ('business_impact', 'business_impacts'),
+        ('adoption_enabler', 'adoption_enablers')
+    ) AS dims(dimension, field)
+    CROSS JOIN LATERAL jsonb_array_elements_text(
+        CASE WHEN jsonb_typeof(NEW.extracted_data->dims.field) = 'array'
+             THEN NEW.extracted_data->dims.field
+             ELSE '[]'::jsonb END
+    ) AS tags(tag)
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_sync_customer_story_tags ON customer_stories;
+CREATE TRIGGER trg_sync_customer_story_tags
+    AFTER INSERT OR UPDATE OF extracted_data ON customer_stories
+    FOR EACH ROW EXECUTE FUNCTION sync_customer_story_tags();
+
+-- Backfill existing stories
+INSERT INTO customer_story_tags (story_id, dimension, tag)
+SELECT cs.id, dims.dimension, tags.tag
+FROM customer_stories cs
+CROSS JOIN (VALUES
+    ('superpower', 'gen_ai_superpowers'),
+    ('business_impact', 'business_impacts'),
+    ('adoption_enabler', 'adoption_enablers')
+) AS dims(dimension, field)
+CROSS JOIN LATERAL jsonb_array_elements_text(
+    CASE WHEN jsonb_typeof(cs.extracted_data->dims.field) = 'array'
+         THEN cs.extracted_data->dims.field
+         ELSE '[]'::jsonb END
+) AS tags(tag)
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,71 @@
+-- Pre-aggregated categorical counts for scripts/development/analysis_tools.py
+-- One scan per refresh replaces the per-dimension scans of customer_stories.
+-- Refreshed by DatabaseOperations.refresh_summary_views() after each ingest.
+-- Recreates the view with its final definition from schema.sql, so the
+-- migration can be re-run on a database built from an older definition.
+-- Needs customer_story_tags (002_add_customer_story_tags.sql).
+DROP MATERIALIZED VIEW IF EXISTS categorical_summary;
+
+CREATE MATERIALIZED VIEW categorical_summary AS
+SELECT 'industry' AS dimension, industry AS category, COUNT(*) AS count
+FROM customer_stories
+WHERE industry IS NOT NULL
+GROUP BY industry
+UNION ALL
+SELECT 'source', s.name, COUNT(*)
+FROM customer_stories cs
+JOIN sources s ON cs.source_id = s.id
+GROUP BY s.name
+UNION ALL
+SELECT 'ai_type', extracted_data->>'ai_type', COUNT(*)
+FROM customer_stories
+WHERE extracted_data->>'ai_type' IS NOT NULL
+GROUP BY extracted_data->>'ai_type'
+UNION ALL
+SELECT 'language', detected_language, COUNT(*)
+FROM customer_stories
+WHERE detected_language IS NOT NULL
+GROUP BY detected_language
+UNION ALL
+-- Outcome types and units from one expansion of business_outcomes
+SELECT
+    CASE WHEN GROUPING(outcome->>'type') = 0 THEN 'business_outcome' ELSE 'outcome_unit' END,
+    CASE WHEN GROUPING(outcome->>'type') = 0 THEN outcome->>'type' ELSE outcome->>'unit' END,
+    COUNT(*)
+FROM customer_stories
+CROSS JOIN LATERAL jsonb_array_elements(extracted_data->'business_outcomes') AS outcome
+WHERE jsonb_typeof(extracted_data->'business_outcomes') = 'array'
+GROUP BY GROUPING SETS ((outcome->>'type'), (outcome->>'unit'))
+HAVING COALESCE(outcome->>'type', outcome->>'unit') IS NOT NULL
+UNION ALL
+SELECT 'gen_ai_superpower', t.tag, COUNT(*)
+FROM customer_story_tags t
+JOIN customer_stories cs ON cs.id = t.story_id
+WHERE t.dimension = 'superpower'
+AND cs.is_gen_ai = TRUE
+GROUP BY t.tag
+UNION ALL
+SELECT 'data_quality', metric, value
+FROM (
+    SELECT
+        COUNT(*) AS total_stories,
+        COUNT(*) FILTER (WHERE is_gen_ai = TRUE) AS gen_ai_stories,
+        COUNT(*) FILTER (WHERE extracted_data ? 'gen_ai_superpowers') AS with_aileron,
+        COUNT(*) FILTER (
+            WHERE extracted_data ? 'business_outcomes'
+            AND extracted_data->>'business_outcomes' != '[]'
+        ) AS with_outcomes
+    FROM customer_stories
+) totals
+CROSS JOIN LATERAL (VALUES
+    ('total_stories', totals.total_stories),
+    ('gen_ai_stories', totals.gen_ai_stories),
+    ('with_aileron', totals.with_aileron),
+    ('with_outcomes', totals.with_outcomes)
+) AS quality(metric, value);
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_categorical_summary_dimension_category
+    ON categorical_summary(dimension, category);
+CREATE INDEX idx_categorical_summary_dimension_count
+    ON categorical_summary(dimension, count DESC);
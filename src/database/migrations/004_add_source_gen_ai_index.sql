@@ -0,0 +1,5 @@
+-- Composite index for per-source Gen AI counts (COUNT(*) FILTER (WHERE is_gen_ai))
+-- Lets the planner answer source/is_gen_ai aggregations from the index alone.
+-- Run outside a transaction (psql -f) because of CONCURRENTLY.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_customer_stories_source_gen_ai
+    ON customer_stories(source_id, is_gen_ai);
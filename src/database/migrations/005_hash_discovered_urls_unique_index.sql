@@ -0,0 +1,10 @@
+-- Enforce discovered_urls.url uniqueness through a 20-byte SHA-1 digest
+-- instead of a btree over the full VARCHAR(500) value, which keeps the
+-- index small and ON CONFLICT lookups cheap during bulk inserts.
+-- Run outside a transaction (psql -f) because of CONCURRENTLY.
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_discovered_urls_url_sha
+    ON discovered_urls(digest(url, 'sha1'));
+
+ALTER TABLE discovered_urls DROP CONSTRAINT IF EXISTS discovered_urls_url_key;
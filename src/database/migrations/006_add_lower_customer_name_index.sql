@@ -0,0 +1,5 @@
+-- Expression index for case-insensitive customer lookups
+-- (WHERE LOWER(customer_name) = LOWER(...)) so they avoid a sequential scan.
+-- Run outside a transaction (psql -f) because of CONCURRENTLY.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_customer_stories_lower_name
+    ON customer_stories(LOWER(customer_name));
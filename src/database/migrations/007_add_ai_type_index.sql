@@ -0,0 +1,9 @@
+-- Expression index on extracted_data->>'ai_type' for the classification
+-- consistency checks, which filter on ai_type without reading the rest of
+-- the extracted_data document.
+-- Key-existence tests (extracted_data ? 'key') are served by the existing
+-- jsonb_ops GIN index idx_customer_stories_extracted_data; jsonb_path_ops
+-- indexes do not support the ? operator.
+-- Run outside a transaction (psql -f) because of CONCURRENTLY.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_customer_stories_ai_type
+    ON customer_stories((extracted_data->>'ai_type'));
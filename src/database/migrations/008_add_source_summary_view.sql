@@ -0,0 +1,25 @@
+-- Pre-aggregated per-source statistics for the dashboard (get_source_stats)
+-- Dashboard loads read one row per source instead of scanning customer_stories.
+-- Refreshed by DatabaseOperations.refresh_summary_views() after each ingest.
+-- Recreates the view with its final definition from schema.sql, so the
+-- migration can be re-run on a database built from an older definition.
+DROP MATERIALIZED VIEW IF EXISTS source_summary;
+
+CREATE MATERIALIZED VIEW source_summary AS
+SELECT 
+    s.name,
+    COUNT(cs.id) as story_count,
+    MIN(cs.publish_date) as earliest_story,
+    MAX(cs.publish_date) as latest_story,
+    COUNT(CASE WHEN cs.publish_date_estimated = TRUE THEN 1 END) as estimated_dates,
+    AVG(CASE 
+        WHEN cs.extracted_data ? 'content_quality_score' 
+        THEN (cs.extracted_data->>'content_quality_score')::float 
+        ELSE NULL 
+    END) as avg_quality_score
+FROM sources s 
+LEFT JOIN customer_stories cs ON s.id = cs.source_id 
+GROUP BY s.name, s.id;
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_source_summary_name ON source_summary(name);
@@ -0,0 +1,55 @@
+-- Pre-aggregated Aileron framework counts for the dashboard
+-- (get_aileron_analytics, get_superpower_impact_matrix). Gen AI story counts
+-- per source for each superpower, business impact, adoption enabler and
+-- business function, plus each superpower -> impact pair (dimension
+-- 'superpower_impact', with the impact in its own column).
+-- Refreshed by DatabaseOperations.refresh_summary_views() after each ingest.
+-- Recreates the view with its final definition from schema.sql, so the
+-- migration can be re-run on a database built from an older definition.
+-- Needs customer_story_tags (002_add_customer_story_tags.sql).
+DROP MATERIALIZED VIEW IF EXISTS aileron_summary;
+
+CREATE MATERIALIZED VIEW aileron_summary AS
+SELECT 
+    s.name as source_name,
+    t.dimension,
+    t.tag as category,
+    ''::text as impact,
+    COUNT(*) as count
+FROM customer_story_tags t
+JOIN customer_stories cs ON cs.id = t.story_id
+JOIN sources s ON cs.source_id = s.id
+WHERE t.dimension IN ('superpower', 'business_impact', 'adoption_enabler')
+AND cs.is_gen_ai = TRUE
+GROUP BY s.name, t.dimension, t.tag
+UNION ALL
+SELECT 
+    s.name,
+    'business_function',
+    cs.extracted_data->>'business_function',
+    '',
+    COUNT(*)
+FROM customer_stories cs
+JOIN sources s ON cs.source_id = s.id
+WHERE cs.is_gen_ai = TRUE
+AND cs.extracted_data->>'business_function' <> ''
+GROUP BY s.name, cs.extracted_data->>'business_function'
+UNION ALL
+SELECT 
+    s.name,
+    'superpower_impact',
+    sp.tag,
+    imp.tag,
+    COUNT(*)
+FROM customer_story_tags sp
+JOIN customer_story_tags imp 
+    ON imp.story_id = sp.story_id AND imp.dimension = 'business_impact'
+JOIN customer_stories cs ON cs.id = sp.story_id
+JOIN sources s ON cs.source_id = s.id
+WHERE sp.dimension = 'superpower'
+AND cs.is_gen_ai = TRUE
+AND sp.tag <> '' AND imp.tag <> ''
+GROUP BY s.name, sp.tag, imp.tag;
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_aileron_summary_key ON aileron_summary(dimension, source_name, category, impact);
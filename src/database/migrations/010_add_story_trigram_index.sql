@@ -0,0 +1,12 @@
+-- Trigram GIN index for the Story Explorer keyword search
+-- The explorer ORs its full-text match with ILIKE '%term%' on customer
+-- name, title and industry. A leading wildcard cannot use a btree index,
+-- but pg_trgm's gin_trgm_ops can, so the whole predicate is answered by a
+-- BitmapOr of this index and idx_customer_stories_search. Terms shorter
+-- than three characters have no trigrams and still scan.
+-- Run outside a transaction (psql -f) because of CONCURRENTLY.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_customer_stories_trgm
+    ON customer_stories
+    USING GIN (customer_name gin_trgm_ops, title gin_trgm_ops, industry gin_trgm_ops);
@@ -1,8 +1,11 @@
+import io
+import csv
 import json
 import hashlib
 import logging
+import psycopg2.extras
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from src.database.connection import DatabaseConnection
 
@@ -67,8 +70,21 @@ class CustomerStory:
     classification_confidence: Optional[Dict[str, float]] = None
 
 class DatabaseOperations:
+    # Materialized views rebuilt from customer_stories after each ingest
+    SUMMARY_VIEWS = ('categorical_summary', 'source_summary', 'aileron_summary')
+    # customer_stories columns written by insert_customer_story / bulk_upsert_stories
+    STORY_COLUMNS = (
+        "source_id, customer_name, title, url, content_hash, "
+        "industry, company_size, use_case_category, "
+        "raw_content, extracted_data, publish_date, "
+        "publish_date_estimated, publish_date_confidence, publish_date_reasoning, "
+        "is_gen_ai, detected_language, language_detection_method, language_confidence"
+    )
+    
     def __init__(self, db_connection: DatabaseConnection = None):
         self.db = db_connection or DatabaseConnection()
+        # Sources by name, cleared whenever this instance writes to sources
+        self._sources_by_name: Dict[str, Source] = {}
     
     def get_sources(self, active_only: bool = True) -> List[Source]:
         """Retrieve all sources from database"""
@@ -82,26 +98,22 @@ class DatabaseOperations:
             return [Source(**row) for row in rows]
     
     def get_source_by_name(self, name: str) -> Optional[Source]:
-        """Get source by name"""
+        """Get source by name, cached on this instance once found"""
+        source = self._sources_by_name.get(name)
+        if source is not None:
+            return source
+        
         with self.db.get_cursor() as cursor:
             cursor.execute("SELECT * FROM sources WHERE name = %s", (name,))
             row = cursor.fetchone()
-            return Source(**row) if row else None
+        if not row:
+            return None
+        source = self._sources_by_name[name] = Source(**row)
+        return source
     
-    def insert_customer_story(self, story: CustomerStory) -> int:
-        """Insert a new customer story and return its ID"""
-        insert_query = """
-        INSERT INTO customer_stories (
-            source_id, customer_name, title, url, content_hash,
-            industry, company_size, use_case_category,
-            raw_content, extracted_data, publish_date,
-            publish_date_estimated, publish_date_confidence, publish_date_reasoning,
-            is_gen_ai, detected_language, language_detection_method, language_confidence
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING id
-        """
-        
-        values = (
+    def _story_values(self, story: CustomerStory) -> tuple:
+        """Column values for a story, in STORY_COLUMNS order"""
+        return (
             story.source_id,
             story.customer_name,
             story.title,
@@ -121,13 +133,58 @@ class DatabaseOperations:
             story.language_detection_method,
             story.language_confidence
         )
+    
+    def insert_customer_story(self, story: CustomerStory) -> int:
+        """Insert a new customer story and return its ID"""
+        insert_query = f"""
+        INSERT INTO customer_stories ({self.STORY_COLUMNS})
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        RETURNING id
+        """
         
         with self.db.get_cursor() as cursor:
-            cursor.execute(insert_query, values)
+            cursor.execute(insert_query, self._story_values(story))
             story_id = cursor.fetchone()['id']
             logger.info(f"Inserted customer story ID: {story_id}")
             return story_id
     
+    def bulk_upsert_stories(self, stories: List[CustomerStory]) -> List[int]:
+        """Insert or update many customer stories in one statement, keyed by URL
+        
+        A story whose URL is already stored has every written column
+        replaced. If a URL appears more than once in stories, the last one
+        wins. Returns the story IDs in input order.
+        """
+        if not stories:
+            return []
+        
+        # ON CONFLICT cannot update the same row twice in one statement
+        stories_by_url = {story.url: story for story in stories}
+        update_columns = ",\n                    ".join(
+            f"{column} = EXCLUDED.{column}"
+            for column in self.STORY_COLUMNS.split(", ")
+            if column != 'url'
+        )
+        
+        with self.db.get_cursor() as cursor:
+            rows = psycopg2.extras.execute_values(
+                cursor,
+                f"""
+                INSERT INTO customer_stories ({self.STORY_COLUMNS}) VALUES %s
+                ON CONFLICT (url) DO UPDATE SET
+                    {update_columns},
+                    last_updated = CURRENT_TIMESTAMP
+                RETURNING id, url
+                """,
+                [self._story_values(story) for story in stories_by_url.values()],
+                page_size=100,
+                fetch=True
+            )
+        
+        ids_by_url = {row['url']: row['id'] for row in rows}
+        logger.info(f"Bulk upserted {len(ids_by_url)} customer stories")
+        return [ids_by_url[story.url] for story in stories]
+    
     def get_story_by_url(self, url: str) -> Optional[CustomerStory]:
         """Get story by URL"""
         with self.db.get_cursor() as cursor:
@@ -226,6 +283,21 @@ class DatabaseOperations:
             rows = cursor.fetchall()
             return [self._row_to_story(row) for row in rows]
     
+    def iter_stories_by_source(self, source_id: int, itersize: int = 500) -> Iterator[CustomerStory]:
+        """Stream all stories for a source, raw and extracted content included
+        
+        Rows come from a single query on a server-side cursor, fetched
+        itersize at a time, so only one batch of JSONB payloads is held in
+        memory at once.
+        """
+        with self.db.get_cursor(name='stories_by_source', itersize=itersize) as cursor:
+            cursor.execute(
+                "SELECT * FROM customer_stories WHERE source_id = %s ORDER BY scraped_date DESC",
+                (source_id,)
+            )
+            for row in cursor:
+                yield self._row_to_story(row)
+    
     def search_stories(self, search_term: str, limit: int = 50) -> List[CustomerStory]:
         """Full-text search for stories"""
         query = """
@@ -247,6 +319,17 @@ class DatabaseOperations:
                 "UPDATE sources SET last_scraped = CURRENT_TIMESTAMP WHERE id = %s",
                 (source_id,)
             )
+        self._sources_by_name.clear()
+    
+    def refresh_summary_views(self):
+        """Refresh pre-aggregated analytics views after new stories are saved"""
+        for view_name in self.SUMMARY_VIEWS:
+            try:
+                with self.db.get_cursor() as cursor:
+                    cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view_name}")
+                logger.info(f"Refreshed materialized view: {view_name}")
+            except Exception as e:
+                logger.warning(f"Could not refresh materialized view {view_name}: {e}")
     
     # Discovered URLs operations for two-phase scraping
     
@@ -257,7 +340,7 @@ class DatabaseOperations:
                 INSERT INTO discovered_urls 
                 (source_id, url, inferred_customer_name, inferred_title, publish_date, notes)
                 VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (url) DO UPDATE SET
+                ON CONFLICT ((digest(url, 'sha1'))) DO UPDATE SET
                     inferred_customer_name = EXCLUDED.inferred_customer_name,
                     inferred_title = EXCLUDED.inferred_title,
                     publish_date = EXCLUDED.publish_date,
@@ -277,14 +360,66 @@ class DatabaseOperations:
             logger.info(f"Inserted/updated discovered URL ID: {discovered_id}")
             return discovered_id
     
+    def bulk_insert_discovered_urls(self, discovered_urls: List[DiscoveredUrl], use_copy: bool = True) -> int:
+        """Insert many discovered URLs at once, skipping URLs already in the table
+        
+        Rows are streamed with COPY into a temporary staging table and merged
+        with INSERT ... ON CONFLICT DO NOTHING. With use_copy=False they are
+        sent through execute_values instead. Returns the number of new rows.
+        """
+        columns = "source_id, url, inferred_customer_name, inferred_title, publish_date, notes"
+        rows = [
+            (u.source_id, u.url, u.inferred_customer_name, u.inferred_title, u.publish_date, u.notes)
+            for u in discovered_urls
+        ]
+        if not rows:
+            return 0
+        
+        with self.db.get_cursor() as cursor:
+            if use_copy:
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(rows)
+                buffer.seek(0)
+                
+                cursor.execute(f"""
+                    CREATE TEMP TABLE discovered_urls_staging ON COMMIT DROP AS
+                    SELECT {columns} FROM discovered_urls WITH NO DATA
+                """)
+                cursor.copy_expert(
+                    f"COPY discovered_urls_staging ({columns}) FROM STDIN WITH (FORMAT csv)",
+                    buffer
+                )
+                cursor.execute(f"""
+                    INSERT INTO discovered_urls ({columns})
+                    SELECT {columns} FROM discovered_urls_staging
+                    ON CONFLICT ((digest(url, 'sha1'))) DO NOTHING
+                """)
+                inserted = cursor.rowcount
+            else:
+                inserted_ids = psycopg2.extras.execute_values(
+                    cursor,
+                    f"INSERT INTO discovered_urls ({columns}) VALUES %s ON CONFLICT ((digest(url, 'sha1'))) DO NOTHING RETURNING id",
+                    rows,
+                    page_size=1000,
+                    fetch=True
+                )
+                inserted = len(inserted_ids)
+        
+        logger.info(f"Bulk inserted {inserted} of {len(rows)} discovered URLs")
+        return inserted
+    
     def get_pending_urls(self, source_id: int, limit: int = None) -> List[DiscoveredUrl]:
         """Get URLs that are pending scraping"""
+        return self.get_pending_urls_for_sources([source_id], limit)
+    
+    def get_pending_urls_for_sources(self, source_ids: List[int], limit: int = None) -> List[DiscoveredUrl]:
+        """Get URLs pending scraping for several sources in one query"""
         query = """
             SELECT * FROM discovered_urls 
-            WHERE source_id = %s AND scrape_status = 'pending'
+            WHERE source_id = ANY(%s) AND scrape_status = 'pending'
             ORDER BY publish_date DESC NULLS LAST, discovered_date ASC
         """
-        params = [source_id]
+        params = [list(source_ids)]
         
         if limit:
             query += " LIMIT %s"
@@ -308,10 +443,35 @@ class DatabaseOperations:
             """, (status, error, url_id))
             logger.info(f"Updated discovered URL {url_id} status to: {status}")
     
+    def bulk_update_discovered_url_status(self, updates: List[Tuple[int, str, Optional[str]]]):
+        """Apply many (url_id, status, error) updates in one statement"""
+        if not updates:
+            return
+        
+        with self.db.get_cursor() as cursor:
+            psycopg2.extras.execute_values(
+                cursor,
+                """
+                UPDATE discovered_urls AS d
+                SET scrape_status = v.status,
+                    scrape_attempts = d.scrape_attempts + 1,
+                    last_scrape_attempt = CURRENT_TIMESTAMP,
+                    scrape_error = v.error
+                FROM (VALUES %s) AS v (id, status, error)
+                WHERE d.id = v.id
+                """,
+                updates,
+                template="(%s::integer, %s::varchar, %s::text)"
+            )
+            logger.info(f"Updated status of {len(updates)} discovered URLs")
+    
     def get_discovered_url_by_url(self, url: str) -> Optional[DiscoveredUrl]:
         """Get discovered URL by URL string"""
         with self.db.get_cursor() as cursor:
-            cursor.execute("SELECT * FROM discovered_urls WHERE url = %s", (url,))
+            cursor.execute(
+                "SELECT * FROM discovered_urls WHERE digest(url, 'sha1') = digest(%s, 'sha1')",
+                (url,)
+            )
             row = cursor.fetchone()
             if row:
                 return self._row_to_discovered_url(row)
@@ -382,4 +542,13 @@ class DatabaseOperations:
 
 def generate_content_hash(content: str) -> str:
     """Generate SHA256 hash of content for change detection"""
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
\ No newline at end of file
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def generate_content_fingerprint(content: str) -> Tuple[int, bytes]:
+    """Cheap (length, first 256 characters) fingerprint of content
+    
+    Lets incremental scrapes skip hashing pages that look unchanged; a
+    change beyond the first 256 characters that keeps the length the same
+    is not detected.
+    """
+    return (len(content), content[:256].encode('utf-8'))
\ No newline at end of file
@@ -1,5 +1,10 @@
 -- AI Customer Stories Database Schema
 
+-- digest() for the fixed-width URL hash index on discovered_urls
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+-- Trigram operator classes for the Story Explorer substring search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Sources/Companies being tracked
 CREATE TABLE sources (
     id SERIAL PRIMARY KEY,
@@ -13,7 +18,7 @@ CREATE TABLE sources (
 CREATE TABLE discovered_urls (
     id SERIAL PRIMARY KEY,
     source_id INTEGER REFERENCES sources(id),
-    url VARCHAR(500) UNIQUE NOT NULL,
+    url VARCHAR(500) NOT NULL, -- unique via idx_discovered_urls_url_sha
     inferred_customer_name VARCHAR(255), -- Customer name extracted from URL or preview
     inferred_title VARCHAR(500), -- Title from preview or link text
     publish_date DATE, -- Publication date if discoverable
@@ -122,29 +127,215 @@ CREATE TABLE source_duplicates (
     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Aileron framework tags normalized out of extracted_data, one row per
+-- (story, dimension, tag); kept in sync by trg_sync_customer_story_tags
+CREATE TABLE customer_story_tags (
+    story_id INTEGER REFERENCES customer_stories(id) ON DELETE CASCADE,
+    dimension VARCHAR(50) NOT NULL, -- 'superpower', 'business_impact', 'adoption_enabler'
+    tag TEXT NOT NULL,
+    PRIMARY KEY (story_id, dimension, tag)
+);
+
 -- Performance indexes
 CREATE INDEX idx_customer_stories_customer_name ON customer_stories(customer_name);
+CREATE INDEX idx_customer_stories_lower_name ON customer_stories(LOWER(customer_name));
 CREATE INDEX idx_customer_stories_source_scraped ON customer_stories(source_id, scraped_date);
 CREATE INDEX idx_customer_stories_industry ON customer_stories(industry);
 CREATE INDEX idx_customer_stories_search ON customer_stories USING gin(search_vector);
+-- Serves the explorer's ILIKE '%term%' matches on name, title and industry
+CREATE INDEX idx_customer_stories_trgm ON customer_stories
+    USING gin(customer_name gin_trgm_ops, title gin_trgm_ops, industry gin_trgm_ops);
 CREATE INDEX idx_customer_stories_extracted_data ON customer_stories USING gin(extracted_data);
+
+-- Per-array GIN indexes for categorical analytics (@> containment lookups)
+CREATE INDEX idx_cs_tech_gin ON customer_stories USING gin((extracted_data->'technologies_used') jsonb_path_ops);
+CREATE INDEX idx_cs_use_cases_gin ON customer_stories USING gin((extracted_data->'use_cases') jsonb_path_ops);
+CREATE INDEX idx_cs_superpowers_gin ON customer_stories USING gin((extracted_data->'gen_ai_superpowers') jsonb_path_ops);
+CREATE INDEX idx_cs_impacts_gin ON customer_stories USING gin((extracted_data->'business_impacts') jsonb_path_ops);
+CREATE INDEX idx_cs_enablers_gin ON customer_stories USING gin((extracted_data->'adoption_enablers') jsonb_path_ops);
+CREATE INDEX idx_cs_outcomes_gin ON customer_stories USING gin((extracted_data->'business_outcomes') jsonb_path_ops);
 CREATE INDEX idx_story_metrics_type ON story_metrics(metric_type);
 CREATE INDEX idx_story_technologies_story ON story_technologies(story_id);
 
+CREATE INDEX idx_customer_story_tags_dimension_tag ON customer_story_tags(dimension, tag);
+
 -- Additional indexes for new fields
 CREATE INDEX idx_customer_stories_is_gen_ai ON customer_stories(is_gen_ai);
+CREATE INDEX idx_customer_stories_source_gen_ai ON customer_stories(source_id, is_gen_ai);
 CREATE INDEX idx_customer_stories_detected_language ON customer_stories(detected_language);
+CREATE INDEX idx_customer_stories_ai_type ON customer_stories((extracted_data->>'ai_type'));
 
 -- Indexes for discovered_urls table
+CREATE UNIQUE INDEX idx_discovered_urls_url_sha ON discovered_urls(digest(url, 'sha1'));
 CREATE INDEX idx_discovered_urls_source_status ON discovered_urls(source_id, scrape_status);
 CREATE INDEX idx_discovered_urls_status ON discovered_urls(scrape_status);
 CREATE INDEX idx_discovered_urls_publish_date ON discovered_urls(publish_date);
 CREATE INDEX idx_discovered_urls_discovered_date ON discovered_urls(discovered_date);
 
+-- Keep customer_story_tags in step with extracted_data
+CREATE OR REPLACE FUNCTION sync_customer_story_tags() RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM customer_story_tags WHERE story_id = NEW.id;
+    INSERT INTO customer_story_tags (story_id, dimension, tag)
+    SELECT NEW.id, dims.dimension, tags.tag
+    FROM (VALUES
+        ('superpower', 'gen_ai_superpowers'),
+        ('business_impact', 'business_impacts'),
+        ('adoption_enabler', 'adoption_enablers')
+    ) AS dims(dimension, field)
+    CROSS JOIN LATERAL jsonb_array_elements_text(
+        CASE WHEN jsonb_typeof(NEW.extracted_data->dims.field) = 'array'
+             THEN NEW.extracted_data->dims.field
+             ELSE '[]'::jsonb END
+    ) AS tags(tag)
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_sync_customer_story_tags
+    AFTER INSERT OR UPDATE OF extracted_data ON customer_stories
+    FOR EACH ROW EXECUTE FUNCTION sync_customer_story_tags();
+
+-- Pre-aggregated categorical counts (refreshed after each ingest)
+CREATE MATERIALIZED VIEW categorical_summary AS
+SELECT 'industry' AS dimension, industry AS category, COUNT(*) AS count
+FROM customer_stories
+WHERE industry IS NOT NULL
+GROUP BY industry
+UNION ALL
+SELECT 'source', s.name, COUNT(*)
+FROM customer_stories cs
+JOIN sources s ON cs.source_id = s.id
+GROUP BY s.name
+UNION ALL
+SELECT 'ai_type', extracted_data->>'ai_type', COUNT(*)
+FROM customer_stories
+WHERE extracted_data->>'ai_type' IS NOT NULL
+GROUP BY extracted_data->>'ai_type'
+UNION ALL
+SELECT 'language', detected_language, COUNT(*)
+FROM customer_stories
+WHERE detected_language IS NOT NULL
+GROUP BY detected_language
+UNION ALL
+-- Outcome types and units from one expansion of business_outcomes
+SELECT
+    CASE WHEN GROUPING(outcome->>'type') = 0 THEN 'business_outcome' ELSE 'outcome_unit' END,
+    CASE WHEN GROUPING(outcome->>'type') = 0 THEN outcome->>'type' ELSE outcome->>'unit' END,
+    COUNT(*)
+FROM customer_stories
+CROSS JOIN LATERAL jsonb_array_elements(extracted_data->'business_outcomes') AS outcome
+WHERE jsonb_typeof(extracted_data->'business_outcomes') = 'array'
+GROUP BY GROUPING SETS ((outcome->>'type'), (outcome->>'unit'))
+HAVING COALESCE(outcome->>'type', outcome->>'unit') IS NOT NULL
+UNION ALL
+SELECT 'gen_ai_superpower', t.tag, COUNT(*)
+FROM customer_story_tags t
+JOIN customer_stories cs ON cs.id = t.story_id
+WHERE t.dimension = 'superpower'
+AND cs.is_gen_ai = TRUE
+GROUP BY t.tag
+UNION ALL
+SELECT 'data_quality', metric, value
+FROM (
+    SELECT
+        COUNT(*) AS total_stories,
+        COUNT(*) FILTER (WHERE is_gen_ai = TRUE) AS gen_ai_stories,
+        COUNT(*) FILTER (WHERE extracted_data ? 'gen_ai_superpowers') AS with_aileron,
+        COUNT(*) FILTER (
+            WHERE extracted_data ? 'business_outcomes'
+            AND extracted_data->>'business_outcomes' != '[]'
+        ) AS with_outcomes
+    FROM customer_stories
+) totals
+CROSS JOIN LATERAL (VALUES
+    ('total_stories', totals.total_stories),
+    ('gen_ai_stories', totals.gen_ai_stories),
+    ('with_aileron', totals.with_aileron),
+    ('with_outcomes', totals.with_outcomes)
+) AS quality(metric, value);
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_categorical_summary_dimension_category
+    ON categorical_summary(dimension, category);
+CREATE INDEX idx_categorical_summary_dimension_count
+    ON categorical_summary(dimension, count DESC);
+
+-- Pre-aggregated per-source statistics for the dashboard (refreshed after each ingest)
+CREATE MATERIALIZED VIEW source_summary AS
+SELECT 
+    s.name,
+    COUNT(cs.id) as story_count,
+    MIN(cs.publish_date) as earliest_story,
+    MAX(cs.publish_date) as latest_story,
+    COUNT(CASE WHEN cs.publish_date_estimated = TRUE THEN 1 END) as estimated_dates,
+    AVG(CASE 
+        WHEN cs.extracted_data ? 'content_quality_score' 
+        THEN (cs.extracted_data->>'content_quality_score')::float 
+        ELSE NULL 
+    END) as avg_quality_score
+FROM sources s 
+LEFT JOIN customer_stories cs ON s.id = cs.source_id 
+GROUP BY s.name, s.id;
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_source_summary_name ON source_summary(name);
+
+-- Pre-aggregated Gen AI Aileron counts per source, including superpower ->
+-- impact pairs (refreshed after each ingest)
+CREATE MATERIALIZED VIEW aileron_summary AS
+SELECT 
+    s.name as source_name,
+    t.dimension,
+    t.tag as category,
+    ''::text as impact,
+    COUNT(*) as count
+FROM customer_story_tags t
+JOIN customer_stories cs ON cs.id = t.story_id
+JOIN sources s ON cs.source_id = s.id
+WHERE t.dimension IN ('superpower', 'business_impact', 'adoption_enabler')
+AND cs.is_gen_ai = TRUE
+GROUP BY s.name, t.dimension, t.tag
+UNION ALL
+SELECT 
+    s.name,
+    'business_function',
+    cs.extracted_data->>'business_function',
+    '',
+    COUNT(*)
+FROM customer_stories cs
+JOIN sources s ON cs.source_id = s.id
+WHERE cs.is_gen_ai = TRUE
+AND cs.extracted_data->>'business_function' <> ''
+GROUP BY s.name, cs.extracted_data->>'business_function'
+UNION ALL
+SELECT 
+    s.name,
+    'superpower_impact',
+    sp.tag,
+    imp.tag,
+    COUNT(*)
+FROM customer_story_tags sp
+JOIN customer_story_tags imp 
+    ON imp.story_id = sp.story_id AND imp.dimension = 'business_impact'
+JOIN customer_stories cs ON cs.id = sp.story_id
+JOIN sources s ON cs.source_id = s.id
+WHERE sp.dimension = 'superpower'
+AND cs.is_gen_ai = TRUE
+AND sp.tag <> '' AND imp.tag <> ''
+GROUP BY s.name, sp.tag, imp.tag;
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_aileron_summary_key ON aileron_summary(dimension, source_name, category, impact);
+
 -- Initial data
 INSERT INTO sources (name, base_url) VALUES 
 ('Anthropic', 'https://www.anthropic.com/customers'),
 ('Microsoft', 'https://www.microsoft.com/en-us/ai/ai-customer-stories'),
 ('AWS', 'https://aws.amazon.com/solutions/case-studies/'),
 ('Google Cloud', 'https://cloud.google.com/customers'),
-('OpenAI', 'https://openai.com/stories/');
\ No newline at end of file
+('OpenAI', 'https://openai.com/stories/');
+
+-- Include the seeded sources (with zero stories) in the per-source summary
+REFRESH MATERIALIZED VIEW source_summary;
\ No newline at end of file
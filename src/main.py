@@ -330,6 +330,10 @@ class AIStoriesProcessor:
         # Update source last_scraped timestamp
         self.db_ops.update_source_last_scraped(source.id)
         
+        # Rebuild analytics summaries so they include the new stories
+        if saved_story_ids:
+            self.db_ops.refresh_summary_views()
+        
         logger.info(f"Successfully saved {len(saved_story_ids)} stories to database")
         return saved_story_ids
     
@@ -150,9 +150,22 @@ class QueryInterface:
         print(f"\nCUSTOMER DETAILS: {customer_name}")
         print("="*60)
         
+        # Only the fields printed below; raw_content and the rest of
+        # extracted_data can be large and are never shown
+        columns = """
+            s.name as source_name, cs.title, cs.industry, cs.company_size, cs.url,
+            cs.publish_date, cs.publish_date_estimated, cs.publish_date_confidence,
+            LEFT(cs.publish_date_reasoning, 100) as publish_date_reasoning,
+            cs.extracted_data IS NOT NULL as has_extracted_data,
+            cs.extracted_data->>'summary' as summary,
+            cs.extracted_data->'technologies_used' as technologies_used,
+            cs.extracted_data->'use_cases' as use_cases,
+            cs.extracted_data->'business_outcomes' as business_outcomes
+        """
+        
         with self.db.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT cs.*, s.name as source_name
+            cursor.execute(f"""
+                SELECT {columns}
                 FROM customer_stories cs
                 JOIN sources s ON cs.source_id = s.id
                 WHERE LOWER(cs.customer_name) LIKE LOWER(%s)
@@ -176,18 +189,17 @@ class QueryInterface:
                     reasoning = story.get('publish_date_reasoning', '')
                     pub_date_str += f" (estimated with {confidence} confidence"
                     if reasoning:
-                        pub_date_str += f": {reasoning[:100]}..."
+                        pub_date_str += f": {reasoning}..."
                     pub_date_str += ")"
                 print(f"Published: {pub_date_str}")
                 print(f"URL: {story['url']}")
                 
-                if story['extracted_data']:
-                    extracted = story['extracted_data']
-                    print(f"Summary: {extracted.get('summary', 'No summary')}")
-                    print(f"Technologies: {', '.join(extracted.get('technologies_used', []))}")
-                    print(f"Use Cases: {', '.join(extracted.get('use_cases', []))}")
+                if story['has_extracted_data']:
+                    print(f"Summary: {story['summary'] or 'No summary'}")
+                    print(f"Technologies: {', '.join(story['technologies_used'] or [])}")
+                    print(f"Use Cases: {', '.join(story['use_cases'] or [])}")
                     
-                    business_outcomes = extracted.get('business_outcomes', [])
+                    business_outcomes = story['business_outcomes'] or []
                     if business_outcomes:
                         print("Business Outcomes:")
                         for outcome in business_outcomes:
@@ -226,7 +238,7 @@ class QueryInterface:
                     SELECT jsonb_array_elements_text(extracted_data->'technologies_used') as technology,
                            COUNT(*) as usage_count
                     FROM customer_stories
-                    WHERE extracted_data->'technologies_used' IS NOT NULL
+                    WHERE extracted_data ? 'technologies_used'
                     GROUP BY technology
                     ORDER BY usage_count DESC
                     LIMIT 15
@@ -249,7 +261,7 @@ class QueryInterface:
                     jsonb_array_elements(extracted_data->'business_outcomes')->>'type' as outcome_type,
                     COUNT(*) as count
                 FROM customer_stories
-                WHERE extracted_data->'business_outcomes' IS NOT NULL
+                WHERE extracted_data ? 'business_outcomes'
                 GROUP BY outcome_type
                 ORDER BY count DESC
             """)
@@ -265,7 +277,7 @@ class QueryInterface:
                     customer_name,
                     jsonb_array_elements(extracted_data->'business_outcomes') as outcome
                 FROM customer_stories
-                WHERE extracted_data->'business_outcomes' IS NOT NULL
+                WHERE extracted_data ? 'business_outcomes'
                 LIMIT 10
             """)
             
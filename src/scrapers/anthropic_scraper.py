@@ -1,5 +1,7 @@
-import re
+import re2
 import logging
+import requests
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
@@ -8,9 +10,45 @@ from src.database.models import generate_content_hash
 
 logger = logging.getLogger(__name__)
 
+# Patterns are RE2 (linear-time, no backtracking), compiled once at import
+
+# Dates on the customer list cards, in the shapes the site has used:
+# "2025-07-23", "Jul 23, 2025" or "July 23, 2025"
+CARD_DATE_RE = re2.compile(r'\b(?:(?P<iso>\d{4}-\d{2}-\d{2})|(?P<month>[A-Z][a-z]{2,8})\s+(?P<rest>\d{1,2},\s+\d{4}))\b')
+
+# Suffixes and prefixes stripped by clean_customer_name, applied in order
+CUSTOMER_NAME_CLEANING_PATTERNS = [re2.compile('(?i)' + pattern) for pattern in (
+    r'\s*-\s*Customer Story.*$',
+    r'\s*-\s*Case Study.*$',
+    r'^How\s+',
+    r'\s+uses?\s+Claude.*$',
+    r'\s+uses?\s+Anthropic.*$',
+    r'\s*\|\s*Anthropic.*$',
+)]
+
+# Customer story links, for pages without post cards
+CUSTOMER_LINK_RE = re2.compile(r'/customers/[^/]+$')
+
+def parse_card_date(date_text: str) -> Optional[str]:
+    """Convert a customer card date to ISO format, or None if it has no date"""
+    match = CARD_DATE_RE.search(date_text)
+    if not match:
+        return None
+    if match.group('iso'):
+        return match.group('iso')
+    
+    month = match.group('month')
+    rest = ' '.join(match.group('rest').split())
+    for month_format in ('%b', '%B'):
+        try:
+            return datetime.strptime(f"{month} {rest}", f"{month_format} %d, %Y").strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
 class AnthropicScraper(BaseScraper):
-    def __init__(self):
-        super().__init__("Anthropic", "https://www.anthropic.com/customers")
+    def __init__(self, session: Optional[requests.Session] = None):
+        super().__init__("Anthropic", "https://www.anthropic.com/customers", session)
         
     def get_customer_story_urls_with_dates(self) -> List[Dict[str, str]]:
         """Get list of customer story URLs with publish dates from Anthropic customers page"""
@@ -23,6 +61,7 @@ class AnthropicScraper(BaseScraper):
         
         soup = self.parse_html(response.text)
         story_data = []
+        seen_urls = set()
         
         # Look for story cards that contain both URLs and dates
         story_cards = soup.find_all('a', class_=lambda x: x and 'post-card' in str(x))
@@ -42,11 +81,8 @@ class AnthropicScraper(BaseScraper):
                 if date_element:
                     date_text = date_element.get_text().strip()
                     # Convert "Jul 23, 2025" format to ISO date
-                    try:
-                        from datetime import datetime
-                        parsed_date = datetime.strptime(date_text, "%b %d, %Y")
-                        publish_date = parsed_date.strftime("%Y-%m-%d")
-                    except ValueError:
+                    publish_date = parse_card_date(date_text)
+                    if not publish_date:
                         logger.warning(f"Could not parse date: {date_text}")
                 
                 story_info = {
@@ -55,16 +91,18 @@ class AnthropicScraper(BaseScraper):
                 }
                 
                 # Avoid duplicates
-                if not any(s['url'] == full_url for s in story_data):
+                if full_url not in seen_urls:
+                    seen_urls.add(full_url)
                     story_data.append(story_info)
         
         # Fallback: Look for any customer links without dates
         if not story_data:
-            customer_links = soup.find_all('a', href=re.compile(r'/customers/[^/]+$'))
+            customer_links = soup.find_all('a', href=CUSTOMER_LINK_RE)
             for link in customer_links:
                 href = link.get('href', '')
                 full_url = urljoin(self.base_url, href)
-                if not any(s['url'] == full_url for s in story_data):
+                if full_url not in seen_urls:
+                    seen_urls.add(full_url)
                     story_data.append({'url': full_url, 'publish_date': None})
         
         logger.info(f"Found {len(story_data)} customer stories with date info")
@@ -213,18 +251,9 @@ class AnthropicScraper(BaseScraper):
             return name
         
         # Remove common suffixes and prefixes
-        cleaning_patterns = [
-            r'\s*-\s*Customer Story.*$',
-            r'\s*-\s*Case Study.*$',
-            r'^How\s+',
-            r'\s+uses?\s+Claude.*$',
-            r'\s+uses?\s+Anthropic.*$',
-            r'\s*\|\s*Anthropic.*$',
-        ]
-        
         cleaned_name = name
-        for pattern in cleaning_patterns:
-            cleaned_name = re.sub(pattern, '', cleaned_name, flags=re.IGNORECASE).strip()
+        for pattern in CUSTOMER_NAME_CLEANING_PATTERNS:
+            cleaned_name = pattern.sub('', cleaned_name).strip()
         
         # Basic capitalization for known company formats
         if cleaned_name.lower() in ['amazon', 'google', 'microsoft', 'apple', 'meta']:
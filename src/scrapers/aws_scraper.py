@@ -1,9 +1,10 @@
 import re
 import logging
+import requests
 from typing import List, Dict, Any, Optional
 from bs4 import BeautifulSoup
 from datetime import datetime
-from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.base_scraper import BaseScraper, build_keyword_automaton, find_keywords
 from src.database.models import generate_content_hash
 
 logger = logging.getLogger(__name__)
@@ -11,8 +12,9 @@ logger = logging.getLogger(__name__)
 class AWScraper(BaseScraper):
     """Scraper for AWS AI/ML customer stories"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         super().__init__(
+            session=session,
             source_name="AWS",
             base_url="https://aws.amazon.com/ai/generative-ai/customers/"
         )
@@ -27,6 +29,7 @@ class AWScraper(BaseScraper):
             'nlp', 'llm', 'large language model', 'claude', 'llama', 'titan',
             'ai services', 'ml services', 'neural networks', 'aws ai'
         }
+        self._ai_automaton = build_keyword_automaton(self.ai_keywords)
         
         # Alternative URLs to try for comprehensive coverage
         self.secondary_urls = [
@@ -441,32 +444,28 @@ class AWScraper(BaseScraper):
     
     def _is_ai_story(self, soup: BeautifulSoup, html_content: str) -> bool:
         """Check if story is AI/ML-related using keyword analysis"""
-        
-        # Get full text content for analysis
-        text_content = soup.get_text().lower()
+        title_tag = soup.find('title')
+        title_text = title_tag.get_text() if title_tag else ""
+        return self._is_ai_story_from_text(soup.get_text(), title_text, html_content)
+    
+    def _is_ai_story_from_text(self, text_content: str, title_text: str = "", html_content: str = "") -> bool:
+        """Check if story is AI/ML-related from its page text, title and (optionally) raw HTML"""
+        text_content = text_content.lower()
         html_lower = html_content.lower()
         
-        # Count AI keyword matches
-        ai_keyword_count = 0
-        matched_keywords = []
-        
-        for keyword in self.ai_keywords:
-            if keyword in text_content or keyword in html_lower:
-                ai_keyword_count += 1
-                matched_keywords.append(keyword)
+        # Count AI keyword matches, one automaton pass over each text
+        matched_keywords = find_keywords(self._ai_automaton, text_content, html_lower)
+        ai_keyword_count = len(matched_keywords)
         
         # Check title for AI indicators
-        title_tag = soup.find('title')
-        title_has_ai = False
-        if title_tag:
-            title_text = title_tag.get_text().lower()
-            title_has_ai = any(keyword in title_text for keyword in [
-                'ai', 'artificial intelligence', 'machine learning', 'ml',
-                'generative', 'bedrock', 'sagemaker', 'amazon q'
-            ])
+        title_text = title_text.lower()
+        title_has_ai = any(keyword in title_text for keyword in [
+            'ai', 'artificial intelligence', 'machine learning', 'ml',
+            'generative', 'bedrock', 'sagemaker', 'amazon q'
+        ])
         
         # Check URL for AI indicators
-        url_has_ai = any(indicator in html_content.lower() for indicator in [
+        url_has_ai = any(indicator in html_lower for indicator in [
             'generative-ai', 'ai/', 'machine-learning', 'ml/'
         ])
         
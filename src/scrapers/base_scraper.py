@@ -1,6 +1,7 @@
 import requests
 import time
 import logging
+import ahocorasick
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from bs4 import BeautifulSoup
@@ -9,14 +10,38 @@ from src.database.models import generate_content_hash
 
 logger = logging.getLogger(__name__)
 
+def build_keyword_automaton(keywords) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton matching lowercase keywords"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), keyword)
+    automaton.make_automaton()
+    return automaton
+
+def find_keywords(automaton: ahocorasick.Automaton, *texts: str) -> set:
+    """Return the automaton's keywords occurring in any of texts, one pass per text"""
+    return {keyword for text in texts for _, keyword in automaton.iter(text)}
+
+def has_keywords(automaton: ahocorasick.Automaton, text: str, threshold: int) -> bool:
+    """Whether at least threshold distinct keywords occur in text, stopping at the threshold-th"""
+    found = set()
+    for _, keyword in automaton.iter(text):
+        found.add(keyword)
+        if len(found) >= threshold:
+            return True
+    return False
+
 class BaseScraper(ABC):
-    def __init__(self, source_name: str, base_url: str):
+    def __init__(self, source_name: str, base_url: str, session: Optional[requests.Session] = None):
         self.source_name = source_name
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        # A caller-provided session is shared as-is, headers included
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            })
+        self.session = session
         
     def make_request(self, url: str, retries: int = None) -> Optional[requests.Response]:
         """Make HTTP request with retry logic and rate limiting"""
@@ -46,8 +71,8 @@ class BaseScraper(ABC):
         return None
     
     def parse_html(self, html_content: str) -> BeautifulSoup:
-        """Parse HTML content with BeautifulSoup"""
-        return BeautifulSoup(html_content, 'html.parser')
+        """Parse HTML content with BeautifulSoup using the C-based lxml parser"""
+        return BeautifulSoup(html_content, 'lxml')
     
     def extract_text_content(self, soup: BeautifulSoup) -> str:
         """Extract clean text content from BeautifulSoup object"""
@@ -55,11 +80,8 @@ class BaseScraper(ABC):
         for script in soup(["script", "style"]):
             script.decompose()
         
-        # Get text and clean it up
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        # Get text with every whitespace run (newlines included) collapsed to one space
+        text = ' '.join(soup.get_text().split())
         
         return text
     
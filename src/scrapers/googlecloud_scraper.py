@@ -2,10 +2,11 @@ import re
 import json
 import os
 import logging
+import requests
 from typing import List, Dict, Any, Optional
 from bs4 import BeautifulSoup
 from datetime import datetime
-from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.base_scraper import BaseScraper, build_keyword_automaton, has_keywords
 from src.database.models import generate_content_hash
 
 logger = logging.getLogger(__name__)
@@ -13,8 +14,9 @@ logger = logging.getLogger(__name__)
 class GoogleCloudScraper(BaseScraper):
     """Scraper for Google Cloud AI/ML customer stories"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         super().__init__(
+            session=session,
             source_name="Google Cloud",
             base_url="https://cloud.google.com/ai/generative-ai/stories"
         )
@@ -30,6 +32,7 @@ class GoogleCloudScraper(BaseScraper):
             'nlp', 'llm', 'large language model', 'tensorflow', 'kubeflow',
             'ai services', 'ml services', 'neural networks', 'google ai'
         }
+        self._ai_automaton = build_keyword_automaton(self.ai_keywords)
         
         # Alternative URLs to try for comprehensive coverage
         self.secondary_urls = [
@@ -580,8 +583,6 @@ class GoogleCloudScraper(BaseScraper):
         """Check if the story is AI/ML related"""
         content_lower = content.lower()
         
-        # Count AI keyword matches
-        ai_matches = sum(1 for keyword in self.ai_keywords if keyword in content_lower)
-        
-        # Require at least 2 AI keyword matches for content filtering
-        return ai_matches >= 2
\ No newline at end of file
+        # Require at least 2 AI keyword matches for content filtering; the
+        # automaton scan stops as soon as the second one is found
+        return has_keywords(self._ai_automaton, content_lower, 2)
\ No newline at end of file
@@ -1,9 +1,10 @@
 import re
 import logging
+import requests
 from typing import List, Dict, Any, Optional
 from bs4 import BeautifulSoup
 from datetime import datetime
-from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.base_scraper import BaseScraper, build_keyword_automaton, find_keywords
 from src.database.models import generate_content_hash
 
 logger = logging.getLogger(__name__)
@@ -11,8 +12,9 @@ logger = logging.getLogger(__name__)
 class MicrosoftScraper(BaseScraper):
     """Scraper for Microsoft Azure AI customer stories"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         super().__init__(
+            session=session,
             source_name="Microsoft",
             base_url="https://www.microsoft.com/en-us/ai/ai-customer-stories"
         )
@@ -26,6 +28,7 @@ class MicrosoftScraper(BaseScraper):
             'ai builder', 'form recognizer', 'text analytics', 'translator',
             'personalizer', 'anomaly detector', 'metrics advisor', 'immersive reader'
         }
+        self._ai_automaton = build_keyword_automaton(self.ai_keywords)
     
     def get_customer_story_urls(self) -> List[str]:
         """Get list of Microsoft AI customer story URLs - Enhanced with pre-collected URLs"""
@@ -314,11 +317,8 @@ class MicrosoftScraper(BaseScraper):
         text_content = soup.get_text().lower()
         html_lower = html_content.lower()
         
-        # Count AI keyword matches
-        ai_keyword_count = 0
-        for keyword in self.ai_keywords:
-            if keyword in text_content or keyword in html_lower:
-                ai_keyword_count += 1
+        # Count AI keyword matches, one automaton pass over each text
+        ai_keyword_count = len(find_keywords(self._ai_automaton, text_content, html_lower))
         
         # Check title for AI indicators
         title_tag = soup.find('title')
@@ -140,8 +140,10 @@ class DeduplicationEngine:
         """Find customers that appear across multiple sources"""
         logger.info("Finding customers across multiple sources")
         
-        # Get all stories grouped by normalized customer names
-        with self.db_ops.db.get_cursor() as cursor:
+        # Group stories by normalized customer names, streaming the rows from a
+        # server-side cursor instead of loading every story's URLs at once
+        customer_groups = {}
+        with self.db_ops.db.get_cursor(name='cross_source_customers') as cursor:
             cursor.execute("""
                 SELECT 
                     customer_name,
@@ -154,23 +156,19 @@ class DeduplicationEngine:
                 ORDER BY customer_name
             """)
             
-            results = cursor.fetchall()
-        
-        # Group by normalized customer names
-        customer_groups = {}
-        for row in results:
-            normalized_name = self.normalize_company_name(row['customer_name'])
-            
-            if normalized_name not in customer_groups:
-                customer_groups[normalized_name] = []
-            
-            customer_groups[normalized_name].append({
-                'original_name': row['customer_name'],
-                'source_id': row['source_id'],
-                'story_count': row['story_count'],
-                'story_ids': row['story_ids'],
-                'urls': row['urls']
-            })
+            for row in cursor:
+                normalized_name = self.normalize_company_name(row['customer_name'])
+                
+                if normalized_name not in customer_groups:
+                    customer_groups[normalized_name] = []
+                
+                customer_groups[normalized_name].append({
+                    'original_name': row['customer_name'],
+                    'source_id': row['source_id'],
+                    'story_count': row['story_count'],
+                    'story_ids': row['story_ids'],
+                    'urls': row['urls']
+                })
         
         # Find groups with multiple sources
         cross_source_customers = []
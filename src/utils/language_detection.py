@@ -36,6 +36,41 @@ class LanguageDetector:
             'Finnish': ['/fi-fi/', '/fi/']
         }
         
+        # One alternation over every URL pattern, so a URL is scanned once
+        # instead of once per pattern; the matched segment maps back to its language
+        self.url_pattern_languages = {
+            pattern: language
+            for language, patterns in self.url_language_patterns.items()
+            for pattern in patterns
+        }
+        self.url_language_re = re.compile(
+            '|'.join(re.escape(pattern) for pattern in self.url_pattern_languages)
+        )
+        
+        # Language names and URL locale codes to the normalized language name
+        self.language_name_mapping = {
+            'Chinese (Simplified)': 'Chinese',
+            'Chinese (Traditional)': 'Chinese',
+            'zh-cn': 'Chinese',
+            'zh-tw': 'Chinese',
+            'ja-jp': 'Japanese', 
+            'ja': 'Japanese',
+            'ko-kr': 'Korean',
+            'ko': 'Korean',
+            'de-de': 'German',
+            'de': 'German',
+            'fr-fr': 'French', 
+            'fr': 'French',
+            'es-es': 'Spanish',
+            'es': 'Spanish',
+            'pt-br': 'Portuguese',
+            'pt': 'Portuguese',
+            'it-it': 'Italian',
+            'it': 'Italian',
+            'nl-nl': 'Dutch',
+            'nl': 'Dutch'
+        }
+        
         # Character-based detection for content analysis
         self.character_ranges = {
             'Chinese': (0x4E00, 0x9FFF),  # CJK Unified Ideographs
@@ -51,12 +86,11 @@ class LanguageDetector:
         if not url:
             return None
         
-        url_lower = url.lower()
-        
-        for language, patterns in self.url_language_patterns.items():
-            if any(pattern in url_lower for pattern in patterns):
-                logger.debug(f"Detected {language} from URL pattern: {url}")
-                return language
+        match = self.url_language_re.search(url.lower())
+        if match:
+            language = self.url_pattern_languages[match.group(0)]
+            logger.debug(f"Detected {language} from URL pattern: {url}")
+            return language
         
         return None
     
@@ -128,30 +162,10 @@ class LanguageDetector:
     
     def normalize_language_name(self, language: str) -> str:
         """Normalize language names for consistency"""
-        language_mapping = {
-            'Chinese (Simplified)': 'Chinese',
-            'Chinese (Traditional)': 'Chinese',
-            'zh-cn': 'Chinese',
-            'zh-tw': 'Chinese',
-            'ja-jp': 'Japanese', 
-            'ja': 'Japanese',
-            'ko-kr': 'Korean',
-            'ko': 'Korean',
-            'de-de': 'German',
-            'de': 'German',
-            'fr-fr': 'French', 
-            'fr': 'French',
-            'es-es': 'Spanish',
-            'es': 'Spanish',
-            'pt-br': 'Portuguese',
-            'pt': 'Portuguese',
-            'it-it': 'Italian',
-            'it': 'Italian',
-            'nl-nl': 'Dutch',
-            'nl': 'Dutch'
-        }
-        
-        return language_mapping.get(language, language)
+        return self.language_name_mapping.get(language, language)
+
+# Shared detector so the pattern tables and URL regex are built once, not per story
+_detector = LanguageDetector()
 
 def detect_story_language(url: str, title: str = "", content: str = "") -> Dict[str, any]:
     """
@@ -165,9 +179,8 @@ def detect_story_language(url: str, title: str = "", content: str = "") -> Dict[
             'normalized': str
         }
     """
-    detector = LanguageDetector()
-    language, method, confidence = detector.detect_language(url, title, content)
-    normalized = detector.normalize_language_name(language)
+    language, method, confidence = _detector.detect_language(url, title, content)
+    normalized = _detector.normalize_language_name(language)
     
     return {
         'language': language,
@@ -140,8 +140,14 @@ class LanguageStatistics:
         print("LANGUAGE DISTRIBUTION SUMMARY")
         print("=" * 70)
         
-        # Overall distribution
-        overall_dist = self.get_language_distribution()
+        # One grouped scan of customer_stories; the overall distribution is
+        # summed from the per-source counts instead of scanning the table again
+        source_stats = self.get_language_stats_by_source()
+        overall_counts = {}
+        for languages in source_stats.values():
+            for language, count in languages.items():
+                overall_counts[language] = overall_counts.get(language, 0) + count
+        overall_dist = dict(sorted(overall_counts.items(), key=lambda item: item[1], reverse=True))
         total_stories = sum(overall_dist.values())
         
         print(f"\nOVERALL DISTRIBUTION ({total_stories:,} total stories):")
@@ -153,7 +159,6 @@ class LanguageStatistics:
         # By source breakdown
         print(f"\nLANGUAGE DISTRIBUTION BY SOURCE:")
         print("-" * 50)
-        source_stats = self.get_language_stats_by_source()
         
         for source, languages in source_stats.items():
             source_total = sum(languages.values())
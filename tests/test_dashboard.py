@@ -26,7 +26,10 @@ sys.modules['plotly.subplots'] = MagicMock()
 import dashboard
 from database.models import CustomerStory, DatabaseOperations
 from src.dashboard.core.data_loader import load_all_stories, get_source_stats, get_aileron_analytics
-from src.dashboard.core.data_processor import create_download_data, calculate_summary_stats
+from src.dashboard.core.data_processor import (
+    create_download_data, calculate_summary_stats, technology_pair_counts, category_counts,
+    extracted_records, extracted_pairs
+)
 
 @pytest.fixture
 def sample_stories_data():
@@ -256,6 +259,72 @@ class TestDataProcessing:
         parsed_json = json.loads(json_string)
         assert isinstance(parsed_json, list)
         assert len(parsed_json) == 2
+    
+    def test_technology_pair_counts_categorical_subset(self, sample_df):
+        """Test technology counts on a categorical frame filtered to one source"""
+        categorical_df = sample_df.astype({'source_name': 'category', 'industry': 'category'})
+        anthropic_df = categorical_df[categorical_df['source_name'] == 'Anthropic']
+        
+        pair_counts = technology_pair_counts(anthropic_df)
+        
+        # Filtered-out sources must not reappear as zero-count groups
+        assert set(pair_counts.index.get_level_values('Source')) == {'Anthropic'}
+        assert (pair_counts > 0).all()
+        assert pair_counts[('Anthropic', 'Claude')] == 1
+        
+        # The Analytics page builds its per-source table this way
+        source_tech_counts = {source: {} for source in anthropic_df['source_name'].unique()}
+        for (source, tech), count in pair_counts.items():
+            source_tech_counts[source][tech] = count
+        assert source_tech_counts == {'Anthropic': {'Claude': 1, 'API': 1}}
+    
+    def test_category_counts_skips_unused_categories(self, sample_df):
+        """Test category counts on a categorical frame filtered to one industry"""
+        categorical_df = sample_df.astype({'industry': 'category'})
+        healthcare_df = categorical_df[categorical_df['industry'] == 'healthcare']
+        
+        counts = category_counts(healthcare_df['industry'])
+        
+        assert counts.to_dict() == {'healthcare': 1}
+    
+    def test_extracted_records_tags_dict_items(self):
+        """Test that only dict items are kept, each tagged with its story's columns"""
+        df = pd.DataFrame({
+            'customer_name': ['Acme', 'Globex', 'Initech'],
+            'source_name': ['Anthropic', 'OpenAI', 'AWS'],
+            'extracted_data': [
+                {'outcomes': [{'type': 'cost', 'customer': 'stale'}, 'junk']},
+                None,
+                {'outcomes': [{'type': 'time'}]}
+            ]
+        }, index=[10, 5, 7])
+        
+        records = extracted_records(df, 'outcomes', {'customer_name': 'customer', 'source_name': 'source'})
+        
+        assert records == [
+            {'type': 'cost', 'customer': 'Acme', 'source': 'Anthropic'},
+            {'type': 'time', 'customer': 'Initech', 'source': 'AWS'}
+        ]
+    
+    def test_extracted_pairs_combines_values_per_story(self):
+        """Test per-story combinations of list and scalar fields, skipping empty values"""
+        df = pd.DataFrame({
+            'extracted_data': [
+                {'powers': ['create', 'code', ''], 'impacts': 'revenue'},
+                {'powers': 'automate', 'impacts': ['cost', None, 'risk']},
+                {'powers': [], 'impacts': ['cost']},
+                None
+            ]
+        })
+        
+        pairs = extracted_pairs(df, 'powers', 'impacts')
+        
+        assert list(pairs.itertuples(name=None)) == [
+            (0, 'create', 'revenue'),
+            (0, 'code', 'revenue'),
+            (1, 'automate', 'cost'),
+            (1, 'automate', 'risk')
+        ]
 
 class TestVisualizationData:
     """Test data preparation for visualizations"""
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Anthropic Scraper Test Suite
+Covers parsing of the dates shown on Anthropic customer cards
+"""
+
+import pytest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.scrapers.anthropic_scraper import parse_card_date
+
+
+class TestParseCardDate:
+    """parse_card_date converts card dates to YYYY-MM-DD"""
+
+    @pytest.mark.parametrize("date_text, expected", [
+        # ISO dates are returned as-is
+        ("2025-07-23", "2025-07-23"),
+        ("Published 2024-01-05", "2024-01-05"),
+        # Abbreviated month names
+        ("Jul 23, 2025", "2025-07-23"),
+        ("Jan 5, 2024", "2024-01-05"),
+        # Full month names
+        ("July 23, 2025", "2025-07-23"),
+        ("September 9, 2023", "2023-09-09"),
+        # Surrounding text and extra whitespace
+        ("Case study · Mar 14,   2024", "2024-03-14"),
+    ])
+    def test_accepted_formats(self, date_text, expected):
+        assert parse_card_date(date_text) == expected
+
+    @pytest.mark.parametrize("date_text", [
+        "",
+        "Customer story",
+        "23/07/2025",
+        "Foo 23, 2025",
+        "Jul 2025",
+        "Feb 30, 2024",
+    ])
+    def test_unparseable_returns_none(self, date_text):
+        assert parse_card_date(date_text) is None
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Language Detection Test Suite
+Covers URL-based language detection in utils.language_detection
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from utils.language_detection import LanguageDetector
+
+
+@pytest.fixture
+def detector():
+    return LanguageDetector()
+
+
+class TestDetectLanguageFromUrl:
+    """detect_language_from_url matches locale path segments"""
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://www.microsoft.com/ja-jp/customers/story/1", "Japanese"),
+        ("https://example.com/ko/customers/acme", "Korean"),
+        ("https://example.com/zh-hant/stories/acme", "Chinese (Traditional)"),
+        ("https://example.com/pt-br/casos/acme", "Portuguese"),
+    ])
+    def test_single_locale_segment(self, detector, url, expected):
+        assert detector.detect_language_from_url(url) == expected
+
+    def test_match_is_case_insensitive(self, detector):
+        assert detector.detect_language_from_url("https://example.com/DE-DE/Story") == "German"
+
+    @pytest.mark.parametrize("url, expected", [
+        # The leftmost locale segment wins, whatever the pattern order
+        ("https://example.com/fr/de-de/story", "French"),
+        ("https://example.com/de-de/fr/story", "German"),
+        ("https://example.com/fi-fi/zh-cn/story", "Finnish"),
+        ("https://example.com/es/ja-jp/es/story", "Spanish"),
+    ])
+    def test_multiple_locale_segments(self, detector, url, expected):
+        assert detector.detect_language_from_url(url) == expected
+
+    @pytest.mark.parametrize("url", [
+        "https://example.com/customers/acme",
+        "https://example.com/en-us/customers/acme",
+        # Locale codes only count as whole path segments
+        "https://example.com/japan/story",
+        "https://example.com/stories/jade",
+        "https://example.com/de",
+        "https://example.com/story?lang=fr",
+    ])
+    def test_non_matching_urls(self, detector, url):
+        assert detector.detect_language_from_url(url) is None
+
+    @pytest.mark.parametrize("url", ["", None])
+    def test_empty_url(self, detector, url):
+        assert detector.detect_language_from_url(url) is None